@@ -3,6 +3,7 @@
 
 from .routes import delete_unwanted_ctfd_routes, api_blueprint
 from .routes.views import plugin_views
+from .middleware import init_request_metrics
 from .utils.logger import get_logger
 from CTFd.models import db
 from typing import Tuple, Any
@@ -10,17 +11,19 @@ from typing import Tuple, Any
 logger = get_logger(__name__)
 
 
-def _create_tables() -> Tuple[Any, Any, Any, Any]:
+def _create_tables() -> Tuple[Any, Any, Any, Any, Any]:
     from .event.models.Event import Event
     from .team.models.Team import Team
     from .user.models.User import User
     from .team.models.TeamMember import TeamMember
+    from .admin.models.AdminJob import AdminJob
 
     return (
         Event,
         Team,
         User,
         TeamMember,
+        AdminJob,
     )
 
 
@@ -35,6 +38,7 @@ def load(app: Any) -> None:
 
         app.register_blueprint(plugin_views)
         app.register_blueprint(api_blueprint, url_prefix="/plugin/api")
+        init_request_metrics(app)
         logger.info(
             "Plugin loaded successfully",
             extra={
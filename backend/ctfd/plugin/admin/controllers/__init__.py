@@ -4,17 +4,37 @@ Admin controller functions for system management and data operations.
 """
 
 from .cleanup_orphaned_data import cleanup_orphaned_data
+from .check_liveness import check_liveness
 from .cleanup_headless_teams import cleanup_headless_teams
 from .get_data_counts import get_data_counts
+from .get_admin_job import get_admin_job, list_admin_jobs
 from .get_detailed_stats import get_detailed_stats
+from .get_health_snapshot import get_health_snapshot
+from .get_metrics import get_metrics
+from .get_read_cache_stats import get_read_cache_stats
+from .import_roster import import_roster
 from .reset_all_plugin_data import reset_all_plugin_data
 from .reset_event_data import reset_event_data
+from .reconcile_counters import reconcile_counters
+from .run_health_probes import run_health_probes
+from .schedule_admin_job import run_admin_job, schedule_admin_job
 
 __all__ = [
+    "check_liveness",
     "cleanup_orphaned_data",
     "cleanup_headless_teams",
+    "get_admin_job",
     "get_data_counts",
     "get_detailed_stats",
+    "get_health_snapshot",
+    "get_metrics",
+    "get_read_cache_stats",
+    "import_roster",
+    "list_admin_jobs",
     "reset_all_plugin_data",
     "reset_event_data",
+    "reconcile_counters",
+    "run_admin_job",
+    "run_health_probes",
+    "schedule_admin_job",
 ]
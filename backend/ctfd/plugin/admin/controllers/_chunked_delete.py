@@ -0,0 +1,123 @@
+"""
+/backend/ctfd/plugin/admin/controllers/_chunked_delete.py
+Deletes large row sets in short primary-key batches, recording progress so interrupted runs can resume.
+"""
+
+import time
+from typing import Any, Optional
+
+from CTFd.cache import cache
+from CTFd.models import db
+
+from ... import config
+from ...utils.logger import get_logger
+from ._job_runner import _report_job_progress
+
+logger = get_logger(__name__)
+
+
+# Internal use only (_ prefix); key under which a run's progress is stored.
+def _progress_key(operation: str) -> str:
+    return f"{config.CACHE_KEY_PREFIX}:delete_progress:{operation}"
+
+
+# Internal use only (_ prefix); deletes rows step by step in primary-key chunks.
+def _delete_in_chunks(
+    operation: str,
+    steps: list[tuple[str, Any, list[Any]]],
+    chunk_size: Optional[int] = None,
+) -> dict[str, Any]:
+    """Run each (name, model, criteria) step as a series of small DELETE transactions.
+
+    Each chunk selects up to chunk_size primary keys matching the criteria and deletes
+    those rows (criteria re-applied) in its own transaction. Row locks are held only
+    for one chunk, and the engine sleeps config.ADMIN_DELETE_CHUNK_PAUSE between chunks
+    so concurrent writers, such as joins in other events, are not stalled. Steps run in
+    order, so list children before parents.
+
+    Progress is committed to the shared cache (and to the admin job running the
+    delete, if any) after every chunk. If a run is interrupted (worker timeout,
+    restart), calling again with the same operation resumes the step it reached
+    after its last deleted key and reports cumulative counts. Steps an earlier run
+    finished are scanned again from the start, since rows matching them may have
+    been inserted in the meantime (e.g. memberships of a team the next step deletes);
+    a step with nothing left costs one empty SELECT. Finished runs clear their progress.
+
+    Args:
+        operation (str): Stable name for the run, e.g. "reset_event:3".
+        steps (list): (name, model, criteria) tuples; criteria are SQLAlchemy filter expressions.
+        chunk_size (int, optional): Rows per transaction. Defaults to config.ADMIN_DELETE_CHUNK_SIZE.
+
+    Returns:
+        dict: Per-step deleted counts, per-step rows deleted by each chunk of this run, and throughput stats.
+    """
+    chunk_size = chunk_size or config.ADMIN_DELETE_CHUNK_SIZE
+    key = _progress_key(operation)
+    progress = cache.get(key)
+    resumed = progress is not None
+    if not resumed:
+        progress = {"deleted": {}, "last_ids": {}, "chunks": 0}
+
+    if resumed:
+        logger.info(
+            "Resuming interrupted chunked delete",
+            extra={"context": {"operation": operation, "deleted": progress["deleted"]}},
+        )
+
+    started = time.monotonic()
+    deleted_this_run = 0
+    batches: dict[str, list[int]] = {}
+
+    for name, model, criteria in steps:
+        progress["deleted"].setdefault(name, 0)
+        batches[name] = []
+
+        while True:
+            # Keyset on the primary key: rows skipped by an earlier chunk are never rescanned
+            last_id = progress["last_ids"].get(name, 0)
+            ids = [
+                row_id
+                for (row_id,) in db.session.query(model.id)
+                .filter(model.id > last_id, *criteria)
+                .order_by(model.id)
+                .limit(chunk_size)
+            ]
+            if not ids:
+                break
+
+            deleted = model.query.filter(model.id.in_(ids), *criteria).delete(synchronize_session=False)
+            db.session.commit()
+
+            progress["deleted"][name] += deleted
+            progress["last_ids"][name] = ids[-1]
+            progress["chunks"] += 1
+            batches[name].append(deleted)
+            deleted_this_run += deleted
+            cache.set(key, progress, timeout=config.ADMIN_DELETE_PROGRESS_TIMEOUT)
+            _report_job_progress({"step": name, "deleted": progress["deleted"], "chunks": progress["chunks"]})
+
+            if len(ids) < chunk_size:
+                break
+            time.sleep(config.ADMIN_DELETE_CHUNK_PAUSE)
+
+        # A finished step is rescanned from the start if a later step is interrupted
+        progress["last_ids"].pop(name, None)
+        cache.set(key, progress, timeout=config.ADMIN_DELETE_PROGRESS_TIMEOUT)
+
+    cache.delete(key)
+
+    elapsed = time.monotonic() - started
+    stats = {
+        "chunks": progress["chunks"],
+        "chunk_size": chunk_size,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(deleted_this_run / elapsed, 1) if elapsed > 0 else None,
+        "resumed": resumed,
+    }
+
+    logger.info(
+        "Chunked delete completed",
+        extra={"context": {"operation": operation, "deleted": progress["deleted"], **stats}},
+    )
+
+    return {"deleted": progress["deleted"], "batches": batches, "stats": stats}
@@ -0,0 +1,28 @@
+"""
+/backend/ctfd/plugin/admin/controllers/_empty_teams.py
+Finds teams without members with an indexed anti-join instead of filtering on the stored counter.
+"""
+
+from typing import Any
+
+from CTFd.models import db
+from sqlalchemy.orm import Query
+
+from ...team.models.Team import Team
+from ...team.models.TeamMember import TeamMember
+
+
+# Internal use only (_ prefix); query over teams with no member rows.
+def _empty_teams_query(*columns: Any) -> Query:
+    """Select columns from teams that have no team member rows.
+
+    LEFT JOIN ... IS NULL probes the team_id index once per team and stops at the
+    first member found, and it reflects the membership rows themselves rather than
+    the member_count counter, which has no index and can drift.
+    """
+    return (
+        db.session.query(*columns)
+        .select_from(Team)
+        .outerjoin(TeamMember, TeamMember.team_id == Team.id)
+        .filter(TeamMember.id.is_(None))
+    )
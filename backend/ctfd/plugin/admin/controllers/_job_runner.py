@@ -0,0 +1,150 @@
+"""
+/backend/ctfd/plugin/admin/controllers/_job_runner.py
+Runs scheduled admin jobs on a per-process thread pool and records their progress.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable
+
+from CTFd.models import db
+from flask import current_app
+
+from ... import config
+from ...utils.logger import get_logger
+from ..models.AdminJob import AdminJob
+from ..models.enums import JobStatus
+
+logger = get_logger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+_current_job = threading.local()
+
+
+# Internal use only (_ prefix); maps job kinds to the controllers that run them with the job's params.
+def _job_handlers() -> dict[str, Callable[..., dict[str, Any]]]:
+    # Imported lazily: these controllers report progress through this module
+    from .cleanup_headless_teams import cleanup_headless_teams
+    from .cleanup_orphaned_data import cleanup_orphaned_data
+    from .reset_all_plugin_data import reset_all_plugin_data
+    from .reset_event_data import reset_event_data
+
+    return {
+        "reset_all": lambda job: reset_all_plugin_data(),
+        "reset_event": lambda job: reset_event_data(job.event_id),
+        "cleanup_orphaned_data": lambda job: cleanup_orphaned_data(
+            min_account_age_days=(job.params or {}).get("min_account_age_days")
+        ),
+        "cleanup_headless_teams": lambda job: cleanup_headless_teams(),
+    }
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Created on first use so each gunicorn worker gets its own pool after forking
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=config.ADMIN_JOB_WORKERS, thread_name_prefix="ng-admin-job")
+        return _executor
+
+
+# Internal use only (_ prefix); queues a committed job on this process's pool.
+def _submit_job(job_id: int) -> None:
+    _get_executor().submit(_run_job, current_app._get_current_object(), job_id)
+
+
+def _run_job(app, job_id: int) -> None:
+    """Run one job inside its own app context (and therefore its own DB session).
+
+    The job is claimed with a conditional UPDATE first. A job that is no longer queued
+    with its lock held (its lock was reclaimed while it waited for a thread) is skipped,
+    so no job ever runs without its lock.
+    """
+    with app.app_context():
+        try:
+            if not _claim_job(job_id):
+                logger.warning("Admin job skipped - no longer queued", extra={"context": {"job_id": job_id}})
+                return
+            _execute_job(app, job_id)
+        finally:
+            db.session.remove()
+
+
+# Internal use only (_ prefix); runs a running job on the calling thread and records its outcome.
+def _execute_job(app, job_id: int) -> dict[str, Any]:
+    """Run a job's controller with heartbeats and progress reporting, then finish the job.
+
+    Returns:
+        dict: The controller result as stored on the job, or error info if it raised.
+    """
+    _current_job.id = job_id
+    stop_heartbeat = threading.Event()
+    threading.Thread(
+        target=_send_heartbeats, args=(app, job_id, stop_heartbeat), name="ng-admin-job-heartbeat", daemon=True
+    ).start()
+    try:
+        job = AdminJob.query.get(job_id)
+        result = _job_handlers()[job.kind](job)
+        # Controller results may hold datetimes or enums; store plain JSON
+        result = json.loads(json.dumps(result, default=str))
+        if result.get("success"):
+            job.finish(JobStatus.SUCCEEDED, result=result)
+        else:
+            job.finish(JobStatus.FAILED, result=result, error=result.get("error"))
+        return result
+    except Exception as e:
+        # Broad catch so a failing job is always recorded and its lock released
+        db.session.rollback()
+        logger.error(
+            "Admin job failed",
+            extra={"context": {"job_id": job_id, "error": str(e)}},
+            exc_info=True,
+        )
+        AdminJob.query.get(job_id).finish(JobStatus.FAILED, error=str(e))
+        return {"success": False, "error": str(e)}
+    finally:
+        stop_heartbeat.set()
+        _current_job.id = None
+
+
+def _claim_job(job_id: int) -> bool:
+    """Atomically move a queued job that still holds its lock to running."""
+    now = datetime.utcnow()
+    claimed = AdminJob.query.filter(
+        AdminJob.id == job_id, AdminJob.status == JobStatus.QUEUED, AdminJob.lock_key.isnot(None)
+    ).update({"status": JobStatus.RUNNING, "started_at": now, "updated_at": now}, synchronize_session=False)
+    db.session.commit()
+    return claimed == 1
+
+
+def _send_heartbeats(app, job_id: int, stop: threading.Event) -> None:
+    """Refresh a running job's heartbeat until it finishes, so steps that report no progress never look stale."""
+    while not stop.wait(config.ADMIN_JOB_HEARTBEAT_INTERVAL):
+        with app.app_context():
+            try:
+                AdminJob.query.filter_by(id=job_id, status=JobStatus.RUNNING).update(
+                    {"updated_at": datetime.utcnow()}, synchronize_session=False
+                )
+                db.session.commit()
+            except Exception as e:
+                # Broad catch so a failed heartbeat never kills the thread; the next one retries
+                db.session.rollback()
+                logger.warning("Admin job heartbeat failed", extra={"context": {"job_id": job_id, "error": str(e)}})
+            finally:
+                db.session.remove()
+
+
+# Internal use only (_ prefix); no-op unless called from inside a running job.
+def _report_job_progress(progress: dict[str, Any]) -> None:
+    """Persist a progress snapshot (and heartbeat) for the job running on this thread."""
+    job_id = getattr(_current_job, "id", None)
+    if job_id is None:
+        return
+    AdminJob.query.filter_by(id=job_id).update(
+        {"progress": progress, "updated_at": datetime.utcnow()},
+        synchronize_session=False,
+    )
+    db.session.commit()
@@ -0,0 +1,43 @@
+"""
+/backend/ctfd/plugin/admin/controllers/check_liveness.py
+Contains the business logic for a liveness check that inspects the connection pool without querying the database.
+"""
+
+from typing import Any
+
+from CTFd.models import db
+
+
+def check_liveness() -> dict[str, Any]:
+    """Checks that this worker can still hand out database connections.
+
+    Only the engine's pool bookkeeping is read; no connection is checked out and no
+    query runs. The worker is reported unavailable when every pooled and overflow
+    connection is checked out, since new requests would block waiting for one. Pools
+    without a fixed size (e.g. SQLite's) are always reported alive.
+
+    Returns:
+        dict: Success status, "ok" or "saturated", and the pool's usage.
+    """
+    pool = db.engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"success": True, "status": "ok", "pool": {"type": type(pool).__name__}}
+
+    size = pool.size()
+    checked_out = pool.checkedout()
+    # A negative max overflow means the pool may grow without limit
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    capacity = size + max_overflow if max_overflow >= 0 else None
+
+    pool_status = {
+        "type": type(pool).__name__,
+        "size": size,
+        "checked_out": checked_out,
+        # QueuePool.overflow() counts from -size, so clamp to the overflow connections in use
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+    }
+    if capacity is not None and checked_out >= capacity:
+        return {"success": False, "status": "saturated", "error": "Connection pool exhausted", "pool": pool_status}
+
+    return {"success": True, "status": "ok", "pool": pool_status}
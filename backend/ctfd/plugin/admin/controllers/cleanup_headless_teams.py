@@ -3,52 +3,103 @@
 Contains the business logic for an admin tool that finds and fixes teams without a captain.
 """
 
+from typing import Any
+
 from CTFd.models import db
+from sqlalchemy import and_, exists, func, select
+
+from ... import config
 from ...team.models.Team import Team
 from ...team.models.TeamMember import TeamMember
 from ...team.models.enums import TeamRole
 from ...utils.logger import get_logger
+from ...utils.cache import bump_version
+from ...utils.query_budget import query_budget
 
 logger = get_logger(__name__)
 
 
-def cleanup_headless_teams():
-    """Finds and fixes teams without a captain due to user deletion."""
+@query_budget(2)
+def cleanup_headless_teams(dry_run: bool = False) -> dict[str, Any]:
+    """Finds and fixes teams without a captain due to user deletion.
 
-    teams_with_members = (
-        db.session.query(Team.id).join(TeamMember).group_by(Team.id).having(db.func.count(TeamMember.id) > 0).subquery()
-    )
-    teams_without_captain = (
-        db.session.query(Team.id)
-        .outerjoin(
-            TeamMember,
-            db.and_(Team.id == TeamMember.team_id, TeamMember.role == TeamRole.CAPTAIN),
-        )
-        .group_by(Team.id)
-        .having(db.func.count(TeamMember.id) == 0)
-        .subquery()
-    )
+    The oldest member of every captainless team is picked with ROW_NUMBER() over
+    (team_id ORDER BY joined_at, id), with the captain check served by
+    ix_ng_team_members_team_role, and promoted by a single UPDATE. Fixing any number
+    of teams costs one SELECT (for the report) plus one UPDATE.
+
+    Args:
+        dry_run (bool, optional): Only list the teams that would be fixed. Defaults to False.
 
-    headless_team_ids = (
-        db.session.query(teams_with_members.c.id)
-        .join(teams_without_captain, teams_with_members.c.id == teams_without_captain.c.id)
+    Returns:
+        dict: Success status, number of headless teams and a sample of them with the member to promote.
+    """
+    oldest_members = _oldest_member_of_headless_teams()
+
+    sample_limit = config.HEADLESS_TEAM_SAMPLE_LIMIT
+    rows = (
+        db.session.query(
+            oldest_members.c.team_id,
+            Team.name,
+            oldest_members.c.user_id,
+            func.count().over().label("total"),
+        )
+        .join(Team, Team.id == oldest_members.c.team_id)
+        .order_by(oldest_members.c.team_id)
+        .limit(sample_limit)
         .all()
     )
+    headless_count = rows[0].total if rows else 0
 
     fixed_count = 0
-    for (team_id,) in headless_team_ids:
-        members = TeamMember.query.filter_by(team_id=team_id).order_by(TeamMember.joined_at.asc()).all()
-        if members:
-            # Promote the oldest member
-            new_captain = members[0]
-            new_captain.update_role(TeamRole.CAPTAIN)
-            fixed_count += 1
-            logger.warning(f"Fixed headless team {team_id} by promoting user {new_captain.user_id} to captain.")
-
-    if fixed_count > 0:
+    if not dry_run and headless_count:
+        # Re-derives the candidates inside the UPDATE (via a derived table, which MariaDB
+        # allows against the updated table) so teams fixed concurrently are not touched
+        promote = (
+            TeamMember.__table__.update()
+            .where(TeamMember.id.in_(select(_oldest_member_of_headless_teams().c.id)))
+            .values(role=TeamRole.CAPTAIN)
+        )
+        fixed_count = db.session.execute(promote).rowcount
         db.session.commit()
+        bump_version("plugin")
+
+        logger.warning(
+            "Fixed headless teams by promoting their oldest members",
+            extra={"context": {"fixed_teams": fixed_count, "sample_team_ids": [row.team_id for row in rows]}},
+        )
 
     return {
         "success": True,
-        "message": f"Cleanup complete. Fixed {fixed_count} headless teams.",
+        "message": (
+            f"Dry run. {headless_count} headless teams would be fixed."
+            if dry_run
+            else f"Cleanup complete. Fixed {fixed_count} headless teams."
+        ),
+        "dry_run": dry_run,
+        "headless_teams": headless_count,
+        "fixed_teams": fixed_count,
+        "teams": [{"team_id": row.team_id, "team_name": row.name, "promoted_user_id": row.user_id} for row in rows],
     }
+
+
+def _oldest_member_of_headless_teams():
+    """Subquery of (id, team_id, user_id) for the oldest member of each team with no captain."""
+    captain = TeamMember.__table__.alias("captain")
+    ranked_members = (
+        select(
+            TeamMember.id,
+            TeamMember.team_id,
+            TeamMember.user_id,
+            func.row_number()
+            .over(partition_by=TeamMember.team_id, order_by=(TeamMember.joined_at, TeamMember.id))
+            .label("seniority"),
+        )
+        .where(~exists().where(and_(captain.c.team_id == TeamMember.team_id, captain.c.role == TeamRole.CAPTAIN)))
+        .subquery("ranked_members")
+    )
+    return (
+        select(ranked_members.c.id, ranked_members.c.team_id, ranked_members.c.user_id)
+        .where(ranked_members.c.seniority == 1)
+        .subquery("oldest_members")
+    )
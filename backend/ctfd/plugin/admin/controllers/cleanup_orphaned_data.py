@@ -3,39 +3,64 @@
 Contains the business logic for an admin tool that removes user records with no team associations.
 """
 
-from typing import Any
+from datetime import datetime, timedelta
+from typing import Any, Optional
 
-from CTFd.models import db
+from CTFd.models import Users, db
+from sqlalchemy import exists, func
 
 from ...utils.logger import get_logger
 from ...team.models.TeamMember import TeamMember
 from ...user.models.User import User
+from ._chunked_delete import _delete_in_chunks
 
 logger = get_logger(__name__)
 
 
-def cleanup_orphaned_data() -> dict[str, Any]:
-    """Removes user records that have no team members."""
+def cleanup_orphaned_data(min_account_age_days: Optional[int] = None, dry_run: bool = False) -> dict[str, Any]:
+    """Removes user records that have no team members.
 
-    orphaned_users_query = User.query.outerjoin(TeamMember, User.id == TeamMember.user_id).filter(
-        TeamMember.id.is_(None)
+    Orphans are matched with NOT EXISTS and deleted in short keyset chunks, so the
+    orphan set is never loaded; the condition is re-checked by each chunk's DELETE,
+    so a user who joins a team meanwhile is kept.
+
+    Args:
+        min_account_age_days (int, optional): Only remove orphans whose CTFd account is at
+            least this many days old, sparing users who registered but have not joined yet.
+        dry_run (bool, optional): Only count the orphans that would be removed. Defaults to False.
+
+    Returns:
+        dict: Success status, removed (or matching) count and per-batch deletion report.
+    """
+    logger.info(
+        "Starting orphaned data cleanup",
+        extra={"context": {"min_account_age_days": min_account_age_days, "dry_run": dry_run}},
     )
 
-    orphaned_users = orphaned_users_query.all()
-    orphaned_count = len(orphaned_users)
+    criteria = [~exists().where(TeamMember.user_id == User.id)]
+    if min_account_age_days:
+        cutoff = datetime.utcnow() - timedelta(days=min_account_age_days)
+        criteria.append(exists().where(Users.id == User.id, Users.created < cutoff))
 
-    if orphaned_count > 0:
-        logger.info(
-            "Starting orphaned data cleanup",
-            extra={"context": {"orphaned_users_count": orphaned_count}},
-        )
+    if dry_run:
+        orphaned_count = db.session.query(func.count(User.id)).filter(*criteria).scalar()
+        return {
+            "success": True,
+            "message": f"{orphaned_count} orphaned users would be removed",
+            "dry_run": True,
+            "min_account_age_days": min_account_age_days,
+            "cleaned_up": {"orphaned_users": orphaned_count},
+        }
 
-        orphaned_users_query.delete(synchronize_session=False)
-        db.session.commit()
+    # Age-filtered and unfiltered runs resume separately
+    operation = f"cleanup_orphaned_users:{min_account_age_days or 'all'}"
+    result = _delete_in_chunks(operation, [("orphaned_users", User, criteria)])
+    orphaned_count = result["deleted"]["orphaned_users"]
 
+    if orphaned_count > 0:
         logger.info(
             "Orphaned data cleanup completed successfully",
-            extra={"context": {"cleaned_up_users": orphaned_count}},
+            extra={"context": {"cleaned_up_users": orphaned_count, **result["stats"]}},
         )
     else:
         logger.info("No orphaned data found to cleanup")
@@ -43,5 +68,9 @@ def cleanup_orphaned_data() -> dict[str, Any]:
     return {
         "success": True,
         "message": "Cleanup completed successfully",
+        "dry_run": False,
+        "min_account_age_days": min_account_age_days,
         "cleaned_up": {"orphaned_users": orphaned_count},
+        "batches": result["batches"]["orphaned_users"],
+        "stats": result["stats"],
     }
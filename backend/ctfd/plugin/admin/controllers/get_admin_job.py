@@ -0,0 +1,56 @@
+"""
+/backend/ctfd/plugin/admin/controllers/get_admin_job.py
+Contains the business logic to retrieve background admin jobs and their progress.
+"""
+
+from typing import Any
+
+from ... import config
+from ..models.AdminJob import AdminJob
+
+
+def get_admin_job(job_id: int) -> dict[str, Any]:
+    """Gets a background admin job's status, progress and result.
+
+    Args:
+        job_id (int): The job ID.
+
+    Returns:
+        dict: Success status and job info or error info.
+    """
+    job = AdminJob.query.get(job_id)
+    if not job:
+        return {"success": False, "error": f"Job with ID {job_id} does not exist"}
+    return {"success": True, "job": _job_to_dict(job)}
+
+
+def list_admin_jobs(limit: int = config.ADMIN_JOB_LIST_LIMIT) -> dict[str, Any]:
+    """Lists the most recent background admin jobs, newest first.
+
+    Args:
+        limit (int, optional): Max jobs returned.
+
+    Returns:
+        dict: Success status and list of jobs.
+    """
+    jobs = AdminJob.query.order_by(AdminJob.id.desc()).limit(limit).all()
+    return {"success": True, "jobs": [_job_to_dict(job) for job in jobs]}
+
+
+# Internal use only (_ prefix); API representation of a job.
+def _job_to_dict(job: AdminJob) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "event_id": job.event_id,
+        "params": job.params,
+        "status": job.status.value,
+        "progress": job.progress,
+        "result": job.result,
+        "error": job.error,
+        "created_by": job.created_by,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "updated_at": job.updated_at,
+    }
@@ -5,22 +5,69 @@ Contains the business logic to efficiently query and retrieve basic data counts
 
 from typing import Any
 
+from CTFd.models import db
+from sqlalchemy import bindparam, func, select, text
+
 from ...event.models.Event import Event
 from ...team.models.Team import Team
 from ...team.models.TeamMember import TeamMember
 from ...user.models.User import User
+from ...utils.query_budget import query_budget
+
+# Result key -> counted model
+COUNTED_MODELS = {"events": Event, "teams": Team, "users": User, "team_members": TeamMember}
+
+_INNODB_TABLE_ROWS_SQL = (
+    "SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :names"
+)
 
+# Row estimates kept by the database's statistics, per dialect; other dialects count exactly
+_TABLE_STATISTICS_SQL = {
+    "mysql": _INNODB_TABLE_ROWS_SQL,
+    "mariadb": _INNODB_TABLE_ROWS_SQL,
+    "postgresql": "SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r' AND relname IN :names",
+}
 
-def get_data_counts() -> dict[str, Any]:
+
+@query_budget(1)
+def get_data_counts(approximate: bool = False) -> dict[str, Any]:
     """Gets count stats for all plugin data.
 
+    Exact counts are fetched in one statement of scalar COUNT(*) subqueries. In
+    approximate mode the row estimates kept in the database's table statistics are
+    read instead, which costs nothing on huge tables but can lag recent writes; tables
+    without an estimate (or databases without statistics, like SQLite) are counted exactly.
+
+    Args:
+        approximate (bool, optional): Read table statistics instead of counting. Defaults to False.
+
     Returns:
         dict: Counts of events, teams, users, and team members.
     """
+    counts = _estimated_counts() if approximate else {}
+    missing = {name: model for name, model in COUNTED_MODELS.items() if name not in counts}
+    if missing:
+        counts.update(_exact_counts(missing))
+
+    return {name: counts[name] for name in COUNTED_MODELS}
+
+
+# Internal use only (_ prefix); all counts in a single round trip.
+def _exact_counts(models: dict[str, Any]) -> dict[str, int]:
+    columns = [select(func.count()).select_from(model).scalar_subquery().label(name) for name, model in models.items()]
+    return dict(db.session.execute(select(*columns)).one()._mapping)
+
+
+# Internal use only (_ prefix); row estimates from table statistics, keyed like COUNTED_MODELS.
+def _estimated_counts() -> dict[str, int]:
+    sql = _TABLE_STATISTICS_SQL.get(db.engine.dialect.name)
+    if sql is None:
+        return {}
+
+    names_by_table = {model.__tablename__: name for name, model in COUNTED_MODELS.items()}
+    statement = text(sql).bindparams(bindparam("names", expanding=True))
+    rows = db.session.execute(statement, {"names": list(names_by_table)})
 
-    return {
-        "events": Event.query.count(),
-        "teams": Team.query.count(),
-        "users": User.query.count(),
-        "team_members": TeamMember.query.count(),
-    }
+    # PostgreSQL reports -1 (and InnoDB may report NULL) for tables never analyzed
+    return {names_by_table[table]: int(estimate) for table, estimate in rows if estimate is not None and estimate >= 0}
@@ -3,41 +3,86 @@
 Contains the business logic to query and assemble a comprehensive statistics report for the system.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from CTFd.models import db
 from sqlalchemy import func
 
+from ... import config
 from ...event.models.Event import Event
 from ...team.models.Team import Team
 from ...team.models.TeamMember import TeamMember
+from ...utils.pagination import decode_cursor, encode_cursor
 from .get_data_counts import get_data_counts
+from ._empty_teams import _empty_teams_query
 from ...utils.data_conversion import rows_to_dicts
+from ...utils.query_budget import query_budget
 
+# Tags cursors so one from another listing is rejected
+EMPTY_TEAMS_CURSOR_KIND = "empty_teams"
 
-def get_detailed_stats() -> dict[str, Any]:
+
+@query_budget(3)
+def get_detailed_stats(limit: Optional[int] = None, cursor: Optional[str] = None) -> dict[str, Any]:
     """Gets detailed stats including per event breakdowns and empty teams.
 
+    Each event row carries its empty-team count, computed by the same statement as
+    its team and member totals, and total_empty_teams is their sum. Empty teams
+    themselves are returned one keyset page (ordered by id) at a time.
+
+    Args:
+        limit (int, optional): Empty teams per page. Defaults to config.EMPTY_TEAMS_PAGE_SIZE.
+        cursor (str, optional): The empty_teams_next_cursor value from a previous page.
+
     Returns:
         dict: Detailed stats with event data and potential issues.
     """
+    after_id = 0
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        if not values or len(values) != 2 or values[0] != EMPTY_TEAMS_CURSOR_KIND or not isinstance(values[1], int):
+            return {"success": False, "error": "Invalid or expired cursor"}
+        after_id = values[1]
+    limit = limit or config.EMPTY_TEAMS_PAGE_SIZE
+
+    # Aggregate each table on its own before joining to events. Joining Team and
+    # TeamMember to Event together would multiply every team by every member row.
+    team_totals = db.session.query(Team.event_id, func.count(Team.id).label("teams")).group_by(Team.event_id).subquery()
+    member_totals = (
+        db.session.query(TeamMember.event_id, func.count(TeamMember.id).label("total_members"))
+        .group_by(TeamMember.event_id)
+        .subquery()
+    )
+    empty_totals = (
+        _empty_teams_query(Team.event_id, func.count(Team.id).label("empty_teams")).group_by(Team.event_id).subquery()
+    )
 
     event_stats_query = (
         db.session.query(
             Event.id,
             Event.name,
-            func.count(Team.id.distinct()).label("teams"),
-            func.count(TeamMember.id).label("total_members"),
+            func.coalesce(team_totals.c.teams, 0).label("teams"),
+            func.coalesce(member_totals.c.total_members, 0).label("total_members"),
+            func.coalesce(empty_totals.c.empty_teams, 0).label("empty_teams"),
         )
-        .outerjoin(Team, Event.id == Team.event_id)
-        .outerjoin(TeamMember, Event.id == TeamMember.event_id)
-        .group_by(Event.id, Event.name)
+        .outerjoin(team_totals, team_totals.c.event_id == Event.id)
+        .outerjoin(member_totals, member_totals.c.event_id == Event.id)
+        .outerjoin(empty_totals, empty_totals.c.event_id == Event.id)
         .all()
     )
 
     event_stats = rows_to_dicts(event_stats_query)
 
-    empty_teams_query = db.session.query(Team.id, Team.name, Team.event_id).filter(Team.member_count == 0).all()
+    # Fetch one extra row to know whether another page exists
+    empty_teams_query = (
+        _empty_teams_query(Team.id, Team.name, Team.event_id)
+        .filter(Team.id > after_id)
+        .order_by(Team.id)
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(empty_teams_query) > limit
+    empty_teams_query = empty_teams_query[:limit]
 
     empty_teams = [
         {"id": team_id, "name": team_name, "event_id": event_id} for team_id, team_name, event_id in empty_teams_query
@@ -48,5 +93,9 @@ def get_detailed_stats() -> dict[str, Any]:
         "overview": get_data_counts(),
         "events": event_stats,
         "empty_teams": empty_teams,
-        "total_empty_teams": len(empty_teams),
+        "total_empty_teams": sum(row["empty_teams"] for row in event_stats),
+        "empty_teams_next_cursor": encode_cursor([EMPTY_TEAMS_CURSOR_KIND, empty_teams[-1]["id"]])
+        if has_more
+        else None,
+        "empty_teams_has_more": has_more,
     }
@@ -0,0 +1,152 @@
+"""
+/backend/ctfd/plugin/admin/controllers/get_health_snapshot.py
+Contains the business logic to build the health report and serve it from a periodically refreshed cache snapshot.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+from CTFd.cache import cache
+from flask import current_app
+
+from ... import config
+from ...utils.logger import get_logger
+from .run_health_probes import run_health_probes
+
+logger = get_logger(__name__)
+
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+# Internal use only (_ prefix); cache keys shared by every worker.
+def _snapshot_key() -> str:
+    return f"{config.CACHE_KEY_PREFIX}:health_snapshot"
+
+
+def _refresh_lock_key() -> str:
+    return f"{config.CACHE_KEY_PREFIX}:health_snapshot_refresh"
+
+
+def get_health_snapshot() -> dict[str, Any]:
+    """Gets the latest health report from the cache.
+
+    The report is rebuilt every config.HEALTH_SNAPSHOT_INTERVAL seconds by a background
+    thread, so polling this adds no database load. Only when no snapshot exists (first
+    call, or the refresher stopped for longer than config.HEALTH_SNAPSHOT_MAX_AGE) is it
+    built inline.
+
+    Returns:
+        dict: The health report with its age, or error info if the database or counts probe failed.
+    """
+    _ensure_health_refresher()
+
+    snapshot = cache.get(_snapshot_key())
+    if snapshot is None:
+        snapshot = refresh_health_snapshot()
+
+    return {**snapshot, "age_seconds": round(time.time() - snapshot["generated_at"], 1)}
+
+
+def refresh_health_snapshot() -> dict[str, Any]:
+    """Builds the health report now and stores it as the current snapshot.
+
+    Returns:
+        dict: The stored snapshot.
+    """
+    snapshot = {**build_health_report(), "generated_at": time.time()}
+    cache.set(_snapshot_key(), snapshot, timeout=config.HEALTH_SNAPSHOT_MAX_AGE)
+    return snapshot
+
+
+def build_health_report() -> dict[str, Any]:
+    """Runs the health probes and assembles the report with its warnings.
+
+    Returns:
+        dict: Success status, overall status ("healthy", "degraded" or "unhealthy"),
+            counts, per-probe status and warnings.
+    """
+    probes = run_health_probes()["probes"]
+    probe_statuses = {
+        name: {key: value for key, value in probe.items() if key != "result"} for name, probe in probes.items()
+    }
+
+    if probes["database"]["status"] != "ok" or probes["data_counts"]["status"] != "ok":
+        logger.error("Health report failed", extra={"context": {"probes": probe_statuses}})
+        return {
+            "success": False,
+            "error": "Unable to fetch system statistics",
+            "status": "unhealthy",
+            "timestamp": datetime.utcnow().isoformat(),
+            "probes": probe_statuses,
+        }
+
+    counts = probes["data_counts"]["result"]
+    empty_teams_count = probes["empty_teams"].get("result")
+
+    return {
+        "success": True,
+        "status": "healthy" if all(probe["status"] == "ok" for probe in probes.values()) else "degraded",
+        "timestamp": datetime.utcnow().isoformat(),
+        "data_counts": counts,
+        "events_count": counts["events"],
+        "empty_teams_count": empty_teams_count,
+        "probes": probe_statuses,
+        "warnings": _generate_health_warnings(counts, empty_teams_count),
+    }
+
+
+def _generate_health_warnings(counts: dict[str, int], empty_teams_count: Optional[int]) -> list[str]:
+    """Generate health warnings based on data counts and statistics.
+
+    Args:
+        counts: Dictionary of data counts
+        empty_teams_count: Number of teams without members, or None if the probe did not finish
+
+    Returns:
+        list: List of warning messages
+    """
+    warnings = []
+
+    if counts["users"] > 0 and counts["team_members"] == 0:
+        warnings.append("Users exist but no team members found")
+
+    if counts["teams"] > 0 and counts["team_members"] == 0:
+        warnings.append("Teams exist but no team members found")
+
+    if empty_teams_count is None:
+        warnings.append("Empty teams check did not complete")
+    elif counts["teams"] > 0 and empty_teams_count / counts["teams"] > config.EMPTY_TEAMS_WARNING_THRESHOLD:
+        warnings.append(f"More than {int(config.EMPTY_TEAMS_WARNING_THRESHOLD * 100)}% of teams are empty")
+
+    return warnings
+
+
+# Internal use only (_ prefix); starts this process's refresher thread once.
+def _ensure_health_refresher() -> None:
+    # Started on first use so each gunicorn worker gets its own thread after forking
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = threading.Thread(
+                target=_refresh_loop,
+                args=(current_app._get_current_object(),),
+                name="ng-health-refresher",
+                daemon=True,
+            )
+            _refresher.start()
+
+
+def _refresh_loop(app) -> None:
+    """Rebuild the snapshot every interval; the cache lock lets one worker per interval do it."""
+    while True:
+        time.sleep(config.HEALTH_SNAPSHOT_INTERVAL)
+        with app.app_context():
+            try:
+                if cache.add(_refresh_lock_key(), 1, timeout=config.HEALTH_SNAPSHOT_INTERVAL):
+                    refresh_health_snapshot()
+            except Exception as e:
+                # Broad catch so one failed refresh never stops the thread
+                logger.error("Health snapshot refresh failed", extra={"context": {"error": str(e)}}, exc_info=True)
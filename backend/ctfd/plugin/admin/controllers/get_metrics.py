@@ -0,0 +1,21 @@
+"""
+/backend/ctfd/plugin/admin/controllers/get_metrics.py
+Contains the business logic to export request and SQL metrics in the Prometheus text format.
+"""
+
+from typing import Any
+
+from ...middleware import flush_metrics, render_prometheus
+
+
+def get_metrics() -> dict[str, Any]:
+    """Gets request, error and SQL metrics summed across every worker on this host.
+
+    This worker's buffered counters are flushed first; other workers' counters are at
+    most config.METRICS_FLUSH_INTERVAL seconds behind.
+
+    Returns:
+        dict: Success status and the Prometheus exposition text.
+    """
+    flush_metrics()
+    return {"success": True, "metrics": render_prometheus()}
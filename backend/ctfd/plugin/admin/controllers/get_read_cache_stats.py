@@ -0,0 +1,18 @@
+"""
+/backend/ctfd/plugin/admin/controllers/get_read_cache_stats.py
+Contains the business logic to report read cache hit/miss counters.
+"""
+
+from typing import Any
+
+from ... import config
+from ...utils.cache import get_cache_stats
+
+
+def get_read_cache_stats() -> dict[str, Any]:
+    """Gets hit/miss counters for every cached read kind.
+
+    Returns:
+        dict: Success status and per-kind hits, misses and hit rate.
+    """
+    return {"success": True, "cache": get_cache_stats(config.CACHED_READ_KINDS)}
@@ -0,0 +1,307 @@
+"""
+/backend/ctfd/plugin/admin/controllers/import_roster.py
+Contains the business logic for bulk importing a team roster (CSV or NDJSON) into an event.
+"""
+
+import csv
+import json
+from datetime import datetime
+from typing import Any, Iterable, Iterator
+
+from CTFd.models import Users, db
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+from ... import config
+from ...utils import validate_roster_row
+from ...utils.logger import get_logger
+from ...utils.cache import bump_event
+from ...event.models.Event import Event
+from ...team.controllers._generate_invite_code import _generate_invite_codes
+from ...team.controllers._invite_code_index import _record_invite_codes
+from ...team.models.Team import Team
+from ...team.models.TeamMember import TeamMember
+from ...team.models.enums import TeamRole
+from ...user.models.User import User
+
+logger = get_logger(__name__)
+
+
+def import_roster(event_id: int, lines: Iterable[str | bytes], fmt: str) -> dict[str, Any]:
+    """Bulk creates teams and memberships for an event from a streamed roster.
+
+    Each row is one membership: team_name, user_id and optional role ("captain" or
+    "member") and ranked. Rows are read lazily and written in chunks of
+    config.ROSTER_IMPORT_CHUNK_SIZE, one transaction per chunk. Invalid rows are
+    reported and skipped without aborting the rest of the import.
+
+    A new team's captain is its row with role "captain", or else its first row.
+    Teams that already exist (including ones created by an earlier chunk) keep
+    their captain and only gain members.
+
+    Args:
+        event_id (int): The event to import into.
+        lines (Iterable[str | bytes]): Roster lines, e.g. a request stream.
+        fmt (str): "csv" (with a header row) or "ndjson".
+
+    Returns:
+        dict: Success status, created/added counts and per-row errors, or error info.
+    """
+    event = Event.query.get(event_id)
+    if not event:
+        return {"success": False, "error": f"Event with ID {event_id} does not exist"}
+
+    if event.locked:
+        return {"success": False, "error": f"Event '{event.name}' is locked and not accepting new teams"}
+
+    summary = {"rows_processed": 0, "teams_created": 0, "members_added": 0, "error_count": 0}
+    errors: list[dict[str, Any]] = []
+    imported_users: set[int] = set()
+
+    def reject(line: int, message: Any) -> None:
+        summary["error_count"] += 1
+        if len(errors) < config.ROSTER_IMPORT_MAX_REPORTED_ERRORS:
+            errors.append({"line": line, "errors": message if isinstance(message, dict) else {"row": message}})
+
+    chunk: list[tuple[int, dict[str, Any]]] = []
+    for line_number, row, parse_error in _iter_roster_rows(lines, fmt):
+        summary["rows_processed"] += 1
+        if parse_error:
+            reject(line_number, parse_error)
+            continue
+
+        is_valid, row_errors = validate_roster_row(row)
+        if not is_valid:
+            reject(line_number, row_errors)
+            continue
+
+        chunk.append((line_number, row))
+        if len(chunk) >= config.ROSTER_IMPORT_CHUNK_SIZE:
+            _import_chunk(event, chunk, imported_users, summary, reject)
+            chunk = []
+
+    if chunk:
+        _import_chunk(event, chunk, imported_users, summary, reject)
+
+    if summary["members_added"]:
+        bump_event(event_id)
+
+    # Parse errors are reported as rows stream in, database checks once per chunk
+    errors.sort(key=lambda error: error["line"])
+
+    logger.info(
+        "Roster import completed",
+        extra={"context": {"event_id": event_id, "event_name": event.name, "format": fmt, **summary}},
+    )
+
+    return {
+        "success": True,
+        "message": (
+            f"Imported {summary['teams_created']} teams and {summary['members_added']} members into "
+            f"{event.name} ({summary['error_count']} rows rejected)"
+        ),
+        **summary,
+        "errors": errors,
+    }
+
+
+def _iter_roster_rows(lines: Iterable[str | bytes], fmt: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    """Yield (line_number, row, parse_error) for each data row of the roster."""
+    text_lines = _iter_text_lines(lines)
+
+    if fmt == "csv":
+        reader = csv.DictReader(text_lines)
+        for record in reader:
+            yield reader.line_num, _normalize_csv_row(record), None
+        return
+
+    for line_number, line in enumerate(text_lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, None, "Row is not valid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Row must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def _iter_text_lines(lines: Iterable[str | bytes]) -> Iterator[str]:
+    """Decode streamed lines, dropping a leading UTF-8 byte order mark."""
+    for index, line in enumerate(lines):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        if index == 0:
+            line = line.lstrip("\ufeff")
+        yield line
+
+
+def _normalize_csv_row(record: dict[str, Any]) -> dict[str, Any]:
+    """Map CSV cells to the shapes NDJSON rows use (blank -> None, true/false -> bool)."""
+    row = {
+        key.strip(): (value.strip() or None) if isinstance(value, str) else value
+        for key, value in record.items()
+        if key
+    }
+    ranked = row.get("ranked")
+    if isinstance(ranked, str) and ranked.lower() in ("true", "false"):
+        row["ranked"] = ranked.lower() == "true"
+    return row
+
+
+def _import_chunk(event, chunk, imported_users, summary, reject) -> None:
+    """Validate a chunk of rows against the database and bulk insert it in one transaction.
+
+    Every lookup is one IN query for the whole chunk, so the number of statements per
+    chunk is fixed regardless of how many teams or members it contains. Team names are
+    matched case-insensitively, like the name collation in production: rows naming
+    "Alpha" and "alpha" join the same team, which keeps its stored (or first seen) spelling.
+    """
+    user_ids = {int(row["user_id"]) for _, row in chunk}
+    name_keys = {_name_key(row["team_name"]) for _, row in chunk}
+
+    known_users = {user_id for (user_id,) in db.session.query(Users.id).filter(Users.id.in_(user_ids)).all()}
+    ng_users = {user_id for (user_id,) in db.session.query(User.id).filter(User.id.in_(user_ids)).all()}
+    in_team = {
+        user_id
+        for (user_id,) in db.session.query(TeamMember.user_id)
+        .filter(TeamMember.event_id == event.id, TeamMember.user_id.in_(user_ids))
+        .all()
+    }
+    # Name key -> (team_id, member_count, locked, stored name)
+    existing_teams = {
+        _name_key(name): (team_id, member_count, locked, name)
+        for name, team_id, member_count, locked in db.session.query(Team.name, Team.id, Team.member_count, Team.locked)
+        .filter(Team.event_id == event.id, func.lower(Team.name).in_(name_keys))
+        .all()
+    }
+    display_names = {key: existing[3] for key, existing in existing_teams.items()}
+
+    # Name key -> accepted (line, user_id, role, ranked) rows
+    accepted: dict[str, list[tuple[int, int, TeamRole, bool]]] = {}
+    for line_number, row in chunk:
+        user_id = int(row["user_id"])
+        name_key = _name_key(row["team_name"])
+        team_name = display_names.setdefault(name_key, row["team_name"].strip())
+        wants_captain = row.get("role") == "captain"
+
+        if user_id not in known_users:
+            reject(line_number, f"User {user_id} does not exist")
+            continue
+        if user_id in in_team or user_id in imported_users:
+            reject(line_number, f"User {user_id} is already in a team for this event")
+            continue
+
+        members = accepted.setdefault(name_key, [])
+        existing = existing_teams.get(name_key)
+        if existing:
+            _, member_count, locked, _ = existing
+            if locked:
+                reject(line_number, f"Team '{team_name}' is locked")
+                continue
+            if wants_captain:
+                reject(line_number, f"Team '{team_name}' already has a captain")
+                continue
+            current_size = member_count
+        else:
+            if wants_captain and any(role == TeamRole.CAPTAIN for _, _, role, _ in members):
+                reject(line_number, f"Team '{team_name}' already has a captain")
+                continue
+            current_size = 0
+
+        if current_size + len(members) >= event.max_team_size:
+            reject(line_number, f"Team '{team_name}' is full ({event.max_team_size} members)")
+            continue
+
+        role = TeamRole.CAPTAIN if wants_captain else TeamRole.MEMBER
+        members.append((line_number, user_id, role, bool(row.get("ranked") or False)))
+        imported_users.add(user_id)
+
+    accepted = {key: members for key, members in accepted.items() if members}
+    if not accepted:
+        return
+
+    new_team_keys = [key for key in accepted if key not in existing_teams]
+    for key in new_team_keys:
+        members = accepted[key]
+        if not any(role == TeamRole.CAPTAIN for _, _, role, _ in members):
+            line_number, user_id, _, ranked = members[0]
+            members[0] = (line_number, user_id, TeamRole.CAPTAIN, ranked)
+
+    event_id = event.id  # Read before the commit below expires the event
+    accepted_user_ids = [user_id for members in accepted.values() for _, user_id, _, _ in members]
+    accepted_lines = [line_number for members in accepted.values() for line_number, _, _, _ in members]
+
+    try:
+        missing_ng_users = [{"id": user_id} for user_id in accepted_user_ids if user_id not in ng_users]
+        if missing_ng_users:
+            db.session.execute(User.__table__.insert(), missing_ng_users)
+
+        team_ids = {key: existing_teams[key][0] for key in accepted if key in existing_teams}
+        if new_team_keys:
+            invite_codes = _generate_invite_codes(len(new_team_keys))
+            db.session.execute(
+                Team.__table__.insert(),
+                [
+                    {
+                        "name": display_names[key],
+                        "event_id": event.id,
+                        "invite_code": invite_code,
+                        "ranked": accepted[key][0][3],
+                        "locked": False,
+                        "member_count": len(accepted[key]),
+                    }
+                    for key, invite_code in zip(new_team_keys, invite_codes)
+                ],
+            )
+            code_to_key = dict(zip(invite_codes, new_team_keys))
+            for team_id, invite_code in (
+                db.session.query(Team.id, Team.invite_code).filter(Team.invite_code.in_(invite_codes)).all()
+            ):
+                team_ids[code_to_key[invite_code]] = team_id
+
+        joined_at = datetime.utcnow()
+        db.session.execute(
+            TeamMember.__table__.insert(),
+            [
+                {
+                    "user_id": user_id,
+                    "team_id": team_ids[key],
+                    "event_id": event.id,
+                    "joined_at": joined_at,
+                    "role": role,
+                }
+                for key, members in accepted.items()
+                for _, user_id, role, _ in members
+            ],
+        )
+
+        for key in accepted:
+            if key in existing_teams:
+                Team.adjust_member_count(team_ids[key], len(accepted[key]))
+        Event.adjust_counts(event.id, teams=len(new_team_keys), members=len(accepted_user_ids))
+
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        imported_users.difference_update(accepted_user_ids)
+        for line_number in accepted_lines:
+            reject(line_number, "Row conflicted with a concurrent change; re-import it")
+        logger.warning(
+            "Roster import chunk rolled back",
+            extra={"context": {"event_id": event.id, "rows": len(accepted_lines), "error": str(e.orig)}},
+        )
+        return
+
+    if new_team_keys:
+        _record_invite_codes((code, team_ids[key], event_id) for code, key in code_to_key.items())
+    summary["teams_created"] += len(new_team_keys)
+    summary["members_added"] += len(accepted_user_ids)
+
+
+def _name_key(team_name: str) -> str:
+    # Lowercased like SQL LOWER(), so the same key works in the lookup query and in Python
+    return team_name.strip().lower()
@@ -0,0 +1,115 @@
+"""
+/backend/ctfd/plugin/admin/controllers/reconcile_counters.py
+Contains the business logic for recomputing the denormalized team/event counters and reporting drift.
+"""
+
+from typing import Any
+
+from CTFd.models import db
+from sqlalchemy import func, select
+
+from ... import config
+from ...utils.logger import get_logger
+from ...utils.cache import bump_version
+from ...utils.query_budget import query_budget
+from ...event.models.Event import Event
+from ...team.models.Team import Team
+from ...team.models.TeamMember import TeamMember
+
+logger = get_logger(__name__)
+
+
+@query_budget(4)
+def reconcile_counters(dry_run: bool = False) -> dict[str, Any]:
+    """Recomputes Team.member_count, Event.team_count and Event.member_count set-wise.
+
+    Args:
+        dry_run (bool, optional): Only report drift without writing. Defaults to False.
+
+    Returns:
+        dict: Success status and, per table, how many rows drifted plus a sample of them.
+    """
+    team_members_actual = select(func.count(TeamMember.id)).where(TeamMember.team_id == Team.id).scalar_subquery()
+    event_teams_actual = select(func.count(Team.id)).where(Team.event_id == Event.id).scalar_subquery()
+    event_members_actual = select(func.count(TeamMember.id)).where(TeamMember.event_id == Event.id).scalar_subquery()
+
+    drifted_teams = (
+        db.session.query(Team.id, Team.member_count, team_members_actual.label("actual"))
+        .filter(Team.member_count != team_members_actual)
+        .order_by(Team.id)
+        .all()
+    )
+    drifted_events = (
+        db.session.query(
+            Event.id,
+            Event.team_count,
+            event_teams_actual.label("actual_teams"),
+            Event.member_count,
+            event_members_actual.label("actual_members"),
+        )
+        .filter((Event.team_count != event_teams_actual) | (Event.member_count != event_members_actual))
+        .order_by(Event.id)
+        .all()
+    )
+
+    if not dry_run and (drifted_teams or drifted_events):
+        db.session.execute(
+            Team.__table__.update()
+            .where(Team.member_count != team_members_actual)
+            .values(member_count=team_members_actual)
+        )
+        db.session.execute(
+            Event.__table__.update()
+            .where((Event.team_count != event_teams_actual) | (Event.member_count != event_members_actual))
+            .values(team_count=event_teams_actual, member_count=event_members_actual)
+        )
+        db.session.commit()
+        bump_version("plugin")
+
+    sample_limit = config.COUNTER_DRIFT_SAMPLE_LIMIT
+    report = {
+        "teams": {
+            "drifted": len(drifted_teams),
+            "sample": [
+                {"id": team_id, "stored_member_count": stored, "actual_member_count": actual}
+                for team_id, stored, actual in drifted_teams[:sample_limit]
+            ],
+        },
+        "events": {
+            "drifted": len(drifted_events),
+            "sample": [
+                {
+                    "id": event_id,
+                    "stored_team_count": stored_teams,
+                    "actual_team_count": actual_teams,
+                    "stored_member_count": stored_members,
+                    "actual_member_count": actual_members,
+                }
+                for event_id, stored_teams, actual_teams, stored_members, actual_members in drifted_events[
+                    :sample_limit
+                ]
+            ],
+        },
+    }
+
+    log = logger.warning if (drifted_teams or drifted_events) else logger.info
+    log(
+        "Counter reconciliation completed",
+        extra={
+            "context": {
+                "dry_run": dry_run,
+                "drifted_teams": len(drifted_teams),
+                "drifted_events": len(drifted_events),
+            }
+        },
+    )
+
+    return {
+        "success": True,
+        "dry_run": dry_run,
+        "drift": report,
+        "message": (
+            f"Found {len(drifted_teams)} drifted teams and {len(drifted_events)} drifted events"
+            + ("" if dry_run else "; counters repaired")
+        ),
+    }
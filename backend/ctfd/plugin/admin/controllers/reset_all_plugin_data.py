@@ -5,14 +5,13 @@ Contains the business logic for the destructive operation of resetting all plugi
 
 from typing import Any
 
-from CTFd.models import db
-
 from ...utils.logger import get_logger
+from ...utils.cache import bump_version
 from ...event.models.Event import Event
 from ...team.models.Team import Team
 from ...team.models.TeamMember import TeamMember
 from ...user.models.User import User
-from .get_data_counts import get_data_counts
+from ._chunked_delete import _delete_in_chunks
 
 logger = get_logger(__name__)
 
@@ -24,27 +23,28 @@ def reset_all_plugin_data() -> dict[str, Any]:
         dict: Success status and deletion counts or error info.
     """
 
-    initial_counts = get_data_counts()
-
-    logger.warning(
-        "Initiating full plugin data reset",
-        extra={"context": {"initial_counts": initial_counts}},
+    logger.warning("Initiating full plugin data reset")
+
+    # Children first, in short chunks; rerunning after an interruption resumes
+    result = _delete_in_chunks(
+        "reset_all",
+        [
+            ("team_members", TeamMember, []),
+            ("teams", Team, []),
+            ("users", User, []),
+            ("events", Event, []),
+        ],
     )
-
-    TeamMember.query.delete()
-    Team.query.delete()
-    User.query.delete()
-    Event.query.delete()
-
-    db.session.commit()
+    bump_version("plugin")
 
     logger.info(
         "All plugin data reset successfully",
-        extra={"context": {"deleted_counts": initial_counts}},
+        extra={"context": {"deleted_counts": result["deleted"], **result["stats"]}},
     )
 
     return {
         "success": True,
         "message": "All plugin data reset successfully",
-        "deleted": initial_counts,
+        "deleted": result["deleted"],
+        "stats": result["stats"],
     }
@@ -8,9 +8,11 @@ from typing import Any
 from CTFd.models import db
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_event
 from ...event.models.Event import Event
 from ...team.models.Team import Team
 from ...team.models.TeamMember import TeamMember
+from ._chunked_delete import _delete_in_chunks
 
 logger = get_logger(__name__)
 
@@ -18,6 +20,10 @@ logger = get_logger(__name__)
 def reset_event_data(event_id: int) -> dict[str, Any]:
     """Deletes all teams and team members for a event.
 
+    Rows are deleted in short primary-key chunks (memberships, then teams) so live
+    joins in other events are never blocked for long. An interrupted reset resumes
+    where it stopped when run again.
+
     Args:
         event_id (int): The ID of the event to reset.
 
@@ -33,25 +39,33 @@ def reset_event_data(event_id: int) -> dict[str, Any]:
         )
         return {"success": False, "error": "Event not found."}
 
-    team_members_count = TeamMember.query.filter_by(event_id=event_id).count()
-    teams_count = Team.query.filter_by(event_id=event_id).count()
-
     logger.warning(
         "Initiating event data reset",
         extra={
             "context": {
                 "event_id": event_id,
                 "event_name": event.name,
-                "teams_to_delete": teams_count,
-                "team_members_to_delete": team_members_count,
+                "teams_to_delete": event.team_count,
+                "team_members_to_delete": event.member_count,
             }
         },
     )
 
-    TeamMember.query.filter_by(event_id=event_id).delete()
-    Team.query.filter_by(event_id=event_id).delete()
+    result = _delete_in_chunks(
+        f"reset_event:{event_id}",
+        [
+            ("team_members", TeamMember, [TeamMember.event_id == event_id]),
+            ("teams", Team, [Team.event_id == event_id]),
+        ],
+    )
+    team_members_count = result["deleted"]["team_members"]
+    teams_count = result["deleted"]["teams"]
+
+    event.team_count = 0
+    event.member_count = 0
 
     db.session.commit()
+    bump_event(event_id)
 
     logger.info(
         "Event data reset successfully",
@@ -61,6 +75,7 @@ def reset_event_data(event_id: int) -> dict[str, Any]:
                 "event_name": event.name,
                 "deleted_teams": teams_count,
                 "deleted_team_members": team_members_count,
+                **result["stats"],
             }
         },
     )
@@ -69,5 +84,6 @@ def reset_event_data(event_id: int) -> dict[str, Any]:
         "success": True,
         "message": f"Reset event '{event.name}' successfully",
         "deleted": {"team_members": team_members_count, "teams": teams_count},
+        "stats": result["stats"],
         "event": {"id": event.id, "name": event.name},
     }
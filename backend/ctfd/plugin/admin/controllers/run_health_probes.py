@@ -0,0 +1,90 @@
+"""
+/backend/ctfd/plugin/admin/controllers/run_health_probes.py
+Contains the business logic to run the independent health probes concurrently with per-probe timeouts.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable
+
+from CTFd.models import db
+from flask import current_app
+from sqlalchemy import func, text
+
+from ... import config
+from ...team.models.Team import Team
+from ...utils.logger import get_logger
+from ._empty_teams import _empty_teams_query
+from .get_data_counts import get_data_counts
+
+logger = get_logger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+# Internal use only (_ prefix); probe name -> callable returning its result.
+def _health_probes() -> dict[str, Callable[[], Any]]:
+    return {
+        "database": lambda: db.session.execute(text("SELECT 1")).scalar() == 1,
+        "data_counts": lambda: get_data_counts(approximate=config.HEALTH_APPROXIMATE_COUNTS),
+        "empty_teams": lambda: _empty_teams_query(func.count(Team.id)).scalar(),
+    }
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Created on first use so each gunicorn worker gets its own pool after forking
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=config.HEALTH_PROBE_WORKERS, thread_name_prefix="ng-health")
+        return _executor
+
+
+def _run_probe(app, probe: Callable[[], Any]) -> dict[str, Any]:
+    """Run one probe inside its own app context (and therefore its own DB session), timing it."""
+    with app.app_context():
+        started = time.monotonic()
+        try:
+            return {"status": "ok", "result": probe(), "elapsed_ms": round((time.monotonic() - started) * 1000, 1)}
+        finally:
+            db.session.remove()
+
+
+def run_health_probes(timeout: float = config.HEALTH_PROBE_TIMEOUT) -> dict[str, Any]:
+    """Runs every health probe concurrently and collects their outcomes.
+
+    All probes start together on a small per-process thread pool, so the check takes
+    as long as the slowest probe rather than their sum. A probe still running after
+    timeout seconds is reported as "timeout" and left to finish in the background;
+    one that raises is reported as "error". Neither fails the other probes.
+
+    Args:
+        timeout (float, optional): Seconds each probe may take.
+
+    Returns:
+        dict: Per-probe status ("ok", "timeout" or "error"), elapsed time and result.
+    """
+    app = current_app._get_current_object()
+    started = time.monotonic()
+    futures = {name: _get_executor().submit(_run_probe, app, probe) for name, probe in _health_probes().items()}
+
+    probes = {}
+    for name, future in futures.items():
+        remaining = max(0.0, started + timeout - time.monotonic())
+        try:
+            probes[name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            probes[name] = {"status": "timeout", "error": f"No result within {timeout}s"}
+        except Exception as e:
+            # Broad catch so one failing probe is reported instead of failing the check
+            probes[name] = {"status": "error", "error": str(e)}
+
+        if probes[name]["status"] != "ok":
+            probes[name]["elapsed_ms"] = round((time.monotonic() - started) * 1000, 1)
+            logger.warning("Health probe failed", extra={"context": {"probe": name, **probes[name]}})
+
+    return {"probes": probes, "elapsed_ms": round((time.monotonic() - started) * 1000, 1)}
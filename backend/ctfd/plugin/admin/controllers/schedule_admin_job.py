@@ -0,0 +1,177 @@
+"""
+/backend/ctfd/plugin/admin/controllers/schedule_admin_job.py
+Contains the business logic for running a destructive admin operation as a locked job, queued or inline.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from CTFd.models import db
+from flask import current_app
+from sqlalchemy import and_, or_
+
+from ... import config
+from ...utils.logger import get_logger
+from ..models.AdminJob import AdminJob
+from ..models.enums import JobStatus
+from ._job_runner import _execute_job, _job_handlers, _submit_job
+from .get_admin_job import _job_to_dict
+
+logger = get_logger(__name__)
+
+# Jobs that are not scoped to one event take the plugin-wide lock
+PLUGIN_LOCK_KEY = "plugin"
+# Lock key of the guard row every scheduling transaction inserts and deletes again before committing
+SCHEDULING_LOCK_KEY = "scheduling"
+
+
+def schedule_admin_job(
+    kind: str, created_by: Optional[int], event_id: Optional[int] = None, params: Optional[dict[str, Any]] = None
+) -> dict[str, Any]:
+    """Queues an admin operation to run on this worker's job thread pool.
+
+    Only one job may be active per event, and a plugin-wide job (full reset, cleanups)
+    excludes every other job. Job locks are the unique lock_key column, so they hold
+    across gunicorn workers. Scheduling itself is serialized by inserting a guard row
+    with a fixed lock_key that is deleted before the transaction commits: a concurrent
+    scheduler's insert waits on that key until this transaction ends, and its locking
+    conflict check then sees the job queued here. Jobs abandoned by a dead or recycled worker
+    are failed and their locks reclaimed (see _release_stale_jobs).
+
+    Args:
+        kind (str): Job kind, e.g. "reset_event".
+        created_by (int, optional): Admin user ID.
+        event_id (int, optional): Target event for event-scoped jobs.
+        params (dict, optional): JSON-serializable keyword arguments for the job's controller.
+
+    Returns:
+        dict: Success status and the queued job, or error info.
+    """
+    locked = _insert_locked_job(kind, created_by, event_id, params, JobStatus.QUEUED)
+    if not locked["success"]:
+        return locked
+
+    queued_job = _job_to_dict(locked["job"])
+    _submit_job(queued_job["id"])
+
+    logger.info(
+        "Admin job queued",
+        extra={"context": {"job_id": queued_job["id"], "kind": kind, "event_id": event_id, "created_by": created_by}},
+    )
+
+    return {"success": True, "job": queued_job}
+
+
+def run_admin_job(
+    kind: str, created_by: Optional[int], event_id: Optional[int] = None, params: Optional[dict[str, Any]] = None
+) -> dict[str, Any]:
+    """Runs an admin operation in the calling request, under the lock a scheduled job would take.
+
+    The operation is recorded as a job that starts out running, so it conflicts with
+    queued and running jobs exactly like schedule_admin_job, and shows up in the job list.
+
+    Args:
+        kind (str): Job kind, e.g. "reset_event".
+        created_by (int, optional): Admin user ID.
+        event_id (int, optional): Target event for event-scoped jobs.
+        params (dict, optional): JSON-serializable keyword arguments for the job's controller.
+
+    Returns:
+        dict: The controller's result, or error info with active_job_id if a conflicting job is active.
+    """
+    locked = _insert_locked_job(kind, created_by, event_id, params, JobStatus.RUNNING)
+    if not locked["success"]:
+        return locked
+
+    job_id = locked["job"].id
+    logger.info(
+        "Admin job running inline",
+        extra={"context": {"job_id": job_id, "kind": kind, "event_id": event_id, "created_by": created_by}},
+    )
+    return _execute_job(current_app._get_current_object(), job_id)
+
+
+def _insert_locked_job(
+    kind: str, created_by: Optional[int], event_id: Optional[int], params: Optional[dict[str, Any]], status: JobStatus
+) -> dict[str, Any]:
+    """Insert and commit a job holding its lock, unless a conflicting job is active.
+
+    Returns:
+        dict: Success status and the AdminJob, or error info with active_job_id.
+    """
+    if kind not in _job_handlers():
+        return {"success": False, "error": f"Unknown job kind '{kind}'"}
+
+    lock_key = f"event:{event_id}" if event_id is not None else PLUGIN_LOCK_KEY
+    _release_stale_jobs()
+
+    savepoint = db.session.begin_nested()
+    guard = AdminJob(kind="scheduling", lock_key=SCHEDULING_LOCK_KEY)
+    db.session.add(guard)
+    db.session.flush()
+
+    # A plugin-wide job conflicts with any active job; an event job with an active plugin-wide one
+    conflicting = AdminJob.query.filter(AdminJob.lock_key.isnot(None), AdminJob.id != guard.id)
+    if lock_key != PLUGIN_LOCK_KEY:
+        conflicting = conflicting.filter(AdminJob.lock_key.in_([lock_key, PLUGIN_LOCK_KEY]))
+    # Locking read: sees jobs committed by a scheduler this transaction waited for
+    active_job = conflicting.with_for_update().first()
+
+    if active_job is not None:
+        active_job_id = active_job.id
+        error = f"Job {active_job_id} ({active_job.kind}) is already {active_job.status.value}"
+        savepoint.rollback()
+        # Ends the transaction, releasing the guard's row lock
+        db.session.commit()
+        logger.warning(
+            "Admin job rejected - conflicting job active",
+            extra={"context": {"kind": kind, "event_id": event_id, "active_job_id": active_job_id}},
+        )
+        return {"success": False, "error": error, "active_job_id": active_job_id}
+
+    job = AdminJob(kind=kind, event_id=event_id, status=status, lock_key=lock_key, params=params, created_by=created_by)
+    if status == JobStatus.RUNNING:
+        job.started_at = datetime.utcnow()
+    db.session.add(job)
+    db.session.delete(guard)
+    savepoint.commit()
+    db.session.commit()
+    return {"success": True, "job": job}
+
+
+def _release_stale_jobs() -> None:
+    """Fail abandoned jobs, releasing their locks.
+
+    A running job is abandoned when its heartbeat stopped for config.ADMIN_JOB_STALE_AFTER
+    seconds. A queued job lives only in its worker's in-process pool, so it is lost when
+    that worker restarts; it is abandoned once it waited config.ADMIN_JOB_QUEUE_TIMEOUT
+    seconds. Failing a queued job that is still in a pool is safe: a job can only start
+    by claiming its still-held lock.
+    """
+    now = datetime.utcnow()
+    stale_running = and_(
+        AdminJob.status == JobStatus.RUNNING,
+        AdminJob.updated_at < now - timedelta(seconds=config.ADMIN_JOB_STALE_AFTER),
+    )
+    stale_queued = and_(
+        AdminJob.status == JobStatus.QUEUED,
+        AdminJob.created_at < now - timedelta(seconds=config.ADMIN_JOB_QUEUE_TIMEOUT),
+    )
+    stale_jobs = AdminJob.query.filter(AdminJob.lock_key.isnot(None), or_(stale_running, stale_queued)).all()
+    for job in stale_jobs:
+        logger.warning(
+            "Releasing stale admin job",
+            extra={
+                "context": {
+                    "job_id": job.id,
+                    "kind": job.kind,
+                    "status": job.status.value,
+                    "created_at": job.created_at,
+                    "updated_at": job.updated_at,
+                }
+            },
+        )
+        if job.status == JobStatus.QUEUED:
+            job.finish(JobStatus.FAILED, error="Abandoned: not started before the queue timeout")
+        else:
+            job.finish(JobStatus.FAILED, error="Abandoned: no heartbeat before the stale timeout")
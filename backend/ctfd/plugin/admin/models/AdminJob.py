@@ -0,0 +1,55 @@
+"""
+/backend/ctfd/plugin/admin/models/AdminJob.py
+Defines the AdminJob model, a background admin operation with its status, progress and result.
+"""
+
+from datetime import datetime
+
+from CTFd.models import db
+
+from .enums import JobStatus
+
+
+class AdminJob(db.Model):
+    __tablename__ = "ng_admin_jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(64), nullable=False)
+    # Not a foreign key: a full reset deletes events while its job row must survive
+    event_id = db.Column(db.Integer, nullable=True)
+    status = db.Column(db.Enum(JobStatus), default=JobStatus.QUEUED, nullable=False, index=True)
+    # Set while the job is queued or running; the unique index is the cross-worker lock
+    lock_key = db.Column(db.String(64), nullable=True, unique=True)
+    # Keyword arguments passed to the job's controller
+    params = db.Column(db.JSON, nullable=True)
+    progress = db.Column(db.JSON, nullable=True)
+    result = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_by = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    # Heartbeat; refreshed periodically while running and on every progress report
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AdminJob {self.id} {self.kind} {self.status}>"
+
+    @property
+    def is_active(self):
+        return self.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+    def finish(self, status, result=None, error=None):
+        """Record the outcome, release the job's lock and persist to database.
+
+        Args:
+            status (JobStatus): JobStatus.SUCCEEDED or JobStatus.FAILED
+            result (dict, optional): JSON-serializable controller result
+            error (str, optional): Failure reason
+        """
+        self.status = status
+        self.result = result
+        self.error = error
+        self.lock_key = None
+        self.finished_at = self.updated_at = datetime.utcnow()
+        db.session.commit()
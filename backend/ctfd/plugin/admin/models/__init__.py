@@ -0,0 +1,9 @@
+"""
+/backend/ctfd/plugin/admin/models/__init__.py
+Admin domain data models.
+"""
+
+from .AdminJob import AdminJob
+from .enums import JobStatus
+
+__all__ = ["AdminJob", "JobStatus"]
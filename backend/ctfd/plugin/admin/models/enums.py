@@ -0,0 +1,15 @@
+"""
+/backend/ctfd/plugin/admin/models/enums.py
+Enumerations to ensure type safety and prevent magic string bugs
+"""
+
+import enum
+
+
+class JobStatus(str, enum.Enum):
+    """Lifecycle states of a background admin job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
@@ -3,29 +3,83 @@
 Defines the public API routes for all administrative operations and system management.
 """
 
-from flask import request
+from flask import current_app, request
 from flask_restx import Namespace, Resource
 from CTFd.utils.decorators import admins_only
-from datetime import datetime
 
 from ... import config
 from ..controllers import (
+    check_liveness,
     cleanup_orphaned_data,
     cleanup_headless_teams,
     get_data_counts,
     get_detailed_stats,
-    reset_all_plugin_data,
-    reset_event_data,
+    get_health_snapshot,
+    get_metrics,
+    get_admin_job,
+    get_read_cache_stats,
+    import_roster,
+    list_admin_jobs,
+    reconcile_counters,
+    run_admin_job,
+    schedule_admin_job,
 )
 from ...utils.api_responses import controller_response, error_response, success_response
 from ...utils.decorators import handle_integrity_error
 from ...utils.logger import get_logger
 from ...utils import get_current_user_id
-from ...utils import validate_admin_reset, validate_admin_event_reset
+from ...utils import validate_admin_reset, validate_admin_event_reset, validate_counter_reconcile
+from ...utils import (
+    validate_roster_import_params,
+    validate_admin_job_params,
+    validate_headless_team_cleanup,
+    validate_orphan_cleanup,
+    validate_data_counts_params,
+    validate_admin_stats_params,
+)
 
 admin_namespace = Namespace("admin", description="admin operations")
 logger = get_logger(__name__)
 
+BACKGROUND_PARAM_DOC = "true to run as a background job and return 202 with the job (optional)"
+
+
+def _schedule_job(kind, event_id=None, params=None):
+    """Queue a schedulable admin operation and answer 202 with the job, or 409 if one conflicts."""
+    result = schedule_admin_job(kind, get_current_user_id(), event_id=event_id, params=params)
+    if not result["success"]:
+        return error_response(result["error"], "job", 409)
+
+    logger.warning(
+        "Admin scheduled background job",
+        extra={"context": {"admin_id": get_current_user_id(), "job_id": result["job"]["id"], "kind": kind}},
+    )
+    return success_response(result, status_code=202)
+
+
+def _run_job_inline(kind, event_id=None, params=None):
+    """Run a destructive admin operation in this request under its job lock.
+
+    Returns:
+        tuple: (controller result, None), or (None, 409 response) if a conflicting job is active.
+    """
+    result = run_admin_job(kind, get_current_user_id(), event_id=event_id, params=params)
+    if "active_job_id" in result:
+        return None, error_response(result["error"], "job", 409)
+    return result, None
+
+
+def _invalid_job_params(endpoint):
+    """Validate the shared background query parameter; returns a 400 response or None."""
+    is_valid, errors = validate_admin_job_params(request.args)
+    if is_valid:
+        return None
+    logger.warning(
+        "Validation failed for admin job parameters",
+        extra={"context": {"errors": errors, "admin_id": get_current_user_id(), "endpoint": endpoint}},
+    )
+    return {"success": False, "errors": errors}, 400
+
 
 @admin_namespace.route("/stats")
 class AdminStats(Resource):
@@ -33,8 +87,13 @@ class AdminStats(Resource):
     @handle_integrity_error
     @admin_namespace.doc(
         description="Get comprehensive system statistics (Admin only)",
+        params={
+            "limit": f"Empty teams per page (1-{config.EMPTY_TEAMS_MAX_PAGE_SIZE}, optional)",
+            "cursor": "empty_teams_next_cursor from the previous page (optional)",
+        },
         responses={
             200: "Success - Returns detailed system statistics",
+            400: "Bad request - Validation error or invalid cursor",
             403: "Forbidden - Admin access required",
             500: "Internal Server Error",
         },
@@ -42,10 +101,29 @@ class AdminStats(Resource):
     def get(self):
         """Get detailed system stats including per event breakdowns.
 
+        Query Parameters:
+            limit (int, optional): Empty teams per page.
+            cursor (str, optional): Cursor for the next page of empty teams.
+
         Returns:
             JSON response with detailed stats and potential issues.
         """
-        result = get_detailed_stats()
+        is_valid, errors = validate_admin_stats_params(request.args)
+        if not is_valid:
+            logger.warning(
+                "Validation failed for admin stats parameters",
+                extra={
+                    "context": {
+                        "errors": errors,
+                        "admin_id": get_current_user_id(),
+                        "endpoint": "admin_stats",
+                    }
+                },
+            )
+            return {"success": False, "errors": errors}, 400
+
+        limit = int(request.args["limit"]) if request.args.get("limit") else None
+        result = get_detailed_stats(limit=limit, cursor=request.args.get("cursor"))
 
         if result["success"]:
             logger.info(
@@ -67,8 +145,10 @@ class AdminStatsCounts(Resource):
     @handle_integrity_error
     @admin_namespace.doc(
         description="Get basic data counts (Admin only)",
+        params={"approximate": "true to read row estimates from table statistics instead of counting (optional)"},
         responses={
             200: "Success - Returns data counts",
+            400: "Bad request - Validation error",
             403: "Forbidden - Admin access required",
             500: "Internal Server Error",
         },
@@ -76,10 +156,27 @@ class AdminStatsCounts(Resource):
     def get(self):
         """Get basic data counts for all plugin entities.
 
+        Query Parameters:
+            approximate (str, optional): "true" to read table statistics instead of counting rows.
+
         Returns:
             JSON response with counts of events, teams, users, and team members.
         """
-        result = get_data_counts()
+        is_valid, errors = validate_data_counts_params(request.args)
+        if not is_valid:
+            logger.warning(
+                "Validation failed for data counts parameters",
+                extra={
+                    "context": {
+                        "errors": errors,
+                        "admin_id": get_current_user_id(),
+                        "endpoint": "admin_stats_counts",
+                    }
+                },
+            )
+            return {"success": False, "errors": errors}, 400
+
+        result = get_data_counts(approximate=request.args.get("approximate") == "true")
 
         if "error" in result:
             logger.warning(
@@ -100,14 +197,64 @@ class AdminStatsCounts(Resource):
             return success_response(result)
 
 
+@admin_namespace.route("/cache/stats")
+class AdminCacheStats(Resource):
+    @admins_only
+    @admin_namespace.doc(
+        description="Get read cache hit/miss counters (Admin only)",
+        responses={
+            200: "Success - Returns cache counters per cached kind",
+            403: "Forbidden - Admin access required",
+        },
+    )
+    def get(self):
+        """Get read cache hit/miss counters, shared across workers.
+
+        Returns:
+            JSON response with hits, misses and hit rate per cached kind.
+        """
+        result = get_read_cache_stats()
+
+        logger.info(
+            "Admin accessed cache stats",
+            extra={"context": {"admin_id": get_current_user_id(), "cache": result["cache"]}},
+        )
+
+        return success_response(result)
+
+
+@admin_namespace.route("/metrics")
+class AdminMetrics(Resource):
+    @admins_only
+    @admin_namespace.doc(
+        description="Export request latency, SQL and error metrics in the Prometheus text format (Admin only)",
+        responses={
+            200: "Success - Prometheus text exposition",
+            403: "Forbidden - Admin access required",
+        },
+    )
+    def get(self):
+        """Export plugin API metrics for Prometheus, summed across this host's workers.
+
+        Returns:
+            Plain text response with per-endpoint latency histograms, SQL statement counts and
+            DB time, and error counts per namespace.
+        """
+        result = get_metrics()
+        return current_app.response_class(result["metrics"], mimetype="text/plain; version=0.0.4")
+
+
 @admin_namespace.route("/reset")
 class AdminReset(Resource):
     @admins_only
     @handle_integrity_error
     @admin_namespace.doc(
         description="Reset ALL plugin data - WARNING: This deletes everything! (Admin only)",
+        params={"background": BACKGROUND_PARAM_DOC},
         responses={
             200: "Success - All data reset",
+            202: "Accepted - Reset queued as a background job",
+            409: "Conflict - Another admin job is active",
             403: "Forbidden - Admin access required",
             500: "Internal error - Reset failed",
         },
@@ -123,6 +270,10 @@ class AdminReset(Resource):
         """
         data = request.get_json() or {}
 
+        invalid_params = _invalid_job_params("admin_reset")
+        if invalid_params:
+            return invalid_params
+
         is_valid, errors = validate_admin_reset(data)
         if not is_valid:
             logger.warning(
@@ -148,7 +299,12 @@ class AdminReset(Resource):
             },
         )
 
-        result = reset_all_plugin_data()
+        if request.args.get("background") == "true":
+            return _schedule_job("reset_all")
+
+        result, conflict = _run_job_inline("reset_all")
+        if conflict:
+            return conflict
 
         if result["success"]:
             logger.warning(
@@ -181,8 +337,11 @@ class AdminEventReset(Resource):
     @handle_integrity_error
     @admin_namespace.doc(
         description="Reset all data for a specific event (Admin only)",
+        params={"background": BACKGROUND_PARAM_DOC},
         responses={
             200: "Success - Event data reset",
+            202: "Accepted - Reset queued as a background job",
+            409: "Conflict - Another job is active for this event",
             400: "Bad request - Event does not exist",
             403: "Forbidden - Admin access required",
             500: "Internal error - Reset failed",
@@ -202,6 +361,10 @@ class AdminEventReset(Resource):
         """
         data = request.get_json() or {}
 
+        invalid_params = _invalid_job_params("admin_event_reset")
+        if invalid_params:
+            return invalid_params
+
         is_valid, errors = validate_admin_event_reset(data)
         if not is_valid:
             logger.warning(
@@ -229,7 +392,12 @@ class AdminEventReset(Resource):
             },
         )
 
-        result = reset_event_data(event_id)
+        if request.args.get("background") == "true":
+            return _schedule_job("reset_event", event_id=event_id)
+
+        result, conflict = _run_job_inline("reset_event", event_id=event_id)
+        if conflict:
+            return conflict
 
         if result["success"]:
             logger.warning(
@@ -258,14 +426,74 @@ class AdminEventReset(Resource):
             return error_response(result["error"], "reset", status_code)
 
 
+@admin_namespace.route("/events/<int:event_id>/import")
+@admin_namespace.param("event_id", "Event ID")
+@admin_namespace.param("format", "Roster format: csv or ndjson (defaults from the Content-Type)")
+class AdminEventRosterImport(Resource):
+    @admins_only
+    @handle_integrity_error
+    @admin_namespace.doc(
+        description="Bulk import teams and members into an event from a CSV or NDJSON roster (Admin only)",
+        responses={
+            200: "Success - Import finished, per-row errors included",
+            400: "Bad request - Invalid format or event does not exist",
+            403: "Forbidden - Admin access required",
+        },
+    )
+    def post(self, event_id):
+        """Bulk import a team roster into an event.
+
+        The roster is streamed from a multipart 'file' upload or the raw request body.
+        Each row is one membership with team_name, user_id, and optional role
+        ('captain' or 'member') and ranked columns/keys.
+
+        Args:
+            event_id (int): The event ID to import into.
+
+        Returns:
+            JSON response with created/added counts and per-row errors.
+        """
+        upload = request.files.get("file")
+        content_type = (upload.mimetype if upload else request.mimetype) or ""
+        fmt = request.args.get("format") or ("csv" if "csv" in content_type else "ndjson")
+
+        is_valid, errors = validate_roster_import_params({"format": fmt})
+        if not is_valid:
+            logger.warning(
+                "Validation failed for roster import",
+                extra={
+                    "context": {
+                        "errors": errors,
+                        "admin_id": get_current_user_id(),
+                        "endpoint": "admin_roster_import",
+                        "event_id": event_id,
+                    }
+                },
+            )
+            return {"success": False, "errors": errors}, 400
+
+        logger.info(
+            "Admin initiated roster import",
+            extra={"context": {"admin_id": get_current_user_id(), "event_id": event_id, "format": fmt}},
+        )
+
+        result = import_roster(event_id, upload.stream if upload else request.stream, fmt)
+
+        return controller_response(result, error_field="import")
+
+
 @admin_namespace.route("/cleanup")
 class AdminCleanup(Resource):
     @admins_only
     @handle_integrity_error
     @admin_namespace.doc(
         description="Clean up orphaned data (users with no teams, etc.) (Admin only)",
+        params={"background": BACKGROUND_PARAM_DOC},
         responses={
-            200: "Success - Cleanup completed",
+            200: "Success - Cleanup completed (or dry-run count)",
+            400: "Bad request - Validation error",
+            202: "Accepted - Cleanup queued as a background job",
+            409: "Conflict - Another admin job is active",
             403: "Forbidden - Admin access required",
             500: "Internal error - Cleanup failed",
         },
@@ -273,20 +501,60 @@ class AdminCleanup(Resource):
     def post(self):
         """Clean up orphaned data like users with no teams.
 
+        Request Body:
+            min_account_age_days (int, optional): Only remove orphans whose account is at least this old.
+            dry_run (bool, optional): Only count the orphans that would be removed.
+
         Returns:
             JSON response with cleanup results.
         """
+        invalid_params = _invalid_job_params("admin_cleanup")
+        if invalid_params:
+            return invalid_params
+
+        data = request.get_json(silent=True) or {}
+
+        is_valid, errors = validate_orphan_cleanup(data)
+        if not is_valid:
+            logger.warning(
+                "Validation failed for orphaned data cleanup",
+                extra={
+                    "context": {
+                        "errors": errors,
+                        "admin_id": get_current_user_id(),
+                        "endpoint": "admin_cleanup",
+                    }
+                },
+            )
+            return {"success": False, "errors": errors}, 400
+
+        dry_run = bool(data.get("dry_run", False))
+        min_account_age_days = int(data["min_account_age_days"]) if data.get("min_account_age_days") else None
+
         logger.warning(
             "Admin initiated cleanup operation",
             extra={
                 "context": {
                     "admin_id": get_current_user_id(),
                     "operation": "CLEANUP_ORPHANED_DATA",
+                    "min_account_age_days": min_account_age_days,
+                    "dry_run": dry_run,
                 }
             },
         )
 
-        result = cleanup_orphaned_data()
+        # A dry run is a single count, so it always answers inline
+        if request.args.get("background") == "true" and not dry_run:
+            return _schedule_job("cleanup_orphaned_data", params={"min_account_age_days": min_account_age_days})
+
+        if dry_run:
+            result = cleanup_orphaned_data(min_account_age_days=min_account_age_days, dry_run=True)
+        else:
+            result, conflict = _run_job_inline(
+                "cleanup_orphaned_data", params={"min_account_age_days": min_account_age_days}
+            )
+            if conflict:
+                return conflict
 
         if result["success"]:
             logger.warning(
@@ -294,7 +562,7 @@ class AdminCleanup(Resource):
                 extra={
                     "context": {
                         "admin_id": get_current_user_id(),
-                        "cleaned_counts": result.get("cleaned", {}),
+                        "cleaned_counts": result.get("cleaned_up", {}),
                     }
                 },
             )
@@ -318,8 +586,12 @@ class AdminCleanupHeadlessTeams(Resource):
     @handle_integrity_error
     @admin_namespace.doc(
         description="Fix teams without captains by auto-promoting oldest member (Admin only)",
+        params={"background": BACKGROUND_PARAM_DOC},
         responses={
-            200: "Success - Headless teams cleanup completed",
+            200: "Success - Headless teams cleanup completed (or dry-run report)",
+            400: "Bad request - Validation error",
+            202: "Accepted - Cleanup queued as a background job",
+            409: "Conflict - Another admin job is active",
             403: "Forbidden - Admin access required",
             500: "Internal error - Cleanup failed",
         },
@@ -330,20 +602,55 @@ class AdminCleanupHeadlessTeams(Resource):
         This endpoint finds teams that have members but no captain
         and automatically promotes the oldest member to captain role.
 
+        Request Body:
+            dry_run (bool, optional): Only list the teams that would be fixed.
+
         Returns:
             JSON response with cleanup results.
         """
+        invalid_params = _invalid_job_params("admin_cleanup_headless_teams")
+        if invalid_params:
+            return invalid_params
+
+        data = request.get_json(silent=True) or {}
+
+        is_valid, errors = validate_headless_team_cleanup(data)
+        if not is_valid:
+            logger.warning(
+                "Validation failed for headless teams cleanup",
+                extra={
+                    "context": {
+                        "errors": errors,
+                        "admin_id": get_current_user_id(),
+                        "endpoint": "admin_cleanup_headless_teams",
+                    }
+                },
+            )
+            return {"success": False, "errors": errors}, 400
+
+        dry_run = bool(data.get("dry_run", False))
+
         logger.warning(
             "Admin initiated headless teams cleanup",
             extra={
                 "context": {
                     "admin_id": get_current_user_id(),
                     "operation": "CLEANUP_HEADLESS_TEAMS",
+                    "dry_run": dry_run,
                 }
             },
         )
 
-        result = cleanup_headless_teams()
+        # A dry run is a single read, so it always answers inline
+        if request.args.get("background") == "true" and not dry_run:
+            return _schedule_job("cleanup_headless_teams")
+
+        if dry_run:
+            result = cleanup_headless_teams(dry_run=True)
+        else:
+            result, conflict = _run_job_inline("cleanup_headless_teams")
+            if conflict:
+                return conflict
 
         if result["success"]:
             logger.warning(
@@ -369,6 +676,106 @@ class AdminCleanupHeadlessTeams(Resource):
             return error_response(result.get("error", "Cleanup failed"), "cleanup", 500)
 
 
+@admin_namespace.route("/jobs")
+class AdminJobList(Resource):
+    @admins_only
+    @admin_namespace.doc(
+        description="List recent background admin jobs, newest first (Admin only)",
+        responses={
+            200: "Success - Returns recent jobs",
+            403: "Forbidden - Admin access required",
+        },
+    )
+    def get(self):
+        """List recent background admin jobs.
+
+        Returns:
+            JSON response with the most recent jobs and their status.
+        """
+        return success_response(list_admin_jobs())
+
+
+@admin_namespace.route("/jobs/<int:job_id>")
+@admin_namespace.param("job_id", "Job ID")
+class AdminJobDetail(Resource):
+    @admins_only
+    @admin_namespace.doc(
+        description="Get a background admin job's status, progress and result (Admin only)",
+        responses={
+            200: "Success - Returns the job",
+            403: "Forbidden - Admin access required",
+            404: "Not found - Job does not exist",
+        },
+    )
+    def get(self, job_id):
+        """Poll a background admin job.
+
+        Args:
+            job_id (int): The job ID.
+
+        Returns:
+            JSON response with job status, progress and result, or error details.
+        """
+        result = get_admin_job(job_id)
+        if not result["success"]:
+            return error_response(result["error"], "job", 404)
+        return success_response(result)
+
+
+@admin_namespace.route("/counters/reconcile")
+class AdminReconcileCounters(Resource):
+    @admins_only
+    @handle_integrity_error
+    @admin_namespace.doc(
+        description="Recompute stored team/event member counters and report drift (Admin only)",
+        responses={
+            200: "Success - Counters reconciled",
+            400: "Bad request - Validation error",
+            403: "Forbidden - Admin access required",
+            500: "Internal error - Reconciliation failed",
+        },
+    )
+    def post(self):
+        """Recompute the denormalized member and team counters from ng_team_members.
+
+        Request Body:
+            dry_run (bool, optional): Only report drift without repairing it.
+
+        Returns:
+            JSON response with drift counts and a sample of the drifted rows.
+        """
+        data = request.get_json(silent=True) or {}
+
+        is_valid, errors = validate_counter_reconcile(data)
+        if not is_valid:
+            logger.warning(
+                "Validation failed for counter reconciliation",
+                extra={
+                    "context": {
+                        "errors": errors,
+                        "admin_id": get_current_user_id(),
+                        "endpoint": "admin_reconcile_counters",
+                    }
+                },
+            )
+            return {"success": False, "errors": errors}, 400
+
+        result = reconcile_counters(dry_run=bool(data.get("dry_run", False)))
+
+        logger.info(
+            "Admin ran counter reconciliation",
+            extra={
+                "context": {
+                    "admin_id": get_current_user_id(),
+                    "dry_run": result.get("dry_run"),
+                    "drifted_teams": result["drift"]["teams"]["drifted"],
+                    "drifted_events": result["drift"]["events"]["drifted"],
+                }
+            },
+        )
+        return success_response(result)
+
+
 @admin_namespace.route("/health")
 class AdminHealth(Resource):
     @admins_only
@@ -378,40 +785,32 @@ class AdminHealth(Resource):
         responses={
             200: "Success - System health report",
             403: "Forbidden - Admin access required",
-            500: "Internal Server Error",
+            503: "Service unavailable - Database or data counts probe failed",
         },
     )
     def get(self):
         """Check system health and data integrity.
 
+        Serves the snapshot rebuilt in the background every config.HEALTH_SNAPSHOT_INTERVAL
+        seconds, so polling does not add database load.
+
         Returns:
-            JSON response with health report and warnings.
+            JSON response with health report, per-probe status, warnings and snapshot age.
         """
-        counts = get_data_counts()
-        detailed = get_detailed_stats()
+        health_report = get_health_snapshot()
 
-        if "error" in counts or not detailed["success"]:
+        if not health_report["success"]:
             logger.error(
                 "Admin health check failed",
                 extra={
                     "context": {
                         "admin_id": get_current_user_id(),
-                        "error": "Unable to fetch system statistics",
+                        "error": health_report["error"],
+                        "probes": health_report["probes"],
                     }
                 },
             )
-            return error_response("Unable to fetch system statistics", "health", 500)
-
-        health_report = {
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "data_counts": counts,
-            "events_count": counts["events"],
-            "empty_teams_count": detailed.get("total_empty_teams", 0),
-            "warnings": [],
-        }
-
-        health_report["warnings"] = _generate_health_warnings(counts, detailed)
+            return error_response(health_report["error"], "health", 503)
 
         logger.info(
             "Admin performed health check",
@@ -420,35 +819,33 @@ class AdminHealth(Resource):
                     "admin_id": get_current_user_id(),
                     "status": health_report["status"],
                     "warnings_count": len(health_report["warnings"]),
+                    "age_seconds": health_report["age_seconds"],
                 }
             },
         )
 
-        return success_response({"success": True, **health_report})
+        return success_response(health_report)
 
 
-def _generate_health_warnings(counts, detailed):
-    """Generate health warnings based on data counts and statistics.
-
-    Args:
-        counts: Dictionary of data counts
-        detailed: Detailed statistics dictionary
-
-    Returns:
-        list: List of warning messages
-    """
-    warnings = []
-
-    if counts["users"] > 0 and counts["team_members"] == 0:
-        warnings.append("Users exist but no team members found")
-
-    if counts["teams"] > 0 and counts["team_members"] == 0:
-        warnings.append("Teams exist but no team members found")
+@admin_namespace.route("/health/live")
+class AdminLiveness(Resource):
+    @admin_namespace.doc(
+        description="Liveness probe checking only connection pool health (no authentication, no queries)",
+        responses={
+            200: "Success - Worker can hand out database connections",
+            503: "Service unavailable - Connection pool exhausted",
+        },
+    )
+    def get(self):
+        """Report whether this worker's database connection pool has capacity.
 
-    if (
-        counts["teams"] > 0
-        and detailed.get("total_empty_teams", 0) / counts["teams"] > config.EMPTY_TEAMS_WARNING_THRESHOLD
-    ):
-        warnings.append(f"More than {int(config.EMPTY_TEAMS_WARNING_THRESHOLD * 100)}% of teams are empty")
+        Unauthenticated so load balancers can poll it; it reveals only pool usage.
 
-    return warnings
+        Returns:
+            JSON response with liveness status and pool usage.
+        """
+        result = check_liveness()
+        if not result["success"]:
+            logger.warning("Liveness check failed", extra={"context": {"pool": result["pool"]}})
+            return {"success": False, "status": result["status"], "pool": result["pool"]}, 503
+        return success_response(result)
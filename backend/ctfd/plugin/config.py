@@ -13,13 +13,75 @@ EVENT_DESCRIPTION_MAX_LENGTH = 1000
 TEAM_ROLE_MAX_LENGTH = 50
 INVITE_CODE_MAX_LENGTH = 32
 
+# Team Listing Pagination
+TEAM_LIST_DEFAULT_PAGE_SIZE = 50
+TEAM_LIST_MAX_PAGE_SIZE = 200
+TEAM_LIST_SORT_OPTIONS = ("name", "-name", "id", "-id")
+
 # Invite Code Config
 INVITE_CODE_LENGTH = 8
-INVITE_CODE_GENERATION_ATTEMPTS = 10
+INVITE_CODE_GENERATION_ATTEMPTS = 10  # Candidate batches tried per code length before growing it
+INVITE_CODE_BATCH_SURPLUS = 4  # Extra candidates drawn per batch to absorb collisions
+INVITE_CODE_LOOKUP_CHUNK_SIZE = 500  # Max candidates per IN query
+INVITE_CODE_CHANGE_TIMEOUT = 3600  # Seconds a logged code change stays replayable by other workers
+INVITE_CODE_MAX_REPLAY = 500  # Logged changes a worker replays before it rebuilds its index instead
 
 # Admin Operation Confirmations
 ADMIN_RESET_CONFIRMATION = "--confirm-reset"
 ADMIN_EVENT_RESET_CONFIRMATION = "--delete-event"
 
+# Roster Import
+ROSTER_IMPORT_FORMATS = ("csv", "ndjson")
+ROSTER_IMPORT_ROLES = ("captain", "member")
+ROSTER_IMPORT_CHUNK_SIZE = 500  # Rows validated and inserted per transaction
+ROSTER_IMPORT_MAX_REPORTED_ERRORS = 1000
+
+# Chunked Admin Deletes
+ADMIN_DELETE_CHUNK_SIZE = 1000  # Rows deleted per short transaction
+ADMIN_DELETE_CHUNK_PAUSE = 0.02  # Seconds slept between chunks so other writers get the locks
+ADMIN_DELETE_PROGRESS_TIMEOUT = 86400  # Seconds an interrupted run's progress is kept for resuming
+
+# Background Admin Jobs
+ADMIN_JOB_WORKERS = 2  # Threads per worker process running admin jobs
+ADMIN_JOB_STALE_AFTER = 900  # Seconds without a heartbeat before a running job's lock can be reclaimed
+ADMIN_JOB_HEARTBEAT_INTERVAL = 60  # Seconds between heartbeats of a running job
+ADMIN_JOB_QUEUE_TIMEOUT = 3600  # Seconds a job may wait for a pool thread before its lock can be reclaimed
+ADMIN_JOB_LIST_LIMIT = 50
+
+# Read Caching
+CACHE_KEY_PREFIX = "ng"
+READ_CACHE_TIMEOUT = 300  # Seconds; versions invalidate entries sooner on writes
+CACHED_READ_KINDS = ("team",)
+
+# Counter Reconciliation
+COUNTER_DRIFT_SAMPLE_LIMIT = 100
+
+# Headless Team Repair
+HEADLESS_TEAM_SAMPLE_LIMIT = 100  # Teams listed in the repair / dry-run report
+
+# Admin Stats
+EMPTY_TEAMS_PAGE_SIZE = 100  # Empty teams listed per /admin/stats page
+EMPTY_TEAMS_MAX_PAGE_SIZE = 1000
+
 # Health Check Thresholds
 EMPTY_TEAMS_WARNING_THRESHOLD = 0.5
+
+# Health Probes
+HEALTH_PROBE_WORKERS = 4  # Threads per worker process running health probes concurrently
+HEALTH_PROBE_TIMEOUT = 2.0  # Seconds a probe may take before it is reported as timed out
+HEALTH_APPROXIMATE_COUNTS = False  # Read table statistics instead of counting rows
+HEALTH_SNAPSHOT_INTERVAL = 30  # Seconds between background rebuilds of the cached health report
+HEALTH_SNAPSHOT_MAX_AGE = 120  # Seconds a snapshot is served before it expires and is rebuilt inline
+
+# Logging
+LOG_ASYNC = True  # Write log records from a background thread instead of inside the request
+LOG_QUEUE_SIZE = 10000  # Records buffered before new ones are dropped (and counted)
+LOG_BATCH_SIZE = 256  # Records formatted and written per stdout write
+LOG_REPEAT_WINDOW = 10  # Seconds over which repeats of one warning message are counted
+LOG_REPEAT_LIMIT = 20  # Repeats of one warning message emitted per window before the rest are suppressed
+
+# Request Metrics
+METRICS_ENABLED = True
+METRICS_FLUSH_INTERVAL = 5  # Seconds between flushes of a worker's counters into the shared store
+METRICS_STORE_PATH = None  # SQLite file shared by the workers on a host; defaults to the temp directory
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # Seconds
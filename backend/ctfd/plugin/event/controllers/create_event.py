@@ -8,11 +8,14 @@ from datetime import datetime
 
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_event
+from ...utils.query_budget import query_budget
 from ..models.Event import Event
 
 logger = get_logger(__name__)
 
 
+@query_budget(3)
 def create_event(
     name: str,
     description: str | None = None,
@@ -56,6 +59,7 @@ def create_event(
         end_time=end_time,
         locked=locked,
     )
+    bump_event(event.id)
 
     logger.info(
         "Event created successfully",
@@ -5,17 +5,16 @@ Contains the business logic to retrieve all details for a single event, includin
 
 from typing import Any
 
-from sqlalchemy import func
-from CTFd.models import db
-
 from ...utils.logger import get_logger
+from ...utils.query_budget import query_budget
 from ...team.models.Team import Team
-from ...team.models.TeamMember import TeamMember
+from ...team.controllers._query_teams_with_member_counts import _query_teams_with_member_counts
 from ..models.Event import Event
 
 logger = get_logger(__name__)
 
 
+@query_budget(1)
 def get_event_info(event_id: int) -> dict[str, Any]:
     """Gets detailed info about a event including all its teams.
 
@@ -34,21 +33,9 @@ def get_event_info(event_id: int) -> dict[str, Any]:
         )
         return {"success": False, "error": "Event not found."}
 
-    # Single join query to get teams with member counts, avoids N+1 queries
-    teams_with_counts = (
-        db.session.query(
-            Team.id,
-            Team.name,
-            Team.ranked,
-            func.count(TeamMember.id).label("member_count"),
-        )
-        .outerjoin(TeamMember, Team.id == TeamMember.team_id)
-        .filter(Team.event_id == event_id)
-        .group_by(Team.id, Team.name, Team.ranked)
-        .all()
-    )
-
-    total_members = TeamMember.query.filter_by(event_id=event_id).count()
+    # Single query reading the stored member counters, avoids N+1 queries
+    teams_query, _ = _query_teams_with_member_counts(Team.id, Team.name, Team.ranked)
+    teams_with_counts = teams_query.filter(Team.event_id == event_id).all()
 
     teams_data = [
         {
@@ -70,8 +57,8 @@ def get_event_info(event_id: int) -> dict[str, Any]:
         "start_time": event.start_time.isoformat() if event.start_time else None,
         "end_time": event.end_time.isoformat() if event.end_time else None,
         "locked": event.locked,
-        "team_count": len(teams_data),
-        "total_members": total_members,
+        "team_count": event.team_count,
+        "total_members": event.member_count,
     }
 
     logger.info(
@@ -80,8 +67,8 @@ def get_event_info(event_id: int) -> dict[str, Any]:
             "context": {
                 "event_id": event_id,
                 "event_name": event.name,
-                "team_count": len(teams_data),
-                "total_members": total_members,
+                "team_count": event.team_count,
+                "total_members": event.member_count,
             }
         },
     )
@@ -5,46 +5,33 @@ Contains the business logic to query and retrieve a list of all events with thei
 
 from typing import Any
 
-from sqlalchemy import func
 from CTFd.models import db
 
 from ...utils.logger import get_logger
-from ...team.models.Team import Team
-from ...team.models.TeamMember import TeamMember
+from ...utils.query_budget import query_budget
 from ..models.Event import Event
 
 logger = get_logger(__name__)
 
 
+@query_budget(1)
 def list_events() -> dict[str, Any]:
     """Gets all events with their team and member stats.
 
     Returns:
         dict: Success status, list of events with counts, and total event count.
     """
-    event_stats = (
-        db.session.query(
-            Event.id,
-            Event.name,
-            Event.description,
-            Event.start_time,
-            Event.end_time,
-            Event.locked,
-            func.count(Team.id.distinct()).label("team_count"),
-            func.count(TeamMember.id).label("total_members"),
-        )
-        .outerjoin(Team, Event.id == Team.event_id)
-        .outerjoin(TeamMember, Event.id == TeamMember.event_id)
-        .group_by(
-            Event.id,
-            Event.name,
-            Event.description,
-            Event.start_time,
-            Event.end_time,
-            Event.locked,
-        )
-        .all()
-    )
+    # Counts come from the denormalized counters on ng_events, no joins needed
+    event_stats = db.session.query(
+        Event.id,
+        Event.name,
+        Event.description,
+        Event.start_time,
+        Event.end_time,
+        Event.locked,
+        Event.team_count,
+        Event.member_count,
+    ).all()
 
     events_data = [
         {
@@ -11,12 +11,15 @@ from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_event
+from ...utils.query_budget import query_budget
 from ...team.models.Team import Team
 from ..models.Event import Event
 
 logger = get_logger(__name__)
 
 
+@query_budget(3)
 def update_event(
     event_id: int,
     name: str | None = None,
@@ -122,6 +125,7 @@ def update_event(
             update_data["locked"] = locked
 
         event.update_event(**update_data)
+        bump_event(event_id)
     except IntegrityError as e:
         db.session.rollback()
         logger.warning(
@@ -188,7 +192,6 @@ def _validate_max_team_size_change(event, new_max_size, changes_made):
         "new": new_max_size,
     }
 
-    affected_teams = Team.query.filter_by(event_id=event.id).count()
-    logger.info(f"Updated max team size affects {affected_teams} teams in event '{event.name}'")
+    logger.info(f"Updated max team size affects {event.team_count} teams in event '{event.name}'")
 
     return {"success": True}
@@ -18,6 +18,9 @@ class Event(db.Model):
     start_time = db.Column(db.DateTime, nullable=True)
     end_time = db.Column(db.DateTime, nullable=True)
     locked = db.Column(db.Boolean, default=False, nullable=False)
+    # Denormalized counts of ng_teams / ng_team_members rows for this event
+    team_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    member_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
     __table_args__ = (
         CheckConstraint(
@@ -74,6 +77,26 @@ class Event(db.Model):
         db.session.commit()
         return event
 
+    @classmethod
+    def adjust_counts(cls, event_id, teams=0, members=0):
+        """Shift an event's stored team/member counters in the current transaction (no commit).
+
+        The increments are applied in SQL so concurrent writers cannot lose updates.
+
+        Args:
+            event_id (int): Event ID
+            teams (int, optional): Amount to add to team_count
+            members (int, optional): Amount to add to member_count
+        """
+        values = {}
+        if teams:
+            values[cls.team_count] = cls.team_count + teams
+        if members:
+            values[cls.member_count] = cls.member_count + members
+
+        if values:
+            cls.query.filter_by(id=event_id).update(values, synchronize_session="evaluate")
+
     def update_event(self, **kwargs):
         """Update event properties and persist to database.
 
@@ -3,26 +3,33 @@
 Defines the public API routes for creating, listing, viewing, and updating events.
 """
 
-from flask import g
+from flask import g, request
 from flask_restx import Namespace, Resource
 from CTFd.utils.decorators import authed_only, admins_only
 
 from ..controllers import create_event, list_events, get_event_info, update_event
 from ...team.controllers import list_teams_in_event
+from ...team.routes.teams import team_list_filters
 from ...utils.api_responses import controller_response, error_response, success_response
-from ...utils.decorators import json_body_required, handle_integrity_error
+from ...utils.cache import ALL_EVENTS_SCOPE, version_etag
+from ...utils.decorators import conditional_get, json_body_required, handle_integrity_error
 from ...utils.logger import get_logger
 from ...utils import get_current_user_id
-from ...utils import validate_event_creation, validate_event_update
+from ...utils import validate_event_creation, validate_event_update, validate_team_list_params
 
 events_namespace = Namespace("events", description="event management operations")
 logger = get_logger(__name__)
 
 
+def _event_etag(event_id):
+    return version_etag([("event", event_id), ("event_teams", event_id)])
+
+
 @events_namespace.route("")
 class EventList(Resource):
     @authed_only
     @handle_integrity_error
+    @conditional_get(lambda: version_etag([ALL_EVENTS_SCOPE]))
     @events_namespace.doc(
         description="Get list of all training events with statistics",
         responses={
@@ -146,6 +153,7 @@ class EventList(Resource):
 class EventDetail(Resource):
     @authed_only
     @handle_integrity_error
+    @conditional_get(_event_etag)
     @events_namespace.doc(
         description="Get detailed information about a specific event including teams",
         responses={
@@ -289,25 +297,52 @@ class EventDetail(Resource):
 class EventTeams(Resource):
     @authed_only
     @handle_integrity_error
+    @conditional_get(_event_etag)
     @events_namespace.doc(
         description="Get all teams in a specific event",
+        params={
+            "limit": "Page size; enables cursor pagination (optional)",
+            "cursor": "next_cursor from the previous page (optional)",
+            "has_space": "Filter teams below max team size: true/false (optional)",
+            "ranked": "Filter ranked teams: true/false (optional)",
+            "sort": "name, -name, id or -id (optional, default name)",
+        },
         responses={
             200: "Success - Teams in event returned",
+            400: "Bad request - Invalid filters or cursor",
             403: "Forbidden - User not authenticated",
             404: "Not found - Event does not exist",
             500: "Internal Server Error",
         },
     )
     def get(self, event_id):
-        """Get all teams in the event.
+        """Get teams in the event, optionally one page at a time.
 
         Args:
             event_id (int): The event ID to list teams from.
 
+        Query Parameters:
+            Same pagination and filter parameters as GET /teams.
+
         Returns:
             JSON response with list of teams in the event or error details.
         """
-        result = list_teams_in_event(event_id)
+        is_valid, errors = validate_team_list_params({**request.args.to_dict(), "event_id": event_id})
+        if not is_valid:
+            logger.warning(
+                "Validation failed for event team list",
+                extra={
+                    "context": {
+                        "errors": errors,
+                        "user_id": get_current_user_id(),
+                        "endpoint": "event_teams",
+                        "event_id": event_id,
+                    }
+                },
+            )
+            return {"success": False, "errors": errors}, 400
+
+        result = list_teams_in_event(event_id, **team_list_filters(request.args))
 
         if result["success"]:
             logger.info(
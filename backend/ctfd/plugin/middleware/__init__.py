@@ -2,3 +2,13 @@
 /backend/ctfd/plugin/middleware/__init__.py
 Middleware package.
 """
+
+from .metrics_store import render_prometheus
+from .request_metrics import current_request_metrics, flush_metrics, init_request_metrics
+
+__all__ = [
+    "current_request_metrics",
+    "flush_metrics",
+    "init_request_metrics",
+    "render_prometheus",
+]
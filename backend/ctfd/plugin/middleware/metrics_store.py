@@ -0,0 +1,108 @@
+"""
+/backend/ctfd/plugin/middleware/metrics_store.py
+Sums metric deltas from every gunicorn worker in a host-local SQLite file and renders them for Prometheus.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Any, Iterable, Optional
+
+from .. import config
+
+# Metric family -> (type, help); histogram families also own their _bucket/_sum/_count series
+METRIC_FAMILIES = {
+    "ng_requests_total": ("counter", "Plugin API requests by endpoint, method and status."),
+    "ng_request_duration_seconds": ("histogram", "Plugin API request latency by endpoint."),
+    "ng_request_errors_total": ("counter", "Plugin API responses with status >= 400 by namespace and status class."),
+    "ng_sql_statements_total": ("counter", "SQL statements executed while serving plugin API requests."),
+    "ng_sql_duration_seconds_total": ("counter", "Time spent in SQL statements while serving plugin API requests."),
+}
+
+_HISTOGRAM_SUFFIXES = ("_bucket", "_sum", "_count")
+
+_local = threading.local()
+
+
+def store_path() -> str:
+    """Path of the shared store; every worker on the host must resolve the same file."""
+    return config.METRICS_STORE_PATH or os.path.join(tempfile.gettempdir(), "ng_plugin_metrics.sqlite")
+
+
+def _connection() -> sqlite3.Connection:
+    # One connection per thread, reopened in a forked worker or when the path changes
+    owner = (os.getpid(), store_path())
+    if getattr(_local, "owner", None) != owner:
+        connection = sqlite3.connect(owner[1], timeout=5, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS metrics ("
+            "name TEXT NOT NULL, labels TEXT NOT NULL, value REAL NOT NULL, PRIMARY KEY (name, labels))"
+        )
+        _local.connection, _local.owner = connection, owner
+    return _local.connection
+
+
+def add_samples(samples: Iterable[tuple[str, str, float]]) -> None:
+    """Add (name, labels, delta) samples to the shared totals in one transaction.
+
+    Args:
+        samples: Series name, rendered Prometheus label set and amount to add.
+    """
+    connection = _connection()
+    with connection:
+        connection.execute("BEGIN IMMEDIATE")
+        connection.executemany(
+            "INSERT INTO metrics (name, labels, value) VALUES (?, ?, ?) "
+            "ON CONFLICT (name, labels) DO UPDATE SET value = value + excluded.value",
+            samples,
+        )
+
+
+def render_prometheus() -> str:
+    """Render every stored series in the Prometheus text exposition format (version 0.0.4).
+
+    Returns:
+        str: The exposition body.
+    """
+    rows = _connection().execute("SELECT name, labels, value FROM metrics ORDER BY name, labels").fetchall()
+
+    series_by_family: dict[str, list[str]] = {family: [] for family in METRIC_FAMILIES}
+    for name, labels, value in rows:
+        family = _family_of(name)
+        if family is None:
+            continue
+        rendered_value = repr(value) if value != int(value) else str(int(value))
+        series_by_family[family].append(
+            f"{name}{{{labels}}} {rendered_value}" if labels else f"{name} {rendered_value}"
+        )
+
+    lines = []
+    for family, series in series_by_family.items():
+        if not series:
+            continue
+        metric_type, help_text = METRIC_FAMILIES[family]
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {metric_type}")
+        lines.extend(series)
+    return "\n".join(lines) + "\n"
+
+
+def _family_of(name: str) -> Optional[str]:
+    if name in METRIC_FAMILIES:
+        return name
+    for suffix in _HISTOGRAM_SUFFIXES:
+        family = name[: -len(suffix)]
+        if name.endswith(suffix) and METRIC_FAMILIES.get(family, ("",))[0] == "histogram":
+            return family
+    return None
+
+
+def format_labels(**labels: Any) -> str:
+    """Render a label set, escaping values as the exposition format requires."""
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
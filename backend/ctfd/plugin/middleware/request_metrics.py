@@ -0,0 +1,146 @@
+"""
+/backend/ctfd/plugin/middleware/request_metrics.py
+Records per-endpoint latency, SQL statement counts and DB time, and error counts for plugin API requests.
+"""
+
+import atexit
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Optional
+
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .. import config
+from ..utils.logger import get_logger
+from .metrics_store import add_samples, format_labels
+
+logger = get_logger(__name__)
+
+API_PREFIX = "/plugin/api"
+NAMESPACES = ("teams", "events", "users", "admin")
+
+# Per-worker deltas since the last flush: (series name, rendered labels) -> amount
+_buffer: defaultdict[tuple[str, str], float] = defaultdict(float)
+_buffer_lock = threading.Lock()
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def init_request_metrics(app: Flask) -> None:
+    """Install the request hooks on the app and the SQL listeners on every engine.
+
+    Safe to call more than once; listeners and hooks are only installed the first time per app.
+
+    Args:
+        app (Flask): The CTFd app the plugin is loaded into.
+    """
+    if not config.METRICS_ENABLED or app.extensions.get("ng_request_metrics"):
+        return
+    app.extensions["ng_request_metrics"] = True
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        atexit.register(flush_metrics)
+
+
+def current_request_metrics() -> Optional[dict[str, Any]]:
+    """The counters of the plugin API request being served, or None outside one."""
+    if not has_request_context():
+        return None
+    return g.get("ng_request_metrics")
+
+
+def flush_metrics() -> None:
+    """Move this worker's buffered deltas into the shared store."""
+    with _buffer_lock:
+        samples = [(name, labels, value) for (name, labels), value in _buffer.items()]
+        _buffer.clear()
+    if not samples:
+        return
+    try:
+        add_samples(samples)
+    except sqlite3.Error as e:
+        # Metrics must never fail a request; the deltas of this flush are dropped
+        logger.warning(
+            "Failed to flush request metrics",
+            extra={"context": {"error": str(e), "samples": len(samples)}},
+        )
+
+
+def _ensure_flusher() -> None:
+    # Started on first use so each gunicorn worker gets its own thread after forking
+    global _flusher
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="ng-metrics-flusher", daemon=True)
+            _flusher.start()
+
+
+def _flush_loop() -> None:
+    """Flush every interval, so an idle worker's counters are never more than one interval behind."""
+    while True:
+        time.sleep(config.METRICS_FLUSH_INTERVAL)
+        flush_metrics()
+
+
+def _start_request() -> None:
+    if request.path.startswith(API_PREFIX):
+        _ensure_flusher()
+        g.ng_request_metrics = {"started": time.perf_counter(), "sql_statements": 0, "sql_seconds": 0.0}
+
+
+def _finish_request(response):
+    metrics = g.pop("ng_request_metrics", None)
+    if metrics is None:
+        return response
+
+    duration = time.perf_counter() - metrics["started"]
+    endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    status = response.status_code
+
+    with _buffer_lock:
+        _buffer[("ng_requests_total", format_labels(endpoint=endpoint, method=request.method, status=status))] += 1
+
+        for bound in config.METRICS_LATENCY_BUCKETS:
+            if duration <= bound:
+                _buffer[("ng_request_duration_seconds_bucket", format_labels(endpoint=endpoint, le=bound))] += 1
+        _buffer[("ng_request_duration_seconds_bucket", format_labels(endpoint=endpoint, le="+Inf"))] += 1
+        _buffer[("ng_request_duration_seconds_sum", format_labels(endpoint=endpoint))] += duration
+        _buffer[("ng_request_duration_seconds_count", format_labels(endpoint=endpoint))] += 1
+
+        _buffer[("ng_sql_statements_total", format_labels(endpoint=endpoint))] += metrics["sql_statements"]
+        _buffer[("ng_sql_duration_seconds_total", format_labels(endpoint=endpoint))] += metrics["sql_seconds"]
+
+        if status >= 400:
+            labels = format_labels(namespace=_namespace_of(request.path), status_class=f"{status // 100}xx")
+            _buffer[("ng_request_errors_total", labels)] += 1
+
+    return response
+
+
+def _namespace_of(path: str) -> str:
+    segment = path[len(API_PREFIX) :].strip("/").split("/", 1)[0]
+    return segment if segment in NAMESPACES else "other"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    # Kept on the statement's execution context, which is discarded with it even when the statement raises
+    if context is not None and current_request_metrics() is not None:
+        context.ng_query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    metrics = current_request_metrics()
+    started = getattr(context, "ng_query_started", None)
+    if metrics is None or started is None:
+        return
+    metrics["sql_statements"] += 1
+    metrics["sql_seconds"] += time.perf_counter() - started
@@ -11,6 +11,7 @@ from ..team.routes.teams import teams_namespace
 from ..event.routes.events import events_namespace
 from ..user.routes.users import users_namespace
 from ..admin.routes.admin import admin_namespace
+from ..utils.serializers import output_json
 
 api_blueprint = Blueprint("plugin_api", __name__)
 
@@ -33,6 +34,7 @@ api_v1 = Api(
     security=["sessionAuth"],
 )
 
+api_v1.representation("application/json")(output_json)
 
 api_v1.add_namespace(teams_namespace, path="/teams")
 api_v1.add_namespace(events_namespace, path="/events")
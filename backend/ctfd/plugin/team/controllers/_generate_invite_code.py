@@ -5,30 +5,65 @@ Generates unique invite codes for teams.
 
 import secrets
 import string
-import uuid
 
 from ... import config
-from ...config import INVITE_CODE_GENERATION_ATTEMPTS
 from ..models.Team import Team
 
+# Remove confusing chars like 0/O and 1/I
+_INVITE_CODE_CHARACTERS = "".join(c for c in string.ascii_uppercase + string.digits if c not in "0O1I")
+
 
 # Internal use only (_ prefix); generates a unique team invite code.
 def _generate_invite_code(length: int = config.INVITE_CODE_LENGTH) -> str:
-    characters = string.ascii_uppercase + string.digits
-    characters = (
-        characters.replace("0", "").replace("O", "").replace("1", "").replace("I", "")
-    )  # Remove confusing chars like 0/O and 1/I
-
-    for attempt in range(INVITE_CODE_GENERATION_ATTEMPTS):
-        code = "".join(secrets.choice(characters) for _ in range(length))
-        if not Team.query.filter_by(invite_code=code).first():
-            return code
-
-    while True:
-        uuid_code = str(uuid.uuid4()).replace("-", "").upper()[:length]
-        if not Team.query.filter_by(invite_code=uuid_code).first():
-            return uuid_code
-
-        length += 1
-        if length > config.INVITE_CODE_MAX_LENGTH:  # Prevents runaway
-            raise RuntimeError(f"Unable to generate unique invite code (tried up to {length} characters)")
+    return _generate_invite_codes(1, length)[0]
+
+
+# Internal use only (_ prefix); generates `count` distinct invite codes for bulk team creation.
+def _generate_invite_codes(count: int, length: int = config.INVITE_CODE_LENGTH) -> list[str]:
+    """Generate invite codes that no existing team uses.
+
+    Each round draws a batch of random candidates (with a small surplus to absorb
+    collisions) and checks the whole batch with a single IN query, so allocating
+    codes normally costs one round trip however many are requested. If a round
+    keeps colliding, the code length grows by one.
+
+    Args:
+        count (int): Number of codes to generate.
+        length (int, optional): Starting code length. Defaults to config.INVITE_CODE_LENGTH.
+
+    Returns:
+        list[str]: `count` unique, unused invite codes.
+    """
+    codes: list[str] = []
+    rounds_at_length = 0
+
+    while len(codes) < count:
+        if rounds_at_length == config.INVITE_CODE_GENERATION_ATTEMPTS:
+            length += 1
+            rounds_at_length = 0
+            if length > config.INVITE_CODE_MAX_LENGTH:  # Prevents runaway
+                raise RuntimeError(f"Unable to generate unique invite code (tried up to {length - 1} characters)")
+
+        needed = count - len(codes)
+        candidates = {
+            "".join(secrets.choice(_INVITE_CODE_CHARACTERS) for _ in range(length))
+            for _ in range(needed + config.INVITE_CODE_BATCH_SURPLUS)
+        }
+        candidates.difference_update(codes)
+
+        available = candidates - _existing_invite_codes(candidates)
+        codes.extend(list(available)[:needed])
+        rounds_at_length += 1
+
+    return codes
+
+
+def _existing_invite_codes(candidates: set[str]) -> set[str]:
+    """Return the subset of candidates already used by a team, one query per lookup chunk."""
+    ordered = list(candidates)
+    taken = set()
+    for start in range(0, len(ordered), config.INVITE_CODE_LOOKUP_CHUNK_SIZE):
+        chunk = ordered[start : start + config.INVITE_CODE_LOOKUP_CHUNK_SIZE]
+        rows = Team.query.with_entities(Team.invite_code).filter(Team.invite_code.in_(chunk)).all()
+        taken.update(code for (code,) in rows)
+    return taken
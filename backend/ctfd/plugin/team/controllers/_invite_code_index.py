@@ -0,0 +1,105 @@
+"""
+/backend/ctfd/plugin/team/controllers/_invite_code_index.py
+Per-worker index of invite codes so joins can reject unknown codes without a query.
+"""
+
+import threading
+from typing import Iterable, Optional
+
+from CTFd.cache import cache
+from CTFd.models import db
+
+from ... import config
+from ...utils.cache import PLUGIN_SCOPE, bump_version, get_versions
+from ..models.Team import Team
+
+# Sequence of logged code changes; each bump numbers one change log entry
+INVITE_CODE_CHANGES_SCOPE = ("invite_code_changes", 0)
+
+_lock = threading.Lock()
+_index: dict[str, tuple[int, int]] = {}
+_plugin_version: Optional[int] = None
+_applied_sequence: Optional[int] = None
+
+
+def _change_key(sequence: int) -> str:
+    return f"{config.CACHE_KEY_PREFIX}:invite_code_change:{sequence}"
+
+
+# Internal use only (_ prefix); call after committing new or rotated invite codes.
+def _record_invite_codes(added: Iterable[tuple[str, int, int]], removed: Iterable[str] = ()) -> None:
+    """Log committed code changes so every worker can apply them to its index.
+
+    Args:
+        added (Iterable): (invite_code, team_id, event_id) for new or rotated-in codes.
+        removed (Iterable[str], optional): Codes rotated out.
+    """
+    changes = [(code.upper(), None) for code in removed]
+    changes += [(code.upper(), (team_id, event_id)) for code, team_id, event_id in added]
+    if not changes:
+        return
+    sequence = bump_version(*INVITE_CODE_CHANGES_SCOPE)
+    cache.set(_change_key(sequence), changes, timeout=config.INVITE_CODE_CHANGE_TIMEOUT)
+
+
+# Internal use only (_ prefix); resolves an invite code to (team_id, event_id).
+def _lookup_invite_code(invite_code: str) -> Optional[tuple[int, int]]:
+    """Look an invite code up in this worker's index, replaying changes other workers logged.
+
+    A current index costs one shared-cache read and no database query, for hits and
+    misses alike. Changes logged since the last lookup are applied from the shared
+    cache one entry each. The index is only rebuilt from ng_teams after a plugin-wide
+    change (resets, repairs), or when log entries are missing or too many to replay.
+    Codes are matched case-insensitively, like the column collation in production.
+    A hit can be stale if the team was deleted since, so callers must re-check the
+    code when loading the team.
+
+    Args:
+        invite_code (str): The code a user submitted.
+
+    Returns:
+        tuple[int, int] | None: (team_id, event_id), or None if no team uses the code.
+    """
+    if not invite_code:
+        return None
+
+    # Read the versions before any rows so a change logged meanwhile is replayed next time
+    plugin_version, sequence = get_versions([PLUGIN_SCOPE, INVITE_CODE_CHANGES_SCOPE])
+    with _lock:
+        if plugin_version != _plugin_version or not _replay_changes(sequence):
+            _rebuild_index(plugin_version, sequence)
+        return _index.get(invite_code.upper())
+
+
+def _replay_changes(sequence: int) -> bool:
+    """Apply the logged changes up to sequence; False if the index must be rebuilt instead."""
+    global _applied_sequence
+
+    if _applied_sequence is None or sequence < _applied_sequence:
+        return False  # Never built, or the counter was evicted and re-seeded
+    if sequence == _applied_sequence:
+        return True
+    if sequence - _applied_sequence > config.INVITE_CODE_MAX_REPLAY:
+        return False
+
+    entries = cache.get_many(*[_change_key(number) for number in range(_applied_sequence + 1, sequence + 1)])
+    if any(entry is None for entry in entries):
+        return False  # Expired, evicted or not written yet
+    for changes in entries:
+        for code, target in changes:
+            if target is None:
+                _index.pop(code, None)
+            else:
+                _index[code] = target
+    _applied_sequence = sequence
+    return True
+
+
+def _rebuild_index(plugin_version: int, sequence: int) -> None:
+    global _index, _plugin_version, _applied_sequence
+
+    _index = {
+        code.upper(): (team_id, event_id)
+        for code, team_id, event_id in db.session.query(Team.invite_code, Team.id, Team.event_id).all()
+    }
+    _plugin_version, _applied_sequence = plugin_version, sequence
@@ -0,0 +1,29 @@
+"""
+/backend/ctfd/plugin/team/controllers/_query_teams_with_member_counts.py
+Shared read path for team rows with their member counts.
+"""
+
+from CTFd.models import db
+
+from ..models.Team import Team
+
+
+# Internal use only (_ prefix); every team listing should go through this instead of loading Team.members.
+def _query_teams_with_member_counts(*columns):
+    """Build a query returning the given columns plus member_count, one row per team.
+
+    member_count is read from the denormalized ng_teams.member_count counter, so a
+    listing of N teams costs one statement with no join against ng_team_members.
+
+    Args:
+        *columns: Team (or joined table) columns to select.
+
+    Returns:
+        tuple: (query, member_count) where member_count is the column expression,
+            usable in WHERE and ORDER BY clauses.
+    """
+    member_count = Team.member_count
+
+    query = db.session.query(*columns, member_count.label("member_count")).select_from(Team)
+
+    return query, member_count
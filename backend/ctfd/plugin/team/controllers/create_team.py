@@ -7,16 +7,20 @@ from datetime import datetime
 from typing import Any
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_team
+from ...utils.query_budget import query_budget
 from ...event.models.Event import Event
 from ...user.models.User import User
 from ..models.Team import Team
 from ..models.TeamMember import TeamMember
 from ..models.enums import TeamRole
 from ._generate_invite_code import _generate_invite_code
+from ._invite_code_index import _record_invite_codes
 
 logger = get_logger(__name__)
 
 
+@query_budget(11)
 def create_team(
     name: str,
     event_id: int,
@@ -97,6 +101,8 @@ def create_team(
             "error": "You are already in a team for this event.",
         }
 
+    # Read before the commit below expires the event and team
+    event_name = event.name
     invite_code = _generate_invite_code()
 
     team = Team.create_team(
@@ -106,6 +112,7 @@ def create_team(
         invite_code=invite_code,
         flush_only=True,
     )
+    team_id = team.id
 
     ng_user = User.query.get(creator_id)
     if not ng_user:
@@ -113,20 +120,22 @@ def create_team(
 
     TeamMember.create_team_member(
         user_id=creator_id,
-        team_id=team.id,
+        team_id=team_id,
         event_id=event_id,
         role=TeamRole.CAPTAIN,
         joined_at=datetime.utcnow(),
     )
+    bump_team(team_id, event_id)
+    _record_invite_codes([(invite_code, team_id, event_id)])
 
     logger.info(
         "Team created successfully",
         extra={
             "context": {
-                "team_id": team.id,
+                "team_id": team_id,
                 "team_name": name,
                 "event_id": event_id,
-                "event_name": event.name,
+                "event_name": event_name,
                 "creator_id": creator_id,
                 "invite_code": invite_code,
                 "ranked": ranked,
@@ -138,5 +147,5 @@ def create_team(
         "success": True,
         "team": team,
         "invite_code": invite_code,
-        "message": f"Team '{name}' created successfully in {event.name}",
+        "message": f"Team '{name}' created successfully in {event_name}",
     }
@@ -6,6 +6,8 @@ Disbands a team and removes all its members.
 from typing import Any
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_team
+from ...utils.query_budget import query_budget
 from ..models.Team import Team
 from ..models.TeamMember import TeamMember
 from ..models.enums import TeamRole
@@ -13,6 +15,7 @@ from ..models.enums import TeamRole
 logger = get_logger(__name__)
 
 
+@query_budget(5)
 def disband_team(team_id: int, actor_id: int, is_admin: bool = False) -> dict[str, Any]:
     """Deletes a team and all its team members.
 
@@ -54,9 +57,9 @@ def disband_team(team_id: int, actor_id: int, is_admin: bool = False) -> dict[st
 
     team_name = team.name
     event_id = team.event_id
-    member_count = team.member_count
 
-    team.disband_team()
+    member_count = team.disband_team()
+    bump_team(team_id, event_id)
 
     logger.info(
         "Team disbanded successfully",
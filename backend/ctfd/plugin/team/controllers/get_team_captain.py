@@ -5,7 +5,7 @@ Retrieves information about the current captain of a team.
 
 from typing import Any
 
-from CTFd.models import Users
+from ...user.controllers._resolve_user_names import _resolve_user_names
 from ..models.TeamMember import TeamMember
 from ..models.enums import TeamRole
 
@@ -22,8 +22,7 @@ def get_team_captain(team_id: int) -> dict[str, Any]:
     captain = TeamMember.query.filter_by(team_id=team_id, role=TeamRole.CAPTAIN).first()
 
     if captain:
-        captain_user = Users.query.filter_by(id=captain.user_id).first()
-        captain_name = captain_user.name if captain_user else f"User ID {captain.user_id}"
+        captain_name = _resolve_user_names([captain.user_id])[captain.user_id]
 
         return {
             "success": True,
@@ -5,41 +5,101 @@ Retrieves detailed information about a team and its members.
 
 from typing import Any
 
+from CTFd.models import Users, db
+
+from ...utils.cache import cached_read
+from ...utils.query_budget import query_budget
 from ...event.models.Event import Event
+from ...user.controllers._resolve_user_names import _fallback_user_name
 from ..models.Team import Team
 from ..models.TeamMember import TeamMember
+from ..models.enums import TeamRole
 
 
+@query_budget(1)
 def get_team_info(team_id: int) -> dict[str, Any]:
     """Gets detailed info about a team.
 
+    Served from the read cache until the team's or its event's version is bumped
+    by a mutating controller. Member display names come from CTFd and may lag a
+    rename by up to config.READ_CACHE_TIMEOUT.
+
     Args:
         team_id (int): The team ID to get info for.
 
     Returns:
         dict: Success status, team details, and membership info.
     """
-    team = Team.query.get(team_id)
-    if not team:
+    return cached_read(
+        "team",
+        team_id,
+        lambda: _load_team_info(team_id),
+        dependencies=lambda result: [("event", result["team"]["event_id"])],
+    )
+
+
+def _load_team_info(team_id: int) -> dict[str, Any]:
+    """Build the get_team_info payload from the database.
+
+    Team, event, members and their CTFd names come back from one joined query: one
+    row per member, or a single row with NULL member columns for an empty team.
+    """
+    rows = (
+        db.session.query(
+            Team.id,
+            Team.name,
+            Team.event_id,
+            Team.invite_code,
+            Team.ranked,
+            Event.name.label("event_name"),
+            Event.max_team_size.label("max_team_size"),
+            TeamMember.user_id,
+            TeamMember.joined_at,
+            TeamMember.role,
+            Users.name.label("user_name"),
+        )
+        .outerjoin(Event, Event.id == Team.event_id)
+        .outerjoin(TeamMember, TeamMember.team_id == Team.id)
+        .outerjoin(Users, Users.id == TeamMember.user_id)
+        .filter(Team.id == team_id)
+        .order_by(TeamMember.joined_at, TeamMember.user_id)
+        .all()
+    )
+    if not rows:
         return {"success": False, "error": "Team not found."}
 
-    event = Event.query.get(team.event_id)
-    team_members = TeamMember.query.filter_by(team_id=team_id).all()
+    team = rows[0]
+    team_members = [
+        {
+            "user_id": row.user_id,
+            "name": row.user_name or _fallback_user_name(row.user_id),
+            "joined_at": row.joined_at,
+            "role": row.role,
+        }
+        for row in rows
+        if row.user_id is not None
+    ]
+    captain = next((member for member in team_members if member["role"] == TeamRole.CAPTAIN), None)
+
+    member_count = len(team_members)
+    max_team_size = team.max_team_size or 0
 
     team_data = {
         "id": team.id,
         "name": team.name,
         "event_id": team.event_id,
-        "event_name": event.name if event else "Unknown",
-        "member_count": team.member_count,
-        "max_team_size": event.max_team_size if event else 0,
-        "is_full": team.member_count >= (event.max_team_size if event else 0),
+        "event_name": team.event_name or "Unknown",
+        "member_count": member_count,
+        "max_team_size": max_team_size,
+        "is_full": member_count >= max_team_size,
         "invite_code": team.invite_code,
         "ranked": team.ranked,
+        "captain_id": captain["user_id"] if captain else None,
+        "captain_name": captain["name"] if captain else None,
     }
 
     return {
         "success": True,
         "team": team_data,
-        "team_members": [{"user_id": m.user_id, "joined_at": m.joined_at, "role": m.role} for m in team_members],
+        "team_members": team_members,
     }
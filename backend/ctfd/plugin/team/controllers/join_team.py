@@ -6,19 +6,30 @@ Allows a user to join a team using an invite code.
 from datetime import datetime
 from typing import Any
 
+from CTFd.models import db
+from sqlalchemy.exc import IntegrityError
+
 from ...utils.logger import get_logger
+from ...utils.cache import bump_team
+from ...utils.query_budget import query_budget
 from ...event.models.Event import Event
 from ...user.models.User import User
 from ..models.Team import Team
 from ..models.TeamMember import TeamMember
 from ..models.enums import TeamRole
+from ._invite_code_index import _lookup_invite_code
 
 logger = get_logger(__name__)
 
 
+@query_budget(10)
 def join_team(user_id: int, invite_code: str) -> dict[str, Any]:
     """Join a team - using invite code.
 
+    Capacity is enforced by Team.claim_seat's conditional UPDATE and duplicate
+    memberships by the uq_user_event constraint, so concurrent joins can neither
+    overfill a team nor put a user in two teams of one event.
+
     Args:
         user_id (int): The user ID joining the team.
         invite_code (str): The team's invite code.
@@ -34,24 +45,42 @@ def join_team(user_id: int, invite_code: str) -> dict[str, Any]:
     team = team_validation["team"]
     event = team_validation["event"]
 
-    # Validate team join eligibility
+    # Fail fast on the values just read; the seat claim below re-checks them atomically
     eligibility_check = _validate_team_join_eligibility(team, event, user_id, invite_code)
     if not eligibility_check["success"]:
         return eligibility_check
 
-    # Validate user and existing membership
-    user_validation = _validate_user_membership(user_id, team.event_id, team, invite_code)
-    if not user_validation["success"]:
-        return user_validation
+    if not User.query.get(user_id):
+        User.create_user(user_id, commit=False)
 
     role = TeamRole.MEMBER
-    team_member = TeamMember.create_team_member(
-        user_id=user_id,
-        team_id=team.id,
-        event_id=team.event_id,
-        joined_at=datetime.utcnow(),
-        role=role,
-    )
+    try:
+        team_member = TeamMember.join_team_with_seat(
+            user_id=user_id,
+            team_id=team.id,
+            event_id=team.event_id,
+            max_team_size=event.max_team_size,
+            joined_at=datetime.utcnow(),
+            role=role,
+        )
+    except IntegrityError:
+        existing_membership_error = _existing_membership_error(user_id, team.event_id, team, invite_code)
+        if existing_membership_error is None:
+            raise
+        return existing_membership_error
+
+    if team_member is None:
+        # Another join (or a lock) won the race since the read above
+        db.session.refresh(team)
+        eligibility_check = _validate_team_join_eligibility(team, event, user_id, invite_code)
+        if eligibility_check["success"]:
+            eligibility_check = {
+                "success": False,
+                "error": f"Team {team.name} is full ({event.max_team_size}/{event.max_team_size})",
+            }
+        return eligibility_check
+
+    bump_team(team.id, team.event_id)
 
     logger.info(
         "User successfully joined team via invite code",
@@ -87,12 +116,24 @@ def _validate_team_exists(invite_code, user_id):
     Returns:
         dict: Success status, team and event objects, or error
     """
-    team = Team.query.filter_by(invite_code=invite_code).first()
-    if not team:
+    # Unknown codes (typos, guessing) are rejected from the in-memory index without a query
+    indexed = _lookup_invite_code(invite_code)
+
+    # Team and event in one round trip; the code is re-checked in case it was rotated
+    row = None
+    if indexed:
+        row = (
+            db.session.query(Team, Event)
+            .join(Event, Event.id == Team.event_id)
+            .filter(Team.id == indexed[0], Team.invite_code == invite_code)
+            .first()
+        )
+    if not row:
+        # Guessing floods this branch: context is built lazily and repeats are rate limited
         logger.warning(
             "Team join failed - invalid invite code",
             extra={
-                "context": {
+                "context": lambda: {
                     "invite_code": invite_code,
                     "user_id": user_id,
                 }
@@ -100,7 +141,7 @@ def _validate_team_exists(invite_code, user_id):
         )
         return {"success": False, "error": "Invalid invite code"}
 
-    event = Event.query.get(team.event_id)
+    team, event = row
     return {"success": True, "team": team, "event": event}
 
 
@@ -121,7 +162,7 @@ def _validate_team_join_eligibility(team, event, user_id, invite_code):
         logger.warning(
             "Team join failed - event is locked",
             extra={
-                "context": {
+                "context": lambda: {
                     "team_id": team.id,
                     "team_name": team.name,
                     "event_id": team.event_id,
@@ -141,7 +182,7 @@ def _validate_team_join_eligibility(team, event, user_id, invite_code):
         logger.warning(
             "Team join failed - team is locked",
             extra={
-                "context": {
+                "context": lambda: {
                     "team_id": team.id,
                     "team_name": team.name,
                     "event_id": team.event_id,
@@ -160,7 +201,7 @@ def _validate_team_join_eligibility(team, event, user_id, invite_code):
         logger.warning(
             "Team join failed - team is full",
             extra={
-                "context": {
+                "context": lambda: {
                     "team_id": team.id,
                     "team_name": team.name,
                     "event_id": team.event_id,
@@ -179,8 +220,8 @@ def _validate_team_join_eligibility(team, event, user_id, invite_code):
     return {"success": True}
 
 
-def _validate_user_membership(user_id, event_id, team, invite_code):
-    """Validate user doesn't already belong to another team in this event.
+def _existing_membership_error(user_id, event_id, team, invite_code):
+    """Build the error for a join rejected by uq_user_event.
 
     Args:
         user_id (int): User ID
@@ -189,33 +230,32 @@ def _validate_user_membership(user_id, event_id, team, invite_code):
         invite_code (str): Invite code for logging
 
     Returns:
-        dict: Success status and user object, or error message
+        dict: Error message, or None if the user has no membership in this event
     """
-    user = User.query.get(user_id)
-    if not user:
-        user = User.create_user(user_id, commit=False)
-
-    existing_team_member = TeamMember.query.filter_by(user_id=user_id, event_id=event_id).first()
-
-    if existing_team_member:
-        existing_team = Team.query.get(existing_team_member.team_id)
-        logger.warning(
-            "Team join failed - user already in team",
-            extra={
-                "context": {
-                    "user_id": user_id,
-                    "event_id": event_id,
-                    "existing_team_id": existing_team_member.team_id,
-                    "existing_team_name": existing_team.name if existing_team else "Unknown",
-                    "requested_team_id": team.id,
-                    "requested_team_name": team.name,
-                    "invite_code": invite_code,
-                }
-            },
-        )
-        return {
-            "success": False,
-            "error": f"User is already in team '{existing_team.name}' for this event",
-        }
+    existing_team = (
+        db.session.query(Team)
+        .join(TeamMember, TeamMember.team_id == Team.id)
+        .filter(TeamMember.user_id == user_id, TeamMember.event_id == event_id)
+        .first()
+    )
+    if not existing_team:
+        return None
 
-    return {"success": True, "user": user}
+    logger.warning(
+        "Team join failed - user already in team",
+        extra={
+            "context": lambda: {
+                "user_id": user_id,
+                "event_id": event_id,
+                "existing_team_id": existing_team.id,
+                "existing_team_name": existing_team.name,
+                "requested_team_id": team.id,
+                "requested_team_name": team.name,
+                "invite_code": invite_code,
+            }
+        },
+    )
+    return {
+        "success": False,
+        "error": f"User is already in team '{existing_team.name}' for this event",
+    }
@@ -7,6 +7,8 @@ from typing import Any
 from datetime import datetime
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_team
+from ...utils.query_budget import query_budget
 from ...event.models.Event import Event
 from ..models.Team import Team
 from ..models.TeamMember import TeamMember
@@ -15,6 +17,7 @@ from ..models.enums import TeamRole
 logger = get_logger(__name__)
 
 
+@query_budget(5)
 def leave_team(user_id: int, event_id: int) -> dict[str, Any]:
     """Removes a user from their current team in the event.
 
@@ -80,9 +83,7 @@ def leave_team(user_id: int, event_id: int) -> dict[str, Any]:
 
     if team_member.role == TeamRole.CAPTAIN:
         team = Team.query.get(team_member.team_id)
-        other_members_count = TeamMember.query.filter(
-            TeamMember.team_id == team.id, TeamMember.id != team_member.id
-        ).count()
+        other_members_count = team.member_count - 1
 
         if other_members_count > 0:
             return {
@@ -91,7 +92,9 @@ def leave_team(user_id: int, event_id: int) -> dict[str, Any]:
             }
         else:
             team_name = team.name
+            team_id = team.id
             team.disband_team()
+            bump_team(team_id, event_id)
             return {
                 "success": True,
                 "message": f"You have left and disbanded '{team_name}' as you were the last member.",
@@ -101,6 +104,7 @@ def leave_team(user_id: int, event_id: int) -> dict[str, Any]:
     team_name = team.name if team else "Unknown Team"
 
     team_member.remove_team_member()
+    bump_team(team_member.team_id, event_id)
 
     logger.info(
         "User successfully left team",
@@ -5,18 +5,42 @@ Retrieves a list of all teams within a specific event.
 
 from typing import Any
 
+from sqlalchemy import and_, or_
+
+from ... import config
 from ...event.models.Event import Event
+from ...utils.pagination import decode_cursor, encode_cursor
+from ...utils.query_budget import query_budget
 from ..models.Team import Team
+from ._query_teams_with_member_counts import _query_teams_with_member_counts
+
 
+@query_budget(1)
+def list_teams_in_event(
+    event_id: int,
+    limit: int | None = None,
+    cursor: str | None = None,
+    has_space: bool | None = None,
+    ranked: bool | None = None,
+    sort: str = "name",
+) -> dict[str, Any]:
+    """Gets teams in a event with their basic info.
 
-def list_teams_in_event(event_id: int) -> dict[str, Any]:
-    """Gets all teams in a event with their basic info.
+    Without a limit or cursor every team is returned. With either, results are
+    keyset paginated on (event_id, name, id) so each page costs the same no matter
+    how many teams the event has.
 
     Args:
         event_id (int): The event ID to list teams from.
+        limit (int, optional): Page size. Defaults to config.TEAM_LIST_DEFAULT_PAGE_SIZE when a cursor is given.
+        cursor (str, optional): The next_cursor value from a previous page.
+        has_space (bool, optional): Only teams that are (True) or are not (False) below max_team_size.
+        ranked (bool, optional): Only ranked (True) or unranked (False) teams.
+        sort (str, optional): One of config.TEAM_LIST_SORT_OPTIONS. Defaults to "name".
 
     Returns:
-        dict: Success status, list of teams with stats, and event info.
+        dict: Success status, list of teams with stats, event info (total_teams counts every
+            team in the event, whatever the page or filters), and next page cursor.
     """
     event = Event.query.get(event_id)
     if not event:
@@ -25,25 +49,98 @@ def list_teams_in_event(event_id: int) -> dict[str, Any]:
             "error": f"Event with ID {event_id} does not exist",
         }
 
-    teams = Team.query.filter_by(event_id=event_id).all()
-
-    team_list = []
-    for team in teams:
-        team_list.append(
-            {
-                "id": team.id,
-                "name": team.name,
-                "member_count": team.member_count,
-                "max_team_size": event.max_team_size,
-                "is_full": team.member_count >= event.max_team_size,
-                "invite_code": team.invite_code,
-                "ranked": team.ranked,
-            }
-        )
+    if sort not in config.TEAM_LIST_SORT_OPTIONS:
+        return {"success": False, "error": f"Unsupported sort option '{sort}'"}
+
+    descending = sort.startswith("-")
+    sort_by_name = sort.lstrip("-") == "name"
+
+    query, member_count = _query_teams_with_member_counts(
+        Team.id,
+        Team.name,
+        Team.invite_code,
+        Team.ranked,
+    )
+    query = query.filter(Team.event_id == event_id)
+
+    if ranked is not None:
+        query = query.filter(Team.ranked.is_(ranked))
+
+    if has_space is True:
+        query = query.filter(member_count < event.max_team_size)
+    elif has_space is False:
+        query = query.filter(member_count >= event.max_team_size)
+
+    if cursor is not None:
+        keyset_filter = _keyset_filter(cursor, sort, sort_by_name, descending)
+        if keyset_filter is None:
+            return {"success": False, "error": "Invalid or expired cursor"}
+        query = query.filter(keyset_filter)
+
+    if sort_by_name:
+        order_columns = (Team.name, Team.id)
+    else:
+        order_columns = (Team.id,)
+    query = query.order_by(*[column.desc() if descending else column.asc() for column in order_columns])
+
+    paginated = limit is not None or cursor is not None
+    if paginated:
+        limit = limit or config.TEAM_LIST_DEFAULT_PAGE_SIZE
+        # Fetch one extra row to know whether another page exists
+        rows = query.limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+    else:
+        rows = query.all()
+        has_more = False
+
+    team_list = [
+        {
+            "id": row.id,
+            "name": row.name,
+            "member_count": row.member_count,
+            "max_team_size": event.max_team_size,
+            "is_full": row.member_count >= event.max_team_size,
+            "invite_code": row.invite_code,
+            "ranked": row.ranked,
+        }
+        for row in rows
+    ]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor([sort, last.name, last.id] if sort_by_name else [sort, last.id])
 
     return {
         "success": True,
         "teams": team_list,
         "event_name": event.name,
-        "total_teams": len(team_list),
+        # Denormalized counter on the already loaded event, so paging never needs a COUNT(*)
+        "total_teams": event.team_count,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
     }
+
+
+def _keyset_filter(cursor, sort, sort_by_name, descending):
+    """Build the WHERE clause that resumes a listing after the cursor's row.
+
+    Returns:
+        The SQLAlchemy filter expression, or None if the cursor is invalid for this sort.
+    """
+    values = decode_cursor(cursor)
+    if not values or values[0] != sort:
+        return None
+
+    if sort_by_name:
+        if len(values) != 3 or not isinstance(values[1], str) or not isinstance(values[2], int):
+            return None
+        last_name, last_id = values[1], values[2]
+        if descending:
+            return or_(Team.name < last_name, and_(Team.name == last_name, Team.id < last_id))
+        return or_(Team.name > last_name, and_(Team.name == last_name, Team.id > last_id))
+
+    if len(values) != 2 or not isinstance(values[1], int):
+        return None
+    return Team.id < values[1] if descending else Team.id > values[1]
@@ -12,10 +12,15 @@ from ..models.Team import Team
 from ..models.TeamMember import TeamMember
 from ..models.enums import TeamRole
 from ...utils.logger import get_logger
+from ...utils.cache import bump_team
+from ...utils.query_budget import query_budget
+from ._generate_invite_code import _generate_invite_code
+from ._invite_code_index import _record_invite_codes
 
 logger = get_logger(__name__)
 
 
+@query_budget(9)
 def remove_member(team_id: int, member_to_remove_id: int, actor_id: int, is_admin: bool = False) -> dict[str, Any]:
     """Removes a member from a team with auth checks.
 
@@ -69,17 +74,23 @@ def remove_member(team_id: int, member_to_remove_id: int, actor_id: int, is_admi
     if team_member_to_remove.role == TeamRole.CAPTAIN:
         return _handle_captain_removal(team, team_member_to_remove, actor_id, is_admin)
 
+    # Read before the commit below expires the team
+    event_id, old_code, new_code = team.event_id, team.invite_code, _generate_invite_code()
     team_member_to_remove.remove_team_member(commit=False)
-    team.update_invite_code(commit=True)
+    team.update_invite_code(new_code, commit=True)
+    bump_team(team_id, event_id)
+    _record_invite_codes([(new_code, team_id, event_id)], removed=[old_code])
     return {"success": True, "message": "Team member removed successfully."}
 
 
 def _handle_captain_removal(team: Team, captain_to_remove: TeamMember, actor_id: int, is_admin: bool):
     """Smartly handles captain removal by either auto promoting or blocking."""
+    # Read before the commits below expire the rows
+    team_id, event_id, removed_user_id = team.id, team.event_id, captain_to_remove.user_id
 
     remaining_members = (
         TeamMember.query.filter(
-            TeamMember.team_id == team.id,
+            TeamMember.team_id == team_id,
             TeamMember.id != captain_to_remove.id,
             TeamMember.role == TeamRole.MEMBER,
         )
@@ -89,22 +100,23 @@ def _handle_captain_removal(team: Team, captain_to_remove: TeamMember, actor_id:
 
     if not remaining_members:
         captain_to_remove.remove_team_member()
-        logger.info(f"Captain removed, team {team.id} is now empty.")
+        bump_team(team_id, event_id)
+        logger.info(f"Captain removed, team {team_id} is now empty.")
         return {"success": True, "message": "Captain removed. The team is now empty."}
 
     if is_admin:
         new_captain = remaining_members[0]
+        new_captain_id = new_captain.user_id
         new_captain.update_role(TeamRole.CAPTAIN, commit=False)
         captain_to_remove.remove_team_member(commit=False)
         db.session.commit()
+        bump_team(team_id, event_id)
 
-        logger.info(
-            f"Admin removed captain {captain_to_remove.user_id} from team {team.id}, auto-promoted {new_captain.user_id}."
-        )
+        logger.info(f"Admin removed captain {removed_user_id} from team {team_id}, auto-promoted {new_captain_id}.")
         return {
             "success": True,
-            "message": f"Captain removed. User {new_captain.user_id} has been automatically promoted to captain.",
-            "new_captain_id": new_captain.user_id,
+            "message": f"Captain removed. User {new_captain_id} has been automatically promoted to captain.",
+            "new_captain_id": new_captain_id,
         }
     else:
         return {
@@ -3,10 +3,12 @@
 Transfers captain role from current captain to another member.
 """
 
-from CTFd.models import Users
 from typing import Any
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_team
+from ...utils.query_budget import query_budget
+from ...user.controllers._resolve_user_names import _resolve_user_names
 from ..models.Team import Team
 from ..models.TeamMember import TeamMember
 from ..models.enums import TeamRole
@@ -14,6 +16,7 @@ from ..models.enums import TeamRole
 logger = get_logger(__name__)
 
 
+@query_budget(6)
 def transfer_captaincy(team_id: int, new_captain_id: int, actor_id: int, is_admin: bool = False) -> dict[str, Any]:
     """Transfers captain role from current captain to another member.
 
@@ -79,21 +82,24 @@ def transfer_captaincy(team_id: int, new_captain_id: int, actor_id: int, is_admi
     existing_captain = TeamMember.query.filter_by(team_id=team_id, role=TeamRole.CAPTAIN).first()
     old_captain_id = existing_captain.user_id if existing_captain else None
 
+    # Read before the commit below expires the team
+    team_name, event_id = team.name, team.event_id
+
     if existing_captain:
         existing_captain.update_role(TeamRole.MEMBER, commit=False)
 
     new_captain_team_member.update_role(TeamRole.CAPTAIN, commit=True)
+    bump_team(team_id, event_id)
 
     # Get the new captain's name for user friendly message (optional)
-    new_captain_user = Users.query.filter_by(id=new_captain_id).first()
-    new_captain_name = new_captain_user.name if new_captain_user else f"User ID {new_captain_id}"
+    new_captain_name = _resolve_user_names([new_captain_id])[new_captain_id]
 
     logger.info(
         "Captain transferred successfully",
         extra={
             "context": {
                 "team_id": team_id,
-                "team_name": team.name,
+                "team_name": team_name,
                 "old_captain_id": old_captain_id,
                 "new_captain_id": new_captain_id,
                 "new_captain_name": new_captain_name,
@@ -105,7 +111,7 @@ def transfer_captaincy(team_id: int, new_captain_id: int, actor_id: int, is_admi
 
     return {
         "success": True,
-        "message": f"'{new_captain_name}' is now captain of '{team.name}'",
-        "team_id": team.id,
+        "message": f"'{new_captain_name}' is now captain of '{team_name}'",
+        "team_id": team_id,
         "captain_id": new_captain_id,
     }
@@ -6,6 +6,8 @@ Updates team information with proper authorization checks.
 from typing import Any
 
 from ...utils.logger import get_logger
+from ...utils.cache import bump_team
+from ...utils.query_budget import query_budget
 from ..models.Team import Team
 from ..models.TeamMember import TeamMember
 from ..models.enums import TeamRole
@@ -13,6 +15,7 @@ from ..models.enums import TeamRole
 logger = get_logger(__name__)
 
 
+@query_budget(4)
 def update_team(
     team_id: int,
     actor_id: int,
@@ -94,6 +97,8 @@ def update_team(
         changes_made["name"] = {"old": old_name, "new": new_name}
         team.update_name(new_name, commit=True)
 
+    bump_team(team_id, team.event_id)
+
     logger.info(
         "Team updated successfully",
         extra={
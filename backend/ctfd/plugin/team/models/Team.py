@@ -1,12 +1,11 @@
 """
 /backend/ctfd/plugin/team/models/Team.py
-Defines theTeamdatabase model and its properties, including themember_counthybrid.
+Defines the Team database model and its properties, including the stored member_count counter.
 """
 
 from CTFd.models import db
-from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy import select, func
 from ... import config
+from ...event.models.Event import Event
 
 
 class Team(db.Model):
@@ -18,6 +17,8 @@ class Team(db.Model):
     invite_code = db.Column(db.String(config.INVITE_CODE_MAX_LENGTH), nullable=False, unique=True)
     event_id = db.Column(db.Integer, db.ForeignKey("ng_events.id"), nullable=False, index=True)
     locked = db.Column(db.Boolean, default=False, nullable=False)
+    # Denormalized count of ng_team_members rows, kept in step by the member write paths
+    member_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
     __table_args__ = (db.Index("ix_ng_teams_event_name", "event_id", "name"),)
 
@@ -26,18 +27,41 @@ class Team(db.Model):
     def __repr__(self):
         return f"<Team {self.name}>"
 
-    # Avoids a separate query for every team's member count
-    @hybrid_property
-    def member_count(self):
-        return len(self.members)
+    @classmethod
+    def adjust_member_count(cls, team_id, delta):
+        """Shift a team's stored member_count in the current transaction (no commit).
 
-    # Required SQLAlchemy pattern: the expression must be named after the property.
-    @member_count.expression
-    def member_count(cls):
-        # Lazy import to prevent circular dependencies (needed)
-        from .TeamMember import TeamMember
+        The increment is applied in SQL so concurrent writers cannot lose updates.
 
-        return select(func.count(TeamMember.id)).where(TeamMember.team_id == cls.id).scalar_subquery()
+        Args:
+            team_id (int): Team ID
+            delta (int): Amount to add (negative to subtract)
+        """
+        cls.query.filter_by(id=team_id).update(
+            {cls.member_count: cls.member_count + delta},
+            synchronize_session="evaluate",
+        )
+
+    @classmethod
+    def claim_seat(cls, team_id, max_team_size):
+        """Atomically reserve one member slot on an unlocked team below capacity (no commit).
+
+        The capacity check and the increment are a single conditional UPDATE, so concurrent
+        joins serialize on the team row and can never push member_count past max_team_size.
+
+        Args:
+            team_id (int): Team ID
+            max_team_size (int): The event's max team size
+
+        Returns:
+            bool: True if a seat was claimed, False if the team is full or locked
+        """
+        claimed = cls.query.filter(
+            cls.id == team_id,
+            cls.locked.is_(False),
+            cls.member_count < max_team_size,
+        ).update({cls.member_count: cls.member_count + 1}, synchronize_session=False)
+        return claimed == 1
 
     @classmethod
     def create_team(cls, name, event_id, invite_code, ranked=False, flush_only=False):
@@ -61,6 +85,7 @@ class Team(db.Model):
         )
 
         db.session.add(team)
+        Event.adjust_counts(event_id, teams=1)
         if flush_only:
             db.session.flush()
         else:
@@ -68,9 +93,21 @@ class Team(db.Model):
         return team
 
     def disband_team(self):
-        """Delete this team and all its members from the database."""
-        db.session.delete(self)
+        """Delete this team and all its members from the database.
+
+        Uses two bulk DELETEs instead of the ORM cascade, so members are never loaded
+        into the session however large the team is.
+
+        Returns:
+            int: Number of memberships deleted
+        """
+        from .TeamMember import TeamMember
+
+        deleted_members = TeamMember.query.filter(TeamMember.team_id == self.id).delete(synchronize_session="evaluate")
+        Event.adjust_counts(self.event_id, teams=-1, members=-deleted_members)
+        type(self).query.filter(type(self).id == self.id).delete(synchronize_session="evaluate")
         db.session.commit()
+        return deleted_members
 
     def update_invite_code(self, new_code=None, commit=True):
         """Update team invite code and persist to database."""
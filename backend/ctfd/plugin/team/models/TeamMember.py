@@ -6,6 +6,8 @@ Defines the TeamMember model, link between users, teams, and events.
 from CTFd.models import db
 from datetime import datetime
 from .enums import TeamRole
+from .Team import Team
+from ...event.models.Event import Event
 
 
 class TeamMember(db.Model):
@@ -56,11 +58,53 @@ class TeamMember(db.Model):
         )
 
         db.session.add(team_member)
+        _adjust_counters(team_id, event_id, 1)
+        db.session.commit()
+        return team_member
+
+    @classmethod
+    def join_team_with_seat(cls, user_id, team_id, event_id, max_team_size, role=TeamRole.MEMBER, joined_at=None):
+        """Claim a seat on the team and persist the membership atomically.
+
+        The seat claim and the insert share a savepoint, so if the insert violates
+        uq_user_event the claimed seat is released along with it.
+
+        Args:
+            user_id (int): User ID
+            team_id (int): Team ID
+            event_id (int): Event ID
+            max_team_size (int): The event's max team size
+            role (TeamRole, optional): Member role
+            joined_at (datetime, optional): Join timestamp
+
+        Returns:
+            TeamMember: The created team member instance, or None if the team is full or locked
+
+        Raises:
+            IntegrityError: The user is already in a team for this event
+        """
+        if joined_at is None:
+            joined_at = datetime.utcnow()
+
+        with db.session.begin_nested():
+            if not Team.claim_seat(team_id, max_team_size):
+                return None
+            team_member = cls(
+                user_id=user_id,
+                team_id=team_id,
+                event_id=event_id,
+                joined_at=joined_at,
+                role=role,
+            )
+            db.session.add(team_member)
+
+        Event.adjust_counts(event_id, members=1)
         db.session.commit()
         return team_member
 
     def remove_team_member(self, commit=True):
         """Remove this team member from the database."""
+        _adjust_counters(self.team_id, self.event_id, -1)
         db.session.delete(self)
         if commit:
             db.session.commit()
@@ -70,3 +114,9 @@ class TeamMember(db.Model):
         self.role = new_role
         if commit:
             db.session.commit()
+
+
+def _adjust_counters(team_id, event_id, delta):
+    """Keep the denormalized Team/Event member counters in step with a membership change."""
+    Team.adjust_member_count(team_id, delta)
+    Event.adjust_counts(event_id, members=delta)
@@ -21,8 +21,10 @@ from ..controllers import (
     get_team_captain,
 )
 from ...utils.api_responses import controller_response, error_response, success_response
+from ...utils.cache import read_etag, version_etag
 from ...utils.decorators import (
     authed_user_required,
+    conditional_get,
     json_body_required,
     handle_integrity_error,
 )
@@ -34,20 +36,50 @@ from ...utils import (
     validate_team_leave,
     validate_team_join_by_code,
     validate_captain_assignment,
-    validate_event_id_param,
+    validate_team_list_params,
 )
 
 teams_namespace = Namespace("teams", description="team management operations")
 logger = get_logger(__name__)
 
 
+def team_list_filters(args):
+    """Convert validated team listing query parameters into list_teams_in_event kwargs."""
+
+    def _parse_bool(value):
+        return None if value is None else value == "true"
+
+    return {
+        "limit": int(args["limit"]) if args.get("limit") else None,
+        "cursor": args.get("cursor"),
+        "has_space": _parse_bool(args.get("has_space")),
+        "ranked": _parse_bool(args.get("ranked")),
+        "sort": args.get("sort") or "name",
+    }
+
+
+def _team_list_etag():
+    event_id = request.args.get("event_id", "")
+    if not event_id.isdigit():
+        return None
+    return version_etag([("event", int(event_id)), ("event_teams", int(event_id))])
+
+
 @teams_namespace.route("")
 class TeamList(Resource):
     @authed_only
     @handle_integrity_error
+    @conditional_get(_team_list_etag)
     @teams_namespace.doc(
         description="Get teams in a specific event",
-        params={"event_id": "Event ID to filter teams (required)"},
+        params={
+            "event_id": "Event ID to filter teams (required)",
+            "limit": "Page size; enables cursor pagination (optional)",
+            "cursor": "next_cursor from the previous page (optional)",
+            "has_space": "Filter teams below max team size: true/false (optional)",
+            "ranked": "Filter ranked teams: true/false (optional)",
+            "sort": "name, -name, id or -id (optional, default name)",
+        },
         responses={
             200: "Success - Returns list of teams",
             400: "Bad request - Missing or invalid event_id",
@@ -56,17 +88,22 @@ class TeamList(Resource):
         },
     )
     def get(self):
-        """Get all teams in a event.
+        """Get teams in a event, optionally one page at a time.
 
         Query Parameters:
             event_id (int): The event ID to list teams from.
+            limit (int, optional): Page size; enables keyset pagination.
+            cursor (str, optional): The next_cursor returned by the previous page.
+            has_space (str, optional): "true" or "false" to filter on free slots.
+            ranked (str, optional): "true" or "false" to filter on ranked status.
+            sort (str, optional): One of name, -name, id, -id.
 
         Returns:
-            JSON response with team list and event info or error details.
+            JSON response with team list, event info and next page cursor or error details.
         """
         event_id = request.args.get("event_id")
 
-        is_valid, errors = validate_event_id_param(event_id)
+        is_valid, errors = validate_team_list_params(request.args)
         if not is_valid:
             logger.warning(
                 "Validation failed for team list",
@@ -83,7 +120,7 @@ class TeamList(Resource):
 
         event_id = int(event_id)
 
-        result = list_teams_in_event(event_id)
+        result = list_teams_in_event(event_id, **team_list_filters(request.args))
 
         if result["success"]:
             logger.info(
@@ -182,6 +219,7 @@ class TeamList(Resource):
 class TeamDetail(Resource):
     @authed_only
     @handle_integrity_error
+    @conditional_get(lambda team_id: read_etag("team", team_id))
     @teams_namespace.doc(
         description="Get detailed information about a specific team",
         responses={
@@ -30,3 +30,218 @@ def test_admin_endpoint_with_admin_user(admin_client):
     assert "teams" in counts
     assert "users" in counts
     assert "team_members" in counts
+
+
+def test_admin_roster_import_streams_csv_body(admin_client, event, normal_user):
+    """Check that the roster import endpoint accepts a raw CSV body."""
+    body = f"team_name,user_id\nImported Team,{normal_user.id}\n"
+    response = admin_client.post(
+        f"/plugin/api/admin/events/{event.id}/import",
+        data=body,
+        content_type="text/csv",
+    )
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["teams_created"] == 1
+    assert data["members_added"] == 1
+    assert data["errors"] == []
+
+
+def test_admin_roster_import_rejects_unknown_format(admin_client, event):
+    """Check that an unsupported roster format is rejected before reading the body."""
+    response = admin_client.post(f"/plugin/api/admin/events/{event.id}/import?format=xml", data="")
+    assert response.status_code == 400
+    assert "format" in response.get_json()["errors"]
+
+
+def test_admin_cache_stats(admin_client):
+    """Check that admins can read the read cache counters."""
+    response = admin_client.get("/plugin/api/admin/cache/stats")
+    assert response.status_code == 200
+    assert "team" in response.get_json()["data"]["cache"]
+
+
+def test_admin_event_reset_runs_as_background_job(app, admin_client, event, monkeypatch):
+    """Check that ?background=true queues the reset, the job can be polled, and a conflicting job gets 409."""
+    import importlib
+    from plugin import config
+    from plugin.admin.controllers._job_runner import _run_job
+
+    scheduler = importlib.import_module("plugin.admin.controllers.schedule_admin_job")
+
+    # Run the job inline on the test's session instead of on the thread pool
+    monkeypatch.setattr(scheduler, "_submit_job", lambda job_id: _run_job(app, job_id))
+    event_id = event.id
+
+    response = admin_client.post(
+        f"/plugin/api/admin/events/{event_id}/reset?background=true",
+        json={"confirm": config.ADMIN_EVENT_RESET_CONFIRMATION},
+    )
+    assert response.status_code == 202
+    job_id = response.get_json()["data"]["job"]["id"]
+
+    job = admin_client.get(f"/plugin/api/admin/jobs/{job_id}").get_json()["data"]["job"]
+    assert job["status"] == "succeeded"
+    assert job["kind"] == "reset_event"
+    assert job["result"]["deleted"] == {"team_members": 0, "teams": 0}
+    assert job_id in [j["id"] for j in admin_client.get("/plugin/api/admin/jobs").get_json()["data"]["jobs"]]
+
+    # Keep the next job queued so it holds the plugin-wide lock
+    monkeypatch.setattr(scheduler, "_submit_job", lambda job_id: None)
+    assert admin_client.post("/plugin/api/admin/cleanup?background=true").status_code == 202
+    response = admin_client.post(
+        f"/plugin/api/admin/events/{event_id}/reset?background=true",
+        json={"confirm": config.ADMIN_EVENT_RESET_CONFIRMATION},
+    )
+    assert response.status_code == 409
+
+    assert admin_client.post("/plugin/api/admin/cleanup?background=maybe").status_code == 400
+    assert admin_client.get("/plugin/api/admin/jobs/999999").status_code == 404
+
+
+def test_admin_inline_reset_and_cleanup_take_the_job_lock(admin_client, event, monkeypatch):
+    """Check that runs without ?background=true are recorded as jobs and get 409 while a conflicting job is queued."""
+    import importlib
+    from plugin import config
+
+    event_id = event.id
+    response = admin_client.post(
+        f"/plugin/api/admin/events/{event_id}/reset", json={"confirm": config.ADMIN_EVENT_RESET_CONFIRMATION}
+    )
+    assert response.status_code == 200
+    job = admin_client.get("/plugin/api/admin/jobs").get_json()["data"]["jobs"][0]
+    assert (job["kind"], job["event_id"], job["status"]) == ("reset_event", event_id, "succeeded")
+
+    # Keep a job queued so it holds the event's lock
+    scheduler = importlib.import_module("plugin.admin.controllers.schedule_admin_job")
+    monkeypatch.setattr(scheduler, "_submit_job", lambda job_id: None)
+    response = admin_client.post(
+        f"/plugin/api/admin/events/{event_id}/reset?background=true",
+        json={"confirm": config.ADMIN_EVENT_RESET_CONFIRMATION},
+    )
+    assert response.status_code == 202
+
+    response = admin_client.post(
+        f"/plugin/api/admin/events/{event_id}/reset", json={"confirm": config.ADMIN_EVENT_RESET_CONFIRMATION}
+    )
+    assert response.status_code == 409
+    assert admin_client.post("/plugin/api/admin/cleanup").status_code == 409
+    # A dry run only reads, so it needs no lock
+    assert admin_client.post("/plugin/api/admin/cleanup", json={"dry_run": True}).status_code == 200
+
+
+def test_admin_cleanup_background_job_keeps_its_params(app, admin_client, monkeypatch):
+    """Check that a queued orphan cleanup runs with the minimum account age it was requested with."""
+    import importlib
+    from plugin.admin.controllers._job_runner import _run_job
+
+    scheduler = importlib.import_module("plugin.admin.controllers.schedule_admin_job")
+    monkeypatch.setattr(scheduler, "_submit_job", lambda job_id: _run_job(app, job_id))
+
+    response = admin_client.post("/plugin/api/admin/cleanup?background=true", json={"min_account_age_days": 30})
+    assert response.status_code == 202
+    job = response.get_json()["data"]["job"]
+    assert job["params"] == {"min_account_age_days": 30}
+
+    job = admin_client.get(f"/plugin/api/admin/jobs/{job['id']}").get_json()["data"]["job"]
+    assert job["status"] == "succeeded"
+    assert job["result"]["min_account_age_days"] == 30
+
+
+def test_admin_health_serves_cached_snapshot(admin_client, monkeypatch):
+    """Check that repeated health polls are served from one cached snapshot."""
+    import importlib
+    from CTFd.cache import cache
+
+    probes_module = importlib.import_module("plugin.admin.controllers.run_health_probes")
+    snapshot_module = importlib.import_module("plugin.admin.controllers.get_health_snapshot")
+    runs = []
+
+    monkeypatch.setattr(snapshot_module, "_ensure_health_refresher", lambda: None)
+    monkeypatch.setattr(
+        probes_module,
+        "_health_probes",
+        lambda: (
+            runs.append(1)
+            or {
+                "database": lambda: True,
+                "data_counts": lambda: {"events": 1, "teams": 4, "users": 5, "team_members": 3},
+                "empty_teams": lambda: 3,
+            }
+        ),
+    )
+
+    first = admin_client.get("/plugin/api/admin/health")
+    second = admin_client.get("/plugin/api/admin/health")
+    assert first.status_code == second.status_code == 200
+    report = second.get_json()["data"]
+    assert len(runs) == 1
+    assert report["timestamp"] == first.get_json()["data"]["timestamp"]
+    assert report["status"] == "healthy"
+    assert report["empty_teams_count"] == 3
+    assert report["warnings"] == ["More than 50% of teams are empty"]
+    assert report["age_seconds"] >= 0
+
+    # An expired snapshot is rebuilt on the next poll
+    cache.delete(snapshot_module._snapshot_key())
+    admin_client.get("/plugin/api/admin/health")
+    assert len(runs) == 2
+
+
+def test_admin_liveness_checks_pool_without_auth(client):
+    """Check that the liveness probe answers without authentication."""
+    response = client.get("/plugin/api/admin/health/live")
+    assert response.status_code == 200
+    assert response.get_json()["data"]["status"] == "ok"
+
+
+def test_admin_metrics_exports_request_and_sql_series(admin_client, event, tmp_path, monkeypatch):
+    """Check that served requests show up in the Prometheus export with their SQL counts and errors."""
+    from plugin import config
+    from plugin.middleware import request_metrics
+
+    monkeypatch.setattr(config, "METRICS_STORE_PATH", str(tmp_path / "metrics.sqlite"))
+    # Counters buffered by earlier tests in this process would otherwise land in the new store
+    request_metrics._buffer.clear()
+
+    assert admin_client.get(f"/plugin/api/events/{event.id}").status_code == 200
+    assert admin_client.get("/plugin/api/teams/999999").status_code == 404
+
+    response = admin_client.get("/plugin/api/admin/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+
+    assert "# TYPE ng_request_duration_seconds histogram" in body
+    assert 'ng_requests_total{endpoint="/plugin/api/events/<int:event_id>",method="GET",status="200"} 1' in body
+    assert 'ng_request_duration_seconds_bucket{endpoint="/plugin/api/events/<int:event_id>",le="+Inf"} 1' in body
+    assert 'ng_request_errors_total{namespace="teams",status_class="4xx"} 1' in body
+    sql_line = next(
+        line
+        for line in body.splitlines()
+        if line.startswith('ng_sql_statements_total{endpoint="/plugin/api/events/<int:event_id>"}')
+    )
+    assert float(sql_line.rsplit(" ", 1)[1]) >= 1
+
+
+def test_request_metrics_leave_no_state_behind_failed_statements(app, db_session):
+    """Check that a statement that raises is not counted and leaves nothing on the pooled connection."""
+    from flask import g
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    with app.test_request_context("/plugin/api/events"):
+        g.ng_request_metrics = {"started": 0.0, "sql_statements": 0, "sql_seconds": 0.0}
+        with pytest.raises(OperationalError):
+            db_session.execute(text("SELECT * FROM ng_no_such_table"))
+        db_session.execute(text("SELECT 1"))
+
+        assert g.ng_request_metrics["sql_statements"] == 1
+        assert not any(key.startswith("ng_") for key in db_session.connection().info)
+
+
+def test_admin_metrics_requires_admin(logged_in_client):
+    """Check that non-admins cannot read the metrics export."""
+    response = logged_in_client.get("/plugin/api/admin/metrics")
+    # CTFd's @admins_only decorator redirects non-admin users instead of returning 403
+    assert response.status_code == 302
@@ -42,3 +42,20 @@ def test_create_event_succeeds_for_admin_user(admin_client):
     assert response_data["success"]
     assert response_data["data"]["event"]["name"] == "Admin Event"
     assert response_data["data"]["event"]["max_team_size"] == 4
+
+
+def test_event_list_conditional_get(admin_client, event):
+    """Check that the event list answers 304 until an event changes."""
+    response = admin_client.get("/plugin/api/events")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = admin_client.get("/plugin/api/events", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = admin_client.patch(f"/plugin/api/events/{event.id}", json={"description": "Changed"})
+    assert response.status_code == 200
+
+    response = admin_client.get("/plugin/api/events", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
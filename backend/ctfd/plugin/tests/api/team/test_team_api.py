@@ -7,6 +7,7 @@ import pytest
 import time
 from CTFd.models import db as _db
 from tests.helpers import gen_user
+from plugin.team.controllers import create_team
 from plugin.team.models.TeamMember import TeamMember
 from plugin.team.models.enums import TeamRole
 from plugin.tests.helpers import login_as
@@ -30,6 +31,26 @@ def test_teams_endpoint_with_authentication(logged_in_client, event):
     assert "teams" in data["data"]
 
 
+def test_teams_endpoint_pagination(logged_in_client, event):
+    """Check that the teams endpoint pages with limit/cursor and rejects bad filters."""
+    for i in range(3):
+        user = gen_user(_db, name=f"pager_{i}", email=f"pager_{i}@example.com")
+        create_team(f"Page Team {i}", event.id, user.id)
+
+    response = logged_in_client.get(f"/plugin/api/teams?event_id={event.id}&limit=2")
+    assert response.status_code == 200
+    page = response.get_json()["data"]
+    assert len(page["teams"]) == 2
+    assert page["has_more"]
+
+    response = logged_in_client.get(f"/plugin/api/teams?event_id={event.id}&limit=2&cursor={page['next_cursor']}")
+    assert response.status_code == 200
+    assert len(response.get_json()["data"]["teams"]) == 1
+
+    response = logged_in_client.get(f"/plugin/api/teams?event_id={event.id}&sort=bogus")
+    assert response.status_code == 400
+
+
 def test_create_team_requires_data(logged_in_client):
     """Check that team creation requires valid data."""
     response = logged_in_client.post("/plugin/api/teams")
@@ -115,3 +136,30 @@ def test_join_team_fails_if_already_in_a_team_in_event(logged_in_client, event,
     else:
         error_msg = str(errors)
     assert "already" in error_msg.lower()
+
+
+def test_team_detail_conditional_get(client, team_with_members, normal_user):
+    """Check that team detail answers 304 for a current ETag and a fresh 200 after a join."""
+    team = team_with_members["team"]
+    login_as(client, team_with_members["captain"])
+
+    # First read records the team's dependencies, so it is untagged; the ETag is known from then on
+    response = client.get(f"/plugin/api/teams/{team.id}")
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    response = client.get(f"/plugin/api/teams/{team.id}")
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = client.get(f"/plugin/api/teams/{team.id}", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+    assert response.data == b""
+
+    login_as(client, normal_user)
+    response = client.post("/plugin/api/teams/join", json={"invite_code": team.invite_code})
+    assert response.status_code == 200
+
+    response = client.get(f"/plugin/api/teams/{team.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert normal_user.id in [member["user_id"] for member in response.get_json()["data"]["team_members"]]
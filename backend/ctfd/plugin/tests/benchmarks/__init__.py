@@ -0,0 +1,4 @@
+"""
+/backend/ctfd/plugin/tests/benchmarks/__init__.py
+Benchmarks, excluded from the default run (use `make benchmark`)
+"""
@@ -0,0 +1,133 @@
+"""
+/plugin/tests/benchmarks/test_event_stats_benchmark.py
+Compares the per-event stats aggregation against the old Team x TeamMember fan-out join
+"""
+
+import os
+import time
+
+import pytest
+from sqlalchemy import func
+from CTFd.models import db as _db
+
+from plugin.admin.controllers.get_detailed_stats import get_detailed_stats
+from plugin.event.controllers.list_events import list_events
+from plugin.event.models.Event import Event
+from plugin.team.models.Team import Team
+from plugin.team.models.TeamMember import TeamMember
+from plugin.team.models.enums import TeamRole
+from plugin.user.models.User import User as NgUser
+
+BENCHMARK_MEMBERS = int(os.environ.get("BENCHMARK_MEMBERS", 100_000))
+BENCHMARK_EVENTS = int(os.environ.get("BENCHMARK_EVENTS", 50))
+MEMBERS_PER_TEAM = 5
+INSERT_CHUNK_SIZE = 5_000
+USER_ID_OFFSET = 10_000_000
+
+
+def _insert_chunked(session, table, rows):
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        session.execute(table.insert(), rows[start : start + INSERT_CHUNK_SIZE])
+
+
+def _seed(session):
+    """Bulk load BENCHMARK_MEMBERS memberships spread evenly over BENCHMARK_EVENTS events."""
+    members_per_event = BENCHMARK_MEMBERS // BENCHMARK_EVENTS
+    teams_per_event = members_per_event // MEMBERS_PER_TEAM
+
+    event_ids = []
+    for i in range(BENCHMARK_EVENTS):
+        event = Event(
+            name=f"Benchmark Event {i}",
+            team_count=teams_per_event,
+            member_count=teams_per_event * MEMBERS_PER_TEAM,
+        )
+        session.add(event)
+        session.flush()
+        event_ids.append(event.id)
+
+    team_rows = [
+        {
+            "name": f"Team {event_id}-{t}",
+            "invite_code": f"B{event_id:04d}{t:06d}",
+            "event_id": event_id,
+            "member_count": MEMBERS_PER_TEAM,
+        }
+        for event_id in event_ids
+        for t in range(teams_per_event)
+    ]
+    _insert_chunked(session, Team.__table__, team_rows)
+
+    teams = session.query(Team.id, Team.event_id).filter(Team.event_id.in_(event_ids)).all()
+    user_ids = range(USER_ID_OFFSET, USER_ID_OFFSET + len(teams) * MEMBERS_PER_TEAM)
+    _insert_chunked(session, NgUser.__table__, [{"id": user_id} for user_id in user_ids])
+
+    member_rows = [
+        {
+            "user_id": user_ids[index * MEMBERS_PER_TEAM + slot],
+            "team_id": team_id,
+            "event_id": event_id,
+            "role": TeamRole.CAPTAIN if slot == 0 else TeamRole.MEMBER,
+        }
+        for index, (team_id, event_id) in enumerate(teams)
+        for slot in range(MEMBERS_PER_TEAM)
+    ]
+    _insert_chunked(session, TeamMember.__table__, member_rows)
+    session.commit()
+
+    return event_ids, teams_per_event, teams_per_event * MEMBERS_PER_TEAM
+
+
+def _fan_out_stats():
+    """The previous get_detailed_stats aggregation, joining teams and members to events at once."""
+    return (
+        _db.session.query(
+            Event.id,
+            func.count(Team.id.distinct()).label("teams"),
+            func.count(TeamMember.id).label("total_members"),
+        )
+        .outerjoin(Team, Event.id == Team.event_id)
+        .outerjoin(TeamMember, Event.id == TeamMember.event_id)
+        .group_by(Event.id)
+        .all()
+    )
+
+
+def _best_of(fn, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+@pytest.mark.db
+@pytest.mark.benchmark
+def test_event_stats_scale_with_row_count(db_session):
+    """Pre-aggregated event stats must be exact and beat the fan-out join on a 100k member dataset."""
+    event_ids, teams_per_event, members_per_event = _seed(db_session)
+
+    fan_out_seconds, fan_out_rows = _best_of(_fan_out_stats, repeat=1)
+    stats_seconds, stats = _best_of(get_detailed_stats)
+    list_seconds, listing = _best_of(list_events)
+
+    print(
+        f"\n{BENCHMARK_MEMBERS} members / {BENCHMARK_EVENTS} events:"
+        f"\n  fan-out join       {fan_out_seconds * 1000:10.1f} ms"
+        f"\n  get_detailed_stats {stats_seconds * 1000:10.1f} ms"
+        f"\n  list_events        {list_seconds * 1000:10.1f} ms"
+    )
+
+    seeded = set(event_ids)
+    fan_out_members = {event_id: members for event_id, _, members in fan_out_rows if event_id in seeded}
+    assert all(members == teams_per_event * members_per_event for members in fan_out_members.values())
+
+    stats_by_event = {row["id"]: row for row in stats["events"] if row["id"] in seeded}
+    assert all(row["teams"] == teams_per_event for row in stats_by_event.values())
+    assert all(row["total_members"] == members_per_event for row in stats_by_event.values())
+
+    listing_by_event = {row["id"]: row for row in listing["events"] if row["id"] in seeded}
+    assert all(row["total_members"] == members_per_event for row in listing_by_event.values())
+
+    assert stats_seconds < fan_out_seconds
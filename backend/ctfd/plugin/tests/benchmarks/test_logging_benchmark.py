@@ -0,0 +1,61 @@
+"""
+/plugin/tests/benchmarks/test_logging_benchmark.py
+Compares per-call logging overhead of the synchronous stdout handler and the queue-backed handler
+"""
+
+import io
+import logging
+import os
+import time
+
+import pytest
+
+from plugin.utils.logger import JSONFormatter, QueueBatchHandler
+
+BENCHMARK_LOG_CALLS = int(os.environ.get("BENCHMARK_LOG_CALLS", 20_000))
+# Simulated cost of one write to a busy supervisord stdout pipe
+PIPE_WRITE_SECONDS = 0.00005
+
+
+class SlowPipe(io.StringIO):
+    def write(self, text):
+        time.sleep(PIPE_WRITE_SECONDS)
+        return super().write(text)
+
+
+def _per_call_seconds(handler, name):
+    handler.setFormatter(JSONFormatter())
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    start = time.perf_counter()
+    for i in range(BENCHMARK_LOG_CALLS):
+        logger.info(
+            "User successfully joined team via invite code",
+            extra={"context": {"user_id": i, "team_id": i // 5, "event_id": 1, "role": "member"}},
+        )
+    elapsed = time.perf_counter() - start
+    handler.flush()
+    return elapsed / BENCHMARK_LOG_CALLS
+
+
+@pytest.mark.benchmark
+def test_queue_handler_cuts_per_call_overhead():
+    """The queue handler must cost the caller less per log call than a synchronous write."""
+    sync_stream, queued_stream = SlowPipe(), SlowPipe()
+
+    sync_seconds = _per_call_seconds(logging.StreamHandler(sync_stream), "benchmark_sync_logger")
+    queued_seconds = _per_call_seconds(
+        QueueBatchHandler(queued_stream, queue_size=BENCHMARK_LOG_CALLS), "benchmark_queued_logger"
+    )
+
+    print(
+        f"\n{BENCHMARK_LOG_CALLS} log calls:"
+        f"\n  synchronous stdout {sync_seconds * 1_000_000:8.1f} us/call"
+        f"\n  queue + batches    {queued_seconds * 1_000_000:8.1f} us/call"
+    )
+
+    assert len(queued_stream.getvalue().splitlines()) == BENCHMARK_LOG_CALLS
+    assert queued_seconds < sync_seconds
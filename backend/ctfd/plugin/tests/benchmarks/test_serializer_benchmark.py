@@ -0,0 +1,86 @@
+"""
+/plugin/tests/benchmarks/test_serializer_benchmark.py
+Compares the serializer registry against the previous reflective serialize_model_for_api
+"""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from plugin.team.models.TeamMember import TeamMember
+from plugin.team.models.enums import TeamRole
+from plugin.utils.serializers import serialize
+
+BENCHMARK_OBJECTS = int(os.environ.get("BENCHMARK_SERIALIZED_OBJECTS", 50_000))
+
+
+def _reflective_serialize(obj):
+    """The previous serialize_model_for_api, probing every attribute of every object."""
+    if obj is None:
+        return None
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if isinstance(obj, list):
+        return [_reflective_serialize(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _reflective_serialize(value) for key, value in obj.items()}
+    if hasattr(obj, "__dict__"):
+        result = {}
+        for key, value in obj.__dict__.items():
+            if key.startswith("_"):
+                continue
+            if hasattr(value, "isoformat"):
+                result[key] = value.isoformat()
+            elif hasattr(value, "value"):
+                result[key] = value.value
+            elif hasattr(value, "__dict__"):
+                result[key] = _reflective_serialize(value)
+            elif isinstance(value, list):
+                result[key] = [_reflective_serialize(item) for item in value]
+            else:
+                result[key] = value
+        return result
+    return obj
+
+
+def _best_of(fn, payload, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(payload)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+@pytest.mark.benchmark
+def test_serializer_registry_beats_reflective_walk():
+    """Registry serialization must match the reflective output and be faster on models and row dicts."""
+    joined_at = datetime(2024, 1, 1, 12, 0, 0)
+    members = [
+        TeamMember(id=i, user_id=i, team_id=i // 5, event_id=1, role=TeamRole.MEMBER, joined_at=joined_at)
+        for i in range(BENCHMARK_OBJECTS)
+    ]
+    rows = [
+        {"id": i, "name": f"Team {i}", "member_count": 5, "ranked": True, "invite_code": f"C{i:07d}"}
+        for i in range(BENCHMARK_OBJECTS)
+    ]
+
+    reflective_models_seconds, reflective_models = _best_of(_reflective_serialize, members)
+    registry_models_seconds, registry_models = _best_of(serialize, members)
+    reflective_rows_seconds, reflective_rows = _best_of(_reflective_serialize, rows)
+    registry_rows_seconds, registry_rows = _best_of(serialize, rows)
+
+    print(
+        f"\n{BENCHMARK_OBJECTS} objects:"
+        f"\n  models  reflective {reflective_models_seconds * 1000:10.1f} ms"
+        f"\n  models  registry   {registry_models_seconds * 1000:10.1f} ms"
+        f"\n  dicts   reflective {reflective_rows_seconds * 1000:10.1f} ms"
+        f"\n  dicts   registry   {registry_rows_seconds * 1000:10.1f} ms"
+    )
+
+    assert registry_models == reflective_models
+    assert registry_rows == reflective_rows
+    assert registry_models_seconds < reflective_models_seconds
+    assert registry_rows_seconds < reflective_rows_seconds
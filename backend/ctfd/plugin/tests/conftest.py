@@ -11,6 +11,7 @@ from plugin import load as plugin_load
 from plugin.user.models.User import User as NgUser
 from plugin.event.models.Event import Event
 from plugin.team.controllers import create_team, join_team
+from plugin.utils.query_budget import QueryRecorder
 from tests.helpers import (
     create_ctfd as create_ctfd_original,
     destroy_ctfd as destroy_ctfd_original,
@@ -45,6 +46,19 @@ def app():
         destroy_ctfd_original(_app)
 
 
+@pytest.fixture(autouse=True)
+def enforce_query_budgets():
+    """
+    Fails any test in which a route or controller declared with @query_budget
+    ran more SQL statements than its budget, listing the statements it ran.
+    """
+    with QueryRecorder() as recorder:
+        yield recorder
+
+    if recorder.violations:
+        pytest.fail(f"SQL query budget exceeded\n{recorder.report()}", pytrace=False)
+
+
 @pytest.fixture(scope="function")
 def db_session(app, request):
     """
@@ -3,12 +3,31 @@
 Tests admin controller business logic
 """
 
+import importlib
 import time
+from datetime import datetime, timedelta
+
 import pytest
+from sqlalchemy import event as sa_event
+from CTFd.models import db as _db
 from tests.helpers import gen_user as gen_user_original
 from plugin.team.controllers.create_team import create_team
 from plugin.admin.controllers.get_data_counts import get_data_counts
+from plugin.admin.controllers.get_detailed_stats import get_detailed_stats
+from plugin.admin.controllers.import_roster import import_roster
 from plugin.admin.controllers.cleanup_headless_teams import cleanup_headless_teams
+from plugin.admin.controllers.cleanup_orphaned_data import cleanup_orphaned_data
+from plugin.admin.controllers.reconcile_counters import reconcile_counters
+from plugin.admin.controllers.reset_event_data import reset_event_data
+from plugin.admin.controllers import _chunked_delete, _job_runner
+from plugin.admin.models.AdminJob import AdminJob
+from plugin.admin.models.enums import JobStatus
+from plugin.team.controllers.join_team import join_team
+from plugin.team.models.Team import Team
+from plugin.team.models.TeamMember import TeamMember
+from plugin.team.models.enums import TeamRole
+from plugin.user.models.User import User
+from plugin.event.models.Event import Event
 
 
 class DBWrapper:
@@ -38,6 +57,211 @@ def test_get_data_counts(db_session, event):
     assert counts["team_members"] >= 1
 
 
+@pytest.mark.db
+def test_get_data_counts_single_statement(db_session, event):
+    """Test exact counts come from one statement and approximate mode falls back to them without statistics."""
+    db_wrapper = DBWrapper(db_session)
+    create_team("Counted Team", event.id, gen_unique_user(db_wrapper).id)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        counts = get_data_counts()
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert counts == {
+        "events": Event.query.count(),
+        "teams": Team.query.count(),
+        "users": User.query.count(),
+        "team_members": TeamMember.query.count(),
+    }
+    assert get_data_counts(approximate=True) == counts
+
+
+def test_health_probes_run_concurrently_with_timeouts(app, monkeypatch):
+    """Test probes run in parallel and a slow or failing probe is reported without delaying the others."""
+    health_probes_module = importlib.import_module("plugin.admin.controllers.run_health_probes")
+
+    def failing():
+        raise RuntimeError("probe exploded")
+
+    monkeypatch.setattr(
+        health_probes_module,
+        "_health_probes",
+        lambda: {
+            "fast": lambda: "ok",
+            "slow": lambda: time.sleep(1.0),
+            "sleepy": lambda: time.sleep(0.05) or "done",
+            "failing": failing,
+        },
+    )
+
+    started = time.monotonic()
+    with app.app_context():
+        probes = health_probes_module.run_health_probes(timeout=0.3)["probes"]
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.9
+    assert probes["fast"]["result"] == "ok"
+    assert probes["sleepy"]["result"] == "done"
+    assert probes["slow"]["status"] == "timeout"
+    assert (probes["failing"]["status"], probes["failing"]["error"]) == ("error", "probe exploded")
+
+
+@pytest.mark.db
+def test_detailed_stats_counts_members_once(db_session, event):
+    """Test that per-event member totals are not multiplied by the number of teams."""
+    db_wrapper = DBWrapper(db_session)
+    first = create_team("First Team", event.id, gen_unique_user(db_wrapper).id)
+    create_team("Second Team", event.id, gen_unique_user(db_wrapper).id)
+    join_team(gen_unique_user(db_wrapper).id, first["invite_code"])
+
+    stats = get_detailed_stats()
+    event_stats = next(row for row in stats["events"] if row["id"] == event.id)
+
+    assert event_stats["teams"] == 2
+    assert event_stats["total_members"] == 3
+
+
+@pytest.mark.db
+def test_detailed_stats_pages_empty_teams_from_membership_rows(db_session, event, event2):
+    """Test empty teams are found by anti-join, broken down per event and paged by cursor."""
+    db_wrapper = DBWrapper(db_session)
+    empty_ids = []
+    for i, target in enumerate([event, event, event2]):
+        result = create_team(f"Empty {i}", target.id, gen_unique_user(db_wrapper).id)
+        TeamMember.query.filter_by(team_id=result["team"].id).delete()
+        empty_ids.append(result["team"].id)
+    # A drifted counter must not hide a team that still has members
+    kept = create_team("Drifted", event.id, gen_unique_user(db_wrapper).id)["team"]
+    kept.member_count = 0
+    db_session.commit()
+
+    first = get_detailed_stats(limit=2)
+    second = get_detailed_stats(limit=2, cursor=first["empty_teams_next_cursor"])
+
+    assert [team["id"] for team in first["empty_teams"] + second["empty_teams"]] == empty_ids
+    assert (first["empty_teams_has_more"], second["empty_teams_has_more"]) == (True, False)
+    assert second["empty_teams_next_cursor"] is None
+    assert first["total_empty_teams"] == 3
+    assert {row["id"]: row["empty_teams"] for row in first["events"]} == {event.id: 2, event2.id: 1}
+    assert get_detailed_stats(cursor="bogus")["success"] is False
+
+
+@pytest.mark.db
+def test_reset_event_data_reports_deleted_rowcounts(db_session, event, event2):
+    """Test that an event reset deletes only that event's rows and reports the deleted counts."""
+    db_wrapper = DBWrapper(db_session)
+    for name in ["Reset A", "Reset B"]:
+        result = create_team(name, event.id, gen_unique_user(db_wrapper).id)
+        join_team(gen_unique_user(db_wrapper).id, result["invite_code"])
+    create_team("Survivor", event2.id, gen_unique_user(db_wrapper).id)
+
+    result = reset_event_data(event.id)
+
+    assert result["deleted"] == {"team_members": 4, "teams": 2}
+    assert Team.query.filter_by(event_id=event.id).count() == 0
+    assert TeamMember.query.filter_by(event_id=event2.id).count() == 1
+    assert (event.team_count, event.member_count) == (0, 0)
+
+
+@pytest.mark.db
+def test_chunked_delete_resumes_after_interruption(db_session, event, monkeypatch):
+    """Test that an interrupted chunked delete resumes with cumulative counts and clears its progress."""
+    db_wrapper = DBWrapper(db_session)
+    for i in range(5):
+        create_team(f"Chunk Team {i}", event.id, gen_unique_user(db_wrapper).id)
+    steps = [
+        ("team_members", TeamMember, [TeamMember.event_id == event.id]),
+        ("teams", Team, [Team.event_id == event.id]),
+    ]
+
+    def interrupt(seconds):
+        raise RuntimeError("worker killed")
+
+    monkeypatch.setattr(_chunked_delete.time, "sleep", interrupt)
+    with pytest.raises(RuntimeError):
+        _chunked_delete._delete_in_chunks("test_resume", steps, chunk_size=2)
+    assert TeamMember.query.filter_by(event_id=event.id).count() == 3
+
+    monkeypatch.setattr(_chunked_delete.time, "sleep", lambda seconds: None)
+    result = _chunked_delete._delete_in_chunks("test_resume", steps, chunk_size=2)
+
+    assert result["deleted"] == {"team_members": 5, "teams": 5}
+    assert result["stats"]["resumed"] is True
+    assert result["stats"]["chunks"] == 6
+    assert Team.query.filter_by(event_id=event.id).count() == 0
+    assert _chunked_delete._delete_in_chunks("test_resume", steps)["stats"]["resumed"] is False
+
+
+@pytest.mark.db
+def test_chunked_delete_resume_reruns_finished_steps(db_session, event, monkeypatch):
+    """Test that rows inserted into an already finished step before a resume are still deleted first."""
+    db_wrapper = DBWrapper(db_session)
+    for i in range(5):
+        create_team(f"Chunk Team {i}", event.id, gen_unique_user(db_wrapper).id)
+    steps = [
+        ("team_members", TeamMember, [TeamMember.event_id == event.id]),
+        ("teams", Team, [Team.event_id == event.id]),
+    ]
+    pauses = []
+
+    def interrupt_during_teams(seconds):
+        # team_members pauses twice (chunks of 2, 2, 1); the first pause in teams kills the run
+        pauses.append(seconds)
+        if len(pauses) == 3:
+            raise RuntimeError("worker killed")
+
+    monkeypatch.setattr(_chunked_delete.time, "sleep", interrupt_during_teams)
+    with pytest.raises(RuntimeError):
+        _chunked_delete._delete_in_chunks("test_resume_rerun", steps, chunk_size=2)
+    assert TeamMember.query.filter_by(event_id=event.id).count() == 0
+    assert Team.query.filter_by(event_id=event.id).count() == 3
+
+    # The event is still live: a player creates a team before the reset is retried
+    create_team("Late Team", event.id, gen_unique_user(db_wrapper).id)
+
+    monkeypatch.setattr(_chunked_delete.time, "sleep", lambda seconds: None)
+    result = _chunked_delete._delete_in_chunks("test_resume_rerun", steps, chunk_size=2)
+
+    assert result["deleted"] == {"team_members": 6, "teams": 6}
+    assert result["batches"]["team_members"] == [1]
+    assert TeamMember.query.filter_by(event_id=event.id).count() == 0
+    assert Team.query.filter_by(event_id=event.id).count() == 0
+
+
+@pytest.mark.db
+def test_cleanup_orphaned_data_streams_batches_with_age_filter(db_session, event, monkeypatch):
+    """Test orphans are counted, filtered by account age and deleted in reported batches."""
+    db_wrapper = DBWrapper(db_session)
+    create_team("Kept Team", event.id, gen_unique_user(db_wrapper).id)
+    old_orphans, new_orphan = [gen_unique_user(db_wrapper) for _ in range(3)], gen_unique_user(db_wrapper)
+    for ctfd_user in old_orphans:
+        ctfd_user.created = datetime.utcnow() - timedelta(days=60)
+    for ctfd_user in old_orphans + [new_orphan]:
+        User.create_user(ctfd_user.id, commit=False)
+    db_session.commit()
+    monkeypatch.setattr(_chunked_delete.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(_chunked_delete.config, "ADMIN_DELETE_CHUNK_SIZE", 2)
+
+    report = cleanup_orphaned_data(min_account_age_days=30, dry_run=True)
+    assert report["cleaned_up"] == {"orphaned_users": 3}
+    assert User.query.count() == 5
+
+    result = cleanup_orphaned_data(min_account_age_days=30)
+
+    assert result["cleaned_up"] == {"orphaned_users": 3}
+    assert result["batches"] == [2, 1]
+    assert User.query.get(new_orphan.id) is not None
+    assert cleanup_orphaned_data()["cleaned_up"] == {"orphaned_users": 1}
+    assert User.query.count() == 1
+
+
 @pytest.mark.db
 def test_cleanup_headless_teams(db_session, event):
     """Test cleaning up teams without captains."""
@@ -45,3 +269,225 @@ def test_cleanup_headless_teams(db_session, event):
 
     assert result["success"]
     assert "Fixed 0 headless teams" in result["message"]
+
+
+@pytest.mark.db
+def test_cleanup_headless_teams_promotes_oldest_member_set_wise(db_session, event):
+    """Test the dry run lists captainless teams and the repair promotes each team's oldest member at once."""
+    db_wrapper = DBWrapper(db_session)
+    expected = {}
+    for i in range(3):
+        captain = gen_unique_user(db_wrapper)
+        result = create_team(f"Headless {i}", event.id, captain.id)
+        oldest = gen_unique_user(db_wrapper)
+        join_team(oldest.id, result["invite_code"])
+        join_team(gen_unique_user(db_wrapper).id, result["invite_code"])
+        # Simulate the captain's account being purged
+        TeamMember.query.filter_by(team_id=result["team"].id, user_id=captain.id).delete()
+        expected[result["team"].id] = oldest.id
+    create_team("Healthy", event.id, gen_unique_user(db_wrapper).id)
+    db_session.commit()
+
+    report = cleanup_headless_teams(dry_run=True)
+    assert report["headless_teams"] == 3
+    assert {t["team_id"]: t["promoted_user_id"] for t in report["teams"]} == expected
+    assert TeamMember.query.filter_by(role=TeamRole.CAPTAIN).count() == 1
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        result = cleanup_headless_teams()
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert result["fixed_teams"] == 3
+    assert len(statements) == 2
+    captains = {m.team_id: m.user_id for m in TeamMember.query.filter_by(role=TeamRole.CAPTAIN).all()}
+    assert expected.items() <= captains.items()
+    assert cleanup_headless_teams()["fixed_teams"] == 0
+
+
+@pytest.mark.db
+def test_reconcile_counters_repairs_drift(db_session, event):
+    """Test that reconciliation reports drifted counters and rewrites them from membership rows."""
+    db_wrapper = DBWrapper(db_session)
+    team_result = create_team("Drifted Team", event.id, gen_unique_user(db_wrapper).id)
+    team_id = team_result["team"].id
+
+    Team.query.filter_by(id=team_id).update({"member_count": 7})
+    event.member_count = 9
+    db_session.commit()
+
+    dry_run = reconcile_counters(dry_run=True)
+    assert dry_run["success"]
+    assert dry_run["drift"]["teams"]["drifted"] == 1
+    assert dry_run["drift"]["teams"]["sample"][0] == {
+        "id": team_id,
+        "stored_member_count": 7,
+        "actual_member_count": 1,
+    }
+    db_session.expire_all()
+    assert Team.query.get(team_id).member_count == 7
+
+    result = reconcile_counters()
+    assert result["drift"]["events"]["drifted"] == 1
+    db_session.expire_all()
+    assert Team.query.get(team_id).member_count == 1
+    assert (event.team_count, event.member_count) == (1, 1)
+    assert reconcile_counters(dry_run=True)["drift"]["teams"]["drifted"] == 0
+
+
+@pytest.mark.db
+def test_import_roster_csv_creates_teams_and_reports_bad_rows(db_session, event):
+    """Test that a CSV roster creates teams, picks captains and skips invalid rows."""
+    db_wrapper = DBWrapper(db_session)
+    alice, bob, carol, dave = (gen_unique_user(db_wrapper) for _ in range(4))
+    roster = [
+        "team_name,user_id,role,ranked\n",
+        f"Red,{alice.id},,true\n",
+        f"Red,{bob.id},captain,\n",
+        f"Blue,{carol.id},,\n",
+        f"Blue,{carol.id},,\n",
+        "Blue,not-a-number,,\n",
+        f"Green,{dave.id},leader,\n",
+        "Green,99999999,,\n",
+    ]
+
+    result = import_roster(event.id, iter(roster), "csv")
+
+    assert result["success"]
+    assert (result["rows_processed"], result["teams_created"], result["members_added"]) == (7, 2, 3)
+    assert [error["line"] for error in result["errors"]] == [5, 6, 7, 8]
+    assert "user_id" in result["errors"][1]["errors"]
+    assert "role" in result["errors"][2]["errors"]
+
+    red = Team.query.filter_by(event_id=event.id, name="Red").one()
+    assert red.ranked and red.member_count == 2
+    captain = TeamMember.query.filter_by(team_id=red.id, role=TeamRole.CAPTAIN).one()
+    assert captain.user_id == bob.id
+    assert TeamMember.query.filter_by(user_id=carol.id, role=TeamRole.CAPTAIN).count() == 1
+
+    db_session.expire_all()
+    assert (event.team_count, event.member_count) == (2, 3)
+
+
+@pytest.mark.db
+def test_import_roster_ndjson_adds_to_existing_team_within_capacity(db_session, event):
+    """Test that NDJSON rows join existing teams as members until the team is full."""
+    db_wrapper = DBWrapper(db_session)
+    existing = create_team("Existing", event.id, gen_unique_user(db_wrapper).id)
+    event.max_team_size = 2
+    db_session.commit()
+    first, second = gen_unique_user(db_wrapper), gen_unique_user(db_wrapper)
+    roster = [
+        f'{{"team_name": "Existing", "user_id": {first.id}}}\n',
+        f'{{"team_name": "Existing", "user_id": {second.id}}}\n',
+        "[1, 2]\n",
+        "{broken\n",
+    ]
+
+    result = import_roster(event.id, (line.encode() for line in roster), "ndjson")
+
+    assert result["members_added"] == 1
+    assert result["teams_created"] == 0
+    assert [error["errors"]["row"] for error in result["errors"]] == [
+        "Team 'Existing' is full (2 members)",
+        "Row must be a JSON object",
+        "Row is not valid JSON",
+    ]
+    db_session.expire_all()
+    assert Team.query.get(existing["team"].id).member_count == 2
+
+
+@pytest.mark.db
+def test_import_roster_matches_team_names_case_insensitively(db_session, event):
+    """Test that names differing only in case join one team, existing or new, keeping its stored spelling."""
+    db_wrapper = DBWrapper(db_session)
+    existing = create_team("alpha", event.id, gen_unique_user(db_wrapper).id)
+    users = [gen_unique_user(db_wrapper) for _ in range(4)]
+    roster = [
+        f'{{"team_name": "Alpha", "user_id": {users[0].id}}}\n',
+        f'{{"team_name": "ALPHA ", "user_id": {users[1].id}}}\n',
+        f'{{"team_name": "Bravo", "user_id": {users[2].id}}}\n',
+        f'{{"team_name": "bravo", "user_id": {users[3].id}}}\n',
+    ]
+
+    result = import_roster(event.id, (line.encode() for line in roster), "ndjson")
+
+    assert result["errors"] == []
+    assert result["teams_created"] == 1
+    assert result["members_added"] == 4
+    db_session.expire_all()
+    assert sorted(team.name for team in Team.query.filter_by(event_id=event.id)) == ["Bravo", "alpha"]
+    assert Team.query.get(existing["team"].id).member_count == 3
+
+
+def _schedule_without_running(monkeypatch, kind, event_id=None):
+    scheduler = importlib.import_module("plugin.admin.controllers.schedule_admin_job")
+    monkeypatch.setattr(scheduler, "_submit_job", lambda job_id: None)
+    return scheduler.schedule_admin_job(kind, None, event_id=event_id)
+
+
+@pytest.mark.db
+def test_queued_admin_job_survives_stale_timeout_and_runs_only_with_its_lock(app, db_session, event, monkeypatch):
+    """Test that a queued job's lock survives the heartbeat timeout and a job whose lock is gone never starts."""
+    queued = _schedule_without_running(monkeypatch, "reset_event", event_id=event.id)["job"]
+    AdminJob.query.filter_by(id=queued["id"]).update({"updated_at": datetime.utcnow() - timedelta(days=1)})
+    db_session.commit()
+
+    # Still waiting for a pool thread within the queue timeout, so the event stays locked
+    conflict = _schedule_without_running(monkeypatch, "cleanup_orphaned_data")
+    assert conflict["success"] is False
+    assert conflict["active_job_id"] == queued["id"]
+
+    AdminJob.query.get(queued["id"]).finish(JobStatus.FAILED, error="cancelled")
+    handlers = []
+    monkeypatch.setattr(_job_runner, "_job_handlers", lambda: handlers.append("called") or {})
+    _job_runner._run_job(app, queued["id"])
+
+    job = AdminJob.query.get(queued["id"])
+    assert handlers == []
+    assert job.status == JobStatus.FAILED
+    assert job.started_at is None
+
+
+@pytest.mark.db
+def test_orphaned_queued_admin_job_is_reclaimed_after_queue_timeout(app, db_session, event, monkeypatch):
+    """Test that a queued job lost with its worker releases the plugin-wide lock after the queue timeout."""
+    orphaned = _schedule_without_running(monkeypatch, "cleanup_orphaned_data")["job"]
+    AdminJob.query.filter_by(id=orphaned["id"]).update({"created_at": datetime.utcnow() - timedelta(days=1)})
+    db_session.commit()
+
+    result = _schedule_without_running(monkeypatch, "reset_event", event_id=event.id)
+
+    assert result["success"] is True
+    job = AdminJob.query.get(orphaned["id"])
+    assert job.status == JobStatus.FAILED
+    assert job.lock_key is None
+    assert "queue timeout" in job.error
+
+    # Had the pool still held it, the reclaimed job would now be skipped
+    handlers = []
+    monkeypatch.setattr(_job_runner, "_job_handlers", lambda: handlers.append("called") or {})
+    _job_runner._run_job(app, orphaned["id"])
+    assert handlers == []
+
+
+@pytest.mark.db
+def test_running_admin_job_without_heartbeat_is_reclaimed(db_session, event, monkeypatch):
+    """Test that a running job whose heartbeat stopped has its lock released for the next job."""
+    stuck = _schedule_without_running(monkeypatch, "reset_event", event_id=event.id)["job"]
+    assert _job_runner._claim_job(stuck["id"]) is True
+    assert _job_runner._claim_job(stuck["id"]) is False
+    AdminJob.query.filter_by(id=stuck["id"]).update({"updated_at": datetime.utcnow() - timedelta(days=1)})
+    db_session.commit()
+
+    result = _schedule_without_running(monkeypatch, "reset_event", event_id=event.id)
+
+    assert result["success"] is True
+    assert AdminJob.query.get(stuck["id"]).status == JobStatus.FAILED
+    assert AdminJob.query.filter_by(kind="scheduling").count() == 0
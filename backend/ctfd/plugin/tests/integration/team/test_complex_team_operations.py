@@ -3,8 +3,12 @@
 Complex team operation workflows and edge cases.
 """
 
+import os
+import threading
 import time
 import pytest
+from CTFd.models import db as _db
+from CTFd.models import Users
 from tests.helpers import gen_user as gen_user_original
 from plugin.team.controllers.create_team import create_team
 from plugin.team.controllers.join_team import join_team
@@ -12,6 +16,9 @@ from plugin.team.controllers.leave_team import leave_team
 from plugin.team.controllers.remove_member import remove_member
 from plugin.team.controllers.transfer_captaincy import transfer_captaincy
 from plugin.team.controllers.disband_team import disband_team
+from plugin.admin.controllers.reset_event_data import reset_event_data
+from plugin.event.models.Event import Event
+from plugin.user.models.User import User as NgUser
 from plugin.team.models.Team import Team
 from plugin.team.models.TeamMember import TeamMember
 from plugin.team.models.enums import TeamRole
@@ -89,6 +96,80 @@ def test_concurrent_team_creation_race_conditions(db_session, event):
     assert team_count == 5
 
 
+@pytest.mark.skipif(
+    not os.getenv("TESTING_DATABASE_URL", "").startswith(("mysql", "mariadb")),
+    reason="Needs TESTING_DATABASE_URL on MySQL/MariaDB: the default sqlite:// database shares one connection",
+)
+def test_concurrent_joins_never_exceed_max_team_size(app):
+    """Stress test: a surge of simultaneous joins on one invite code never overfills the team.
+
+    Runs outside the db_session fixture so every worker thread gets its own session
+    and connection, then cleans up the committed rows itself. The in-memory SQLite test
+    database is served from a single pooled connection that all threads would share,
+    interleaving their transactions, so the test only runs against MySQL/MariaDB.
+    """
+    max_team_size = 4
+    joiner_count = 24
+    fixture_session = _db.session
+    event_id = None
+    user_ids = []
+
+    try:
+        _db.session = _db.create_scoped_session()
+        with app.app_context():
+            event = Event(name="Join Surge", max_team_size=max_team_size)
+            _db.session.add(event)
+            _db.session.commit()
+            event_id = event.id
+
+            users = [
+                gen_user_original(_db, name=f"surge_{i}", email=f"surge_{i}_{time.time_ns()}@example.com")
+                for i in range(joiner_count + 1)
+            ]
+            user_ids = [user.id for user in users]
+            team_result = create_team("Surge Team", event_id, user_ids[0])
+            team_id = team_result["team"].id
+            invite_code = team_result["invite_code"]
+            _db.session.remove()
+
+        barrier = threading.Barrier(joiner_count)
+        outcomes = []
+
+        def join(user_id):
+            with app.app_context():
+                try:
+                    barrier.wait()
+                    outcomes.append(join_team(user_id, invite_code))
+                finally:
+                    _db.session.remove()
+
+        threads = [threading.Thread(target=join, args=(user_id,)) for user_id in user_ids[1:]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with app.app_context():
+            members = TeamMember.query.filter_by(team_id=team_id).count()
+            assert members == max_team_size
+            assert Team.query.get(team_id).member_count == members
+            assert Event.query.get(event_id).member_count == members
+
+        assert len(outcomes) == joiner_count
+        assert sum(outcome["success"] for outcome in outcomes) == max_team_size - 1
+        assert all("full" in outcome["error"] for outcome in outcomes if not outcome["success"])
+    finally:
+        with app.app_context():
+            if event_id is not None:
+                reset_event_data(event_id)
+                Event.query.filter_by(id=event_id).delete()
+            NgUser.query.filter(NgUser.id.in_(user_ids)).delete(synchronize_session=False)
+            Users.query.filter(Users.id.in_(user_ids)).delete(synchronize_session=False)
+            _db.session.commit()
+            _db.session.remove()
+        _db.session = fixture_session
+
+
 @pytest.mark.db
 def test_team_member_limit_enforcement_edge_cases(db_session, event):
     """Test edge cases around team member limits."""
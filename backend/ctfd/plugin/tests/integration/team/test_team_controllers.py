@@ -5,6 +5,8 @@ Tests team controller business logic
 
 import time
 import pytest
+from sqlalchemy import event as sa_event
+from CTFd.models import db as _db
 from tests.helpers import gen_user as gen_user_original
 from plugin.team.controllers.create_team import create_team
 from plugin.team.controllers.join_team import join_team
@@ -15,7 +17,9 @@ from plugin.team.controllers.remove_member import remove_member
 from plugin.team.controllers.transfer_captaincy import transfer_captaincy
 from plugin.team.controllers.update_team import update_team
 from plugin.team.controllers.disband_team import disband_team
+from plugin.event.controllers.update_event import update_event
 from plugin.team.models.Team import Team
+from plugin.utils.cache import bump_event, cached_read, get_cache_stats
 from plugin.team.models.TeamMember import TeamMember
 from plugin.team.models.enums import TeamRole
 
@@ -162,6 +166,35 @@ def test_disband_team_by_captain(db_session, event):
     assert team is None
 
 
+@pytest.mark.db
+def test_disband_team_deletes_members_without_loading_them(db_session, event):
+    """Test that disbanding runs bulk deletes, never selecting member rows, and keeps counters right."""
+    db_wrapper = DBWrapper(db_session)
+    creator = gen_unique_user(db_wrapper)
+    team_result = create_team("Bulk Team", event.id, creator.id)
+    for _ in range(3):
+        join_team(gen_unique_user(db_wrapper).id, team_result["invite_code"])
+    team_id = team_result["team"].id
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        assert disband_team(team_id, creator.id, is_admin=False)["success"]
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", record)
+
+    member_selects = [s for s in statements if s.lstrip().startswith("SELECT") and "FROM ng_team_members" in s]
+    # Only the single-row captain check reads memberships
+    assert len(member_selects) == 1 and "ng_team_members.user_id = ?" in member_selects[0]
+    assert TeamMember.query.filter_by(team_id=team_id).count() == 0
+    db_session.expire_all()
+    assert (event.team_count, event.member_count) == (0, 0)
+
+
 @pytest.mark.db
 def test_list_teams_in_event(db_session, event):
     """Test listing teams in an event."""
@@ -178,6 +211,254 @@ def test_list_teams_in_event(db_session, event):
     assert len(teams_result["teams"]) == 2
 
 
+@pytest.mark.db
+def test_list_teams_in_event_uses_single_aggregate_query(db_session, event):
+    """Test that listing teams runs a fixed number of statements however many teams exist."""
+    db_wrapper = DBWrapper(db_session)
+    for i in range(5):
+        result = create_team(f"Team {i}", event.id, gen_unique_user(db_wrapper).id)
+        join_team(gen_unique_user(db_wrapper).id, result["invite_code"])
+    db_session.expire_all()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        teams_result = list_teams_in_event(event.id)
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert [t["member_count"] for t in teams_result["teams"]] == [2] * 5
+    # One event lookup plus one aggregated team query
+    assert len(statements) == 2
+
+
+@pytest.mark.db
+def test_member_counters_follow_membership_changes(db_session, event):
+    """Test that stored team/event counters track create, join, leave, remove and disband."""
+    db_wrapper = DBWrapper(db_session)
+    captain = gen_unique_user(db_wrapper)
+    joiner = gen_unique_user(db_wrapper)
+    removed = gen_unique_user(db_wrapper)
+
+    team_result = create_team("Counted Team", event.id, captain.id)
+    team_id = team_result["team"].id
+    join_team(joiner.id, team_result["invite_code"])
+    join_team(removed.id, team_result["invite_code"])
+    other = create_team("Other Team", event.id, gen_unique_user(db_wrapper).id)
+
+    db_session.expire_all()
+    assert Team.query.get(team_id).member_count == 3
+    assert (event.team_count, event.member_count) == (2, 4)
+
+    leave_team(joiner.id, event.id)
+    remove_member(team_id, removed.id, captain.id, is_admin=False)
+    db_session.expire_all()
+    assert Team.query.get(team_id).member_count == 1
+    assert (event.team_count, event.member_count) == (2, 2)
+
+    disband_team(other["team"].id, other["team"].members[0].user_id)
+    db_session.expire_all()
+    assert (event.team_count, event.member_count) == (1, 1)
+
+
+@pytest.mark.db
+def test_join_team_invite_code_index(db_session, event):
+    """Test that unknown codes are rejected without a query and rotated codes resolve to the new code only."""
+    db_wrapper = DBWrapper(db_session)
+    captain = gen_unique_user(db_wrapper)
+    team_result = create_team("Indexed Team", event.id, captain.id)
+    team_id = team_result["team"].id
+    old_code = team_result["invite_code"]
+    member = gen_unique_user(db_wrapper)
+    assert join_team(member.id, old_code)["success"]
+    # Warm this worker's index
+    assert not join_team(member.id, "NOPE0000")["success"]
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        result = join_team(gen_unique_user(db_wrapper).id, "NOPE1234")
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert result == {"success": False, "error": "Invalid invite code"}
+    assert not [statement for statement in statements if "ng_teams" in statement]
+
+    remove_member(team_id, member.id, captain.id, is_admin=False)
+    new_code = Team.query.get(team_id).invite_code
+    assert join_team(gen_unique_user(db_wrapper).id, old_code) == {"success": False, "error": "Invalid invite code"}
+    assert join_team(gen_unique_user(db_wrapper).id, new_code)["success"]
+
+
+@pytest.mark.db
+def test_join_after_create_replays_new_code_without_rescanning_teams(db_session, event):
+    """Test that a join right after another team is created picks the new code up from the change log."""
+    db_wrapper = DBWrapper(db_session)
+    create_team("Warm Team", event.id, gen_unique_user(db_wrapper).id)
+    # Warm this worker's index
+    assert not join_team(gen_unique_user(db_wrapper).id, "NOPE0000")["success"]
+
+    team_result = create_team("Fresh Team", event.id, gen_unique_user(db_wrapper).id)
+    joiner = gen_unique_user(db_wrapper)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()))
+
+    sa_event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        result = join_team(joiner.id, team_result["invite_code"])
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert result["success"]
+    assert [statement for statement in statements if statement.endswith("FROM ng_teams")] == []
+    assert len([statement for statement in statements if "FROM ng_teams" in statement]) == 2
+
+
+@pytest.mark.db
+def test_get_team_info_returns_member_names_in_one_query(db_session, event):
+    """Test that team detail includes member names and the captain from a single statement."""
+    db_wrapper = DBWrapper(db_session)
+    captain = gen_unique_user(db_wrapper)
+    team_result = create_team("Named Team", event.id, captain.id)
+    members = [gen_unique_user(db_wrapper) for _ in range(3)]
+    for member in members:
+        join_team(member.id, team_result["invite_code"])
+    team_id = team_result["team"].id
+    expected_names = {user.id: user.name for user in [captain, *members]}
+    db_session.expire_all()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa_event.listen(_db.engine, "before_cursor_execute", record)
+    try:
+        result = get_team_info(team_id)
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert result["team"]["captain_id"] == captain.id
+    assert result["team"]["captain_name"] == expected_names[captain.id]
+    assert {m["user_id"]: m["name"] for m in result["team_members"]} == expected_names
+
+
+@pytest.mark.db
+def test_get_team_info_is_cached_until_team_or_event_changes(db_session, event):
+    """Test that team detail reads hit the cache and are invalidated by team and event writes."""
+    db_wrapper = DBWrapper(db_session)
+    team_result = create_team("Cached Team", event.id, gen_unique_user(db_wrapper).id)
+    team_id = team_result["team"].id
+
+    # The first load only records the event dependency; the second is cached under its pre-load version
+    assert get_team_info(team_id)["team"]["member_count"] == 1
+    assert get_team_info(team_id)["team"]["member_count"] == 1
+    assert get_team_info(team_id)["team"]["member_count"] == 1
+    assert get_cache_stats(["team"])["team"] == {"hits": 1, "misses": 2, "hit_rate": 0.3333}
+
+    join_team(gen_unique_user(db_wrapper).id, team_result["invite_code"])
+    assert get_team_info(team_id)["team"]["member_count"] == 2
+
+    update_event(event.id, max_team_size=2)
+    assert get_team_info(team_id)["team"]["is_full"]
+
+    update_team(team_id, team_result["team"].members[0].user_id, new_name="Renamed Team")
+    assert get_team_info(team_id)["team"]["name"] == "Renamed Team"
+    assert get_cache_stats(["team"])["team"]["misses"] == 5
+
+
+@pytest.mark.db
+def test_cached_read_does_not_serve_a_load_raced_by_a_dependency_bump(db_session, event):
+    """Test that an event bump landing while a team is loaded leaves the loaded result uncached."""
+    loads = []
+
+    def loader():
+        loads.append(len(loads))
+        if len(loads) == 2:
+            # The event is updated after this load read it but before the result is stored
+            bump_event(event.id)
+        return {"success": True, "load": len(loads), "event_id": event.id}
+
+    def read():
+        return cached_read("raced", 1, loader, dependencies=lambda result: [("event", result["event_id"])])
+
+    assert read()["load"] == 1
+    assert read()["load"] == 2
+    assert read()["load"] == 3
+    assert read()["load"] == 3
+
+
+@pytest.mark.db
+def test_list_teams_in_event_keyset_pagination(db_session, event):
+    """Test paging through teams with a cursor returns every team exactly once."""
+    db_wrapper = DBWrapper(db_session)
+    for name in ["Delta", "Alpha", "Echo", "Charlie", "Bravo"]:
+        create_team(name, event.id, gen_unique_user(db_wrapper).id)
+
+    first_page = list_teams_in_event(event.id, limit=2)
+    assert first_page["success"]
+    assert [t["name"] for t in first_page["teams"]] == ["Alpha", "Bravo"]
+    assert first_page["has_more"]
+    assert first_page["total_teams"] == 5
+
+    second_page = list_teams_in_event(event.id, limit=2, cursor=first_page["next_cursor"])
+    assert [t["name"] for t in second_page["teams"]] == ["Charlie", "Delta"]
+
+    last_page = list_teams_in_event(event.id, limit=2, cursor=second_page["next_cursor"])
+    assert [t["name"] for t in last_page["teams"]] == ["Echo"]
+    assert not last_page["has_more"]
+    assert last_page["next_cursor"] is None
+
+
+@pytest.mark.db
+def test_list_teams_in_event_filters_and_sort(db_session, event):
+    """Test has_space, ranked and descending sort filters."""
+    db_wrapper = DBWrapper(db_session)
+    event.max_team_size = 2
+    full_team = create_team("Full", event.id, gen_unique_user(db_wrapper).id, ranked=True)
+    join_team(gen_unique_user(db_wrapper).id, full_team["invite_code"])
+    create_team("Open", event.id, gen_unique_user(db_wrapper).id)
+
+    with_space = list_teams_in_event(event.id, has_space=True)
+    assert [t["name"] for t in with_space["teams"]] == ["Open"]
+
+    ranked = list_teams_in_event(event.id, ranked=True)
+    assert [t["name"] for t in ranked["teams"]] == ["Full"]
+    assert ranked["teams"][0]["is_full"]
+
+    descending = list_teams_in_event(event.id, sort="-name")
+    assert [t["name"] for t in descending["teams"]] == ["Open", "Full"]
+
+
+@pytest.mark.db
+def test_list_teams_in_event_rejects_cursor_from_other_sort(db_session, event):
+    """Test that a cursor cannot be replayed against a different sort order."""
+    db_wrapper = DBWrapper(db_session)
+    create_team("Team 1", event.id, gen_unique_user(db_wrapper).id)
+    create_team("Team 2", event.id, gen_unique_user(db_wrapper).id)
+
+    page = list_teams_in_event(event.id, limit=1, sort="id")
+
+    result = list_teams_in_event(event.id, limit=1, cursor=page["next_cursor"], sort="name")
+    assert not result["success"]
+    assert "cursor" in result["error"].lower()
+
+    result = list_teams_in_event(event.id, cursor="not-a-cursor")
+    assert not result["success"]
+
+
 @pytest.mark.db
 def test_get_team_info(db_session, event):
     """Test getting team information."""
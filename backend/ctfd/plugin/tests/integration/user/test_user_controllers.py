@@ -8,6 +8,7 @@ import pytest
 from tests.helpers import gen_user as gen_user_original
 from plugin.team.controllers.create_team import create_team
 from plugin.user.controllers.get_user_teams import get_user_teams
+from plugin.user.controllers._resolve_user_names import _resolve_user_names
 
 
 class DBWrapper:
@@ -34,3 +35,23 @@ def test_get_user_teams_across_events(db_session, event, event2):
 
     assert teams_result["success"]
     assert len(teams_result["teams"]) == 2
+
+
+@pytest.mark.db
+def test_resolve_user_names_batches_and_memoizes(app, db_session):
+    """Test that names resolve in one query, unknown users get a label and repeats hit the memo."""
+    db_wrapper = DBWrapper(db_session)
+    users = [gen_unique_user(db_wrapper) for _ in range(3)]
+    user_ids = [user.id for user in users]
+
+    with app.test_request_context():
+        names = _resolve_user_names([*user_ids, 999999])
+        assert names == {**{user.id: user.name for user in users}, 999999: "User ID 999999"}
+
+        original_name = users[0].name
+        users[0].name = "renamed"
+        db_session.commit()
+        # Memoized for the rest of the request
+        assert _resolve_user_names(user_ids[:1]) == {user_ids[0]: original_name}
+
+    assert _resolve_user_names(user_ids[:1]) == {user_ids[0]: "renamed"}
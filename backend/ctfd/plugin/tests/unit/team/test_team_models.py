@@ -3,12 +3,12 @@
 Unit tests for team model logic without database dependencies.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from plugin.team.models.Team import Team
 from plugin.team.models.TeamMember import TeamMember
 from plugin.team.models.enums import TeamRole
-from plugin.team.controllers._generate_invite_code import _generate_invite_code
+from plugin.team.controllers._generate_invite_code import _generate_invite_code, _generate_invite_codes
 
 
 class TestTeamInviteCodeGeneration:
@@ -17,9 +17,7 @@ class TestTeamInviteCodeGeneration:
     def test_generate_invite_code_excludes_confusing_characters(self):
         """Test that invite codes exclude visually confusing characters."""
 
-        with patch("plugin.team.controllers._generate_invite_code.Team") as mock_team:
-            mock_team.query.filter_by.return_value.first.return_value = None
-
+        with patch("plugin.team.controllers._generate_invite_code._existing_invite_codes", return_value=set()):
             codes = []
             for _ in range(100):
                 code = _generate_invite_code()
@@ -32,60 +30,67 @@ class TestTeamInviteCodeGeneration:
 
     def test_invite_code_length_is_correct(self):
         """Test that invite codes have the expected length."""
-        with patch("plugin.team.controllers._generate_invite_code.Team") as mock_team:
-            mock_team.query.filter_by.return_value.first.return_value = None
-
+        with patch("plugin.team.controllers._generate_invite_code._existing_invite_codes", return_value=set()):
             code = _generate_invite_code()
             assert len(code) == 8, f"Expected code length 8, got {len(code)}"
 
-    def test_invite_code_fallback_to_uuid_on_collision(self):
-        """Test that code generation falls back to UUID after max retries."""
-        with patch("plugin.team.controllers._generate_invite_code.Team") as mock_team:
-            collision_count = 0
+    def test_invite_code_grows_length_on_repeated_collisions(self):
+        """Test that code generation lengthens codes after every batch at a length collides."""
+        with patch("plugin.team.controllers._generate_invite_code._existing_invite_codes") as mock_existing:
+            lookups = 0
 
-            def mock_collision(*args, **kwargs):
-                nonlocal collision_count
-                collision_count += 1
-                # Return collision for first 12 attempts (10 + 2), then success
-                if collision_count <= 12:
-                    return Mock()
-                return None
+            def mock_collision(candidates):
+                nonlocal lookups
+                lookups += 1
+                # Every candidate collides for the first 12 batches (10 + 2), then none do
+                return set(candidates) if lookups <= 12 else set()
 
-            mock_team.query.filter_by.return_value.first.side_effect = mock_collision
+            mock_existing.side_effect = mock_collision
 
             code = _generate_invite_code()
 
-            assert len(code) >= 8, f"Expected code length >= 8, got {len(code)}"
-            assert collision_count > 10, "Should have tried multiple times before success"
+            assert len(code) == 9, f"Expected code length 9, got {len(code)}"
+            assert lookups == 13, "Should have checked one batch per round"
 
-    def test_invite_code_generation_uniqueness(self):
-        """Test that multiple invite codes are unique."""
+    def test_invite_code_batch_uses_single_lookup_query(self):
+        """Test that a batch of candidates is checked with one IN query."""
         with patch("plugin.team.controllers._generate_invite_code.Team") as mock_team:
-            mock_team.query.filter_by.return_value.first.return_value = None
+            lookup = mock_team.query.with_entities.return_value.filter.return_value
+            lookup.all.return_value = []
 
-            codes = set()
-            for _ in range(50):
-                code = _generate_invite_code()
-                codes.add(code)
+            codes = _generate_invite_codes(50)
+
+            assert len(set(codes)) == 50, "Generated codes are not unique"
+            assert lookup.all.call_count == 1, "Expected a single uniqueness query for the batch"
 
-            assert len(codes) == 50, "Generated codes are not unique"
+    def test_invite_codes_skip_taken_candidates(self):
+        """Test that candidates already used by a team are never returned."""
+        with patch("plugin.team.controllers._generate_invite_code._existing_invite_codes") as mock_existing:
+            taken = set()
+
+            def mark_half_taken(candidates):
+                newly_taken = set(sorted(candidates)[::2])
+                taken.update(newly_taken)
+                return newly_taken
+
+            mock_existing.side_effect = mark_half_taken
+
+            codes = _generate_invite_codes(20)
+
+            assert len(set(codes)) == 20
+            assert not taken.intersection(codes)
 
 
 class TestTeamModelLogic:
     """Test Team model properties and methods."""
 
-    def test_team_member_count_hybrid_property(self):
-        """Test the member_count hybrid property calculation."""
-        team = Team()
-        team.id = 1
-        team.name = "Test Team"
-
-        assert hasattr(team, "member_count"), "Team should have member_count property"
+    def test_team_member_count_column(self):
+        """Test that member_count is a stored column defaulting to zero."""
+        column = Team.__table__.c.member_count
 
-        try:
-            team.member_count
-        except Exception:
-            pass
+        assert not column.nullable, "member_count should not be nullable"
+        assert column.default.arg == 0, "member_count should default to 0"
+        assert column.server_default.arg == "0", "existing rows should backfill to 0"
 
     def test_team_repr_method(self):
         """Test the string representation of Team model."""
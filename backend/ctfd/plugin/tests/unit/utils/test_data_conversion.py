@@ -7,7 +7,10 @@ from datetime import datetime
 from enum import Enum
 from unittest.mock import Mock
 
-from plugin.utils.data_conversion import rows_to_dicts, row_to_dict
+import pytest
+from sqlalchemy import create_engine, text
+
+from plugin.utils.data_conversion import iter_rows_as_dicts, rows_to_dicts, row_to_dict
 
 
 class StatusEnum(Enum):
@@ -173,3 +176,37 @@ class TestDataConversionEdgeCases:
         assert "value_a" in result[0]
         assert result[1]["type"] == "B"
         assert "value_b" in result[1]
+
+
+class TestSqlAlchemyRows:
+    """Test the zip fast path on real SQLAlchemy rows."""
+
+    @pytest.fixture
+    def connection(self):
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            yield connection
+
+    def test_rows_to_dicts_applies_field_mapping(self, connection):
+        """Test that real rows convert with mapped keys computed once for the result."""
+        rows = connection.execute(text("SELECT 1 AS id, 'Alpha' AS name UNION ALL SELECT 2, 'Beta'")).all()
+
+        result = rows_to_dicts(rows, {"name": "team_name"})
+
+        assert result == [{"id": 1, "team_name": "Alpha"}, {"id": 2, "team_name": "Beta"}]
+
+    def test_rows_from_different_results(self, connection):
+        """Test that a new result shape gets its own keys."""
+        first = connection.execute(text("SELECT 1 AS id")).all()
+        second = connection.execute(text("SELECT 'x' AS code, 3 AS total")).all()
+
+        assert rows_to_dicts(first + second) == [{"id": 1}, {"code": "x", "total": 3}]
+
+    def test_iter_rows_as_dicts_is_lazy(self, connection):
+        """Test that the generator variant converts rows as they are consumed."""
+        result = connection.execute(text("SELECT 1 AS id UNION ALL SELECT 2 UNION ALL SELECT 3"))
+
+        converted = iter_rows_as_dicts(result)
+
+        assert next(converted) == {"id": 1}
+        assert list(converted) == [{"id": 2}, {"id": 3}]
@@ -0,0 +1,156 @@
+"""
+/backend/ctfd/plugin/tests/unit/utils/test_logger.py
+Unit tests for the JSON formatter and the queue-backed log handler.
+"""
+
+import io
+import json
+import logging
+import threading
+import time
+
+from plugin.utils.logger import JSONFormatter, LazyContextFilter, QueueBatchHandler, RepeatSuppressionFilter
+
+
+class RecordingStream(io.StringIO):
+    """Stream that counts writes and can hold the writer thread on its first write."""
+
+    def __init__(self, gate=None):
+        super().__init__()
+        self.writes = 0
+        self.gate = gate
+
+    def write(self, text):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.writes += 1
+        return super().write(text)
+
+
+def _logger_with(handler, name):
+    handler.setFormatter(JSONFormatter())
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def _entries(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestJSONFormatter:
+    """Test log entry encoding."""
+
+    def test_format_includes_context_and_record_time(self):
+        """Test that entries carry their context and the time the record was created."""
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "Hello %s", ("world",), None)
+        record.created = 0.25
+        record.context = {"team_id": 3}
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["message"] == "Hello world"
+        assert entry["timestamp"] == "1970-01-01T00:00:00.250000Z"
+        assert entry["context"] == {"team_id": 3}
+
+
+class TestQueueBatchHandler:
+    """Test the background writer."""
+
+    def test_records_are_written_in_batches(self):
+        """Test that queued records are written with fewer stream writes than records."""
+        gate = threading.Event()
+        stream = RecordingStream(gate)
+        logger = _logger_with(QueueBatchHandler(stream, queue_size=100, batch_size=50), "test_logger_batches")
+
+        for i in range(20):
+            logger.info("Record %d", i, extra={"context": {"index": i}})
+        gate.set()
+        logger.handlers[0].flush()
+
+        entries = _entries(stream)
+        assert [entry["context"]["index"] for entry in entries] == list(range(20))
+        assert stream.writes < 20
+
+    def test_full_queue_drops_and_reports_count(self):
+        """Test that records beyond the queue bound are dropped, counted and reported."""
+        gate = threading.Event()
+        stream = RecordingStream(gate)
+        handler = QueueBatchHandler(stream, queue_size=5, batch_size=5)
+        logger = _logger_with(handler, "test_logger_overflow")
+
+        # The first record is taken by the writer, which then blocks on the gate
+        logger.info("first")
+        while handler._queue.qsize():
+            pass
+        for i in range(10):
+            logger.info("burst %d", i)
+        assert handler.dropped == 5
+
+        gate.set()
+        handler.flush()
+        logger.info("after")
+        handler.flush()
+
+        entries = _entries(stream)
+        notices = [entry for entry in entries if entry["message"] == "Log queue full - records dropped"]
+        assert notices[0]["context"] == {"dropped": 5, "dropped_total": 5}
+        assert len([entry for entry in entries if entry["message"].startswith("burst")]) == 5
+
+    def test_exception_is_rendered_in_calling_thread(self):
+        """Test that tracebacks survive the hand-off to the writer thread."""
+        stream = RecordingStream()
+        logger = _logger_with(QueueBatchHandler(stream), "test_logger_exception")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.error("Failed", exc_info=True)
+        logger.handlers[0].flush()
+
+        assert "ValueError: boom" in _entries(stream)[0]["exception"]
+
+
+class TestLogFilters:
+    """Test lazy context resolution and repeat suppression."""
+
+    def _logger(self, name, *filters):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        logger = _logger_with(handler, name)
+        logger.filters = list(filters)
+        return logger, stream
+
+    def test_lazy_context_only_built_when_emitted(self):
+        """Test that a callable context is resolved for emitted records and skipped for filtered levels."""
+        logger, stream = self._logger("test_logger_lazy", LazyContextFilter())
+        calls = []
+
+        logger.debug("Hidden", extra={"context": lambda: calls.append("debug") or {}})
+        logger.warning("Shown", extra={"context": lambda: calls.append("warning") or {"team_id": 1}})
+
+        assert calls == ["warning"]
+        assert _entries(stream)[0]["context"] == {"team_id": 1}
+
+    def test_repeated_warnings_are_suppressed_and_summarized(self):
+        """Test that repeats beyond the limit are dropped without building context and summarized later."""
+        suppressor = RepeatSuppressionFilter(window=0.05, limit=3)
+        logger, stream = self._logger("test_logger_repeats", suppressor, LazyContextFilter())
+        built = []
+
+        for i in range(10):
+            logger.warning(
+                "Team join failed - invalid invite code", extra={"context": lambda i=i: built.append(i) or {}}
+            )
+        logger.info("Unrelated info is never limited")
+        time.sleep(0.06)
+        logger.info("Next record triggers the summary")
+
+        messages = [entry["message"] for entry in _entries(stream)]
+        assert messages.count("Team join failed - invalid invite code") == 3
+        assert built == [0, 1, 2]
+        summary = next(entry for entry in _entries(stream) if entry["message"] == "7 similar messages suppressed")
+        assert summary["level"] == "WARNING"
+        assert summary["context"]["message"] == "Team join failed - invalid invite code"
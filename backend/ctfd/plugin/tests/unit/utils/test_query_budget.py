@@ -0,0 +1,63 @@
+"""
+/backend/ctfd/plugin/tests/unit/utils/test_query_budget.py
+Unit tests for SQL query budget declarations and the recorder enforcing them in tests.
+"""
+
+from sqlalchemy import create_engine, text
+
+from plugin.utils.query_budget import QueryRecorder, query_budget, query_budgets
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    return engine
+
+
+def test_query_budget_registers_declared_budget():
+    """Check that decorated functions are registered under their qualified name."""
+
+    @query_budget(2)
+    def load_items():
+        return []
+
+    assert load_items.query_budget == 2
+    assert query_budgets()[f"{__name__}.test_query_budget_registers_declared_budget.<locals>.load_items"] == 2
+
+
+def test_recorder_reports_repeated_statements_over_budget():
+    """Check that a call over budget is reported with its statements grouped and counted."""
+    engine = _engine()
+
+    @query_budget(2, name="load_items_one_by_one")
+    def load_items_one_by_one(ids):
+        with engine.connect() as connection:
+            return [connection.execute(text("SELECT id FROM items WHERE id = :id"), {"id": i}).all() for i in ids]
+
+    with QueryRecorder() as recorder:
+        load_items_one_by_one([1, 2, 3])
+
+    assert len(recorder.violations) == 1
+    assert recorder.violations[0]["label"] == "load_items_one_by_one"
+    report = recorder.report()
+    assert "load_items_one_by_one ran 3 SQL statements (budget 2)" in report
+    assert "3x SELECT id FROM items WHERE id = ?" in report
+
+
+def test_recorder_accepts_calls_within_budget_and_ignores_unbudgeted_statements():
+    """Check that only budgeted calls are measured and that calls within budget pass."""
+    engine = _engine()
+
+    @query_budget(1)
+    def load_items():
+        with engine.connect() as connection:
+            return connection.execute(text("SELECT id FROM items WHERE id IN (1, 2, 3)")).all()
+
+    with QueryRecorder() as recorder:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        load_items()
+
+    assert recorder.violations == []
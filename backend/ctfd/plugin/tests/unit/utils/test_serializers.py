@@ -0,0 +1,63 @@
+"""
+/backend/ctfd/plugin/tests/unit/utils/test_serializers.py
+Unit tests for the serializer registry.
+"""
+
+from datetime import datetime
+
+from plugin.team.models.Team import Team
+from plugin.team.models.TeamMember import TeamMember
+from plugin.team.models.enums import TeamRole
+from plugin.utils import serializers
+from plugin.utils.serializers import register_serializer, serialize
+
+
+class TestModelPlans:
+    """Test per-model column plans."""
+
+    def test_model_plan_emits_loaded_columns_with_typed_converters(self):
+        """Test that a model serializes its loaded columns, converting datetimes and enums."""
+        member = TeamMember(user_id=7, team_id=3, role=TeamRole.CAPTAIN, joined_at=datetime(2024, 1, 1, 12, 0, 0))
+
+        result = serialize(member)
+
+        assert result == {"user_id": 7, "team_id": 3, "role": "captain", "joined_at": "2024-01-01T12:00:00"}
+
+    def test_model_plan_skips_relationships(self):
+        """Test that populated relationships are not walked."""
+        team = Team(name="Plan Team", invite_code="PLAN0001", event_id=1)
+        member = TeamMember(user_id=1, team_id=2, role=TeamRole.MEMBER)
+        member.team = team
+
+        assert "team" not in serialize(member)
+
+    def test_model_plan_is_built_once_per_class(self, monkeypatch):
+        """Test that the converter for a model class is built on first use and then reused."""
+        monkeypatch.setattr(serializers, "_converters", {})
+        build_converter = serializers._build_converter
+        builds = []
+        monkeypatch.setattr(serializers, "_build_converter", lambda cls: builds.append(cls) or build_converter(cls))
+
+        assert serialize([Team(name="One"), Team(name="Two")]) == [{"name": "One"}, {"name": "Two"}]
+        assert builds == [list, Team]
+
+
+class TestRegistry:
+    """Test registry overrides and container fast paths."""
+
+    def test_registered_serializer_overrides_plan(self, monkeypatch):
+        """Test that an explicitly registered converter is used for its class."""
+        monkeypatch.setattr(serializers, "_converters", dict(serializers._converters))
+        register_serializer(Team, lambda team: {"label": team.name.upper()})
+
+        assert serialize([Team(name="custom")]) == [{"label": "CUSTOM"}]
+
+    def test_nested_containers(self):
+        """Test that dicts and lists are converted recursively and primitives pass through."""
+        payload = {"id": 1, "tags": ("a", "b"), "items": [{"at": datetime(2024, 5, 1), "role": TeamRole.MEMBER}]}
+
+        assert serialize(payload) == {
+            "id": 1,
+            "tags": ["a", "b"],
+            "items": [{"at": "2024-05-01T00:00:00", "role": "member"}],
+        }
@@ -3,7 +3,7 @@
 Tests for validation utility functions
 """
 
-from plugin.utils import validate_team_creation, validate_event_creation, BaseValidator
+from plugin.utils import validate_team_creation, validate_event_creation, validate_team_list_params, BaseValidator
 
 
 class TestTeamValidation:
@@ -30,6 +30,31 @@ class TestTeamValidation:
             assert not is_valid, f"Invalid data should fail but passed: {data}"
 
 
+class TestTeamListValidation:
+    """Test team listing query parameter validation."""
+
+    def test_valid_team_list_params(self):
+        """Test that query string filters pass validation."""
+        args = {"event_id": "1", "limit": "25", "sort": "-name", "has_space": "true", "ranked": "false"}
+
+        is_valid, errors = validate_team_list_params(args)
+        assert is_valid, f"Valid params should pass but got errors: {errors}"
+
+    def test_invalid_team_list_params(self):
+        """Test that malformed filters fail validation."""
+        invalid_cases = [
+            {"limit": "10"},  # Missing event_id
+            {"event_id": "1", "limit": "0"},
+            {"event_id": "1", "limit": "100000"},
+            {"event_id": "1", "sort": "members"},
+            {"event_id": "1", "has_space": "yes"},
+        ]
+
+        for args in invalid_cases:
+            is_valid, errors = validate_team_list_params(args)
+            assert not is_valid, f"Invalid params should fail but passed: {args}"
+
+
 class TestEventValidation:
     """Test event creation validation."""
 
@@ -0,0 +1,48 @@
+"""
+/backend/ctfd/plugin/user/controllers/_resolve_user_names.py
+Resolves CTFd display names for many users at once.
+"""
+
+from typing import Iterable
+
+from CTFd.models import Users, db
+from flask import g, has_request_context
+
+
+# Internal use only (_ prefix); fallback label for users missing from CTFd.
+def _fallback_user_name(user_id: int) -> str:
+    return f"User ID {user_id}"
+
+
+# Internal use only (_ prefix); maps user IDs to CTFd display names.
+def _resolve_user_names(user_ids: Iterable[int]) -> dict[int, str]:
+    """Load display names for a set of users with one IN query.
+
+    Inside a request, names are memoized on flask.g so resolving the same users again
+    costs no further queries; outside one (CLI, background work) nothing is kept.
+    Users that do not exist in CTFd map to a "User ID <id>" label.
+
+    Args:
+        user_ids (Iterable[int]): The CTFd user IDs to resolve.
+
+    Returns:
+        dict[int, str]: Display name for every requested user ID.
+    """
+    memo = _request_memo()
+    wanted = {user_id for user_id in user_ids if user_id is not None}
+
+    missing = wanted - memo.keys()
+    if missing:
+        found = dict(db.session.query(Users.id, Users.name).filter(Users.id.in_(missing)).all())
+        for user_id in missing:
+            memo[user_id] = found.get(user_id) or _fallback_user_name(user_id)
+
+    return {user_id: memo[user_id] for user_id in wanted}
+
+
+def _request_memo() -> dict[int, str]:
+    if not has_request_context():
+        return {}
+    if "plugin_user_names" not in g:
+        g.plugin_user_names = {}
+    return g.plugin_user_names
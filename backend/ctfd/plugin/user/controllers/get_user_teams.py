@@ -5,10 +5,10 @@ Retrieves all team memberships for a user across all events.
 
 from typing import Any
 
-from sqlalchemy import func
 from CTFd.models import db
 
 from ...utils.logger import get_logger
+from ...utils.query_budget import query_budget
 from ...event.models.Event import Event
 from ...team.models.Team import Team
 from ...team.models.TeamMember import TeamMember
@@ -17,6 +17,7 @@ from ..models.User import User
 logger = get_logger(__name__)
 
 
+@query_budget(2)
 def get_user_teams(user_id: int) -> dict[str, Any]:
     """Gets all team members for a user across all events.
 
@@ -35,7 +36,7 @@ def get_user_teams(user_id: int) -> dict[str, Any]:
         )
         return {"success": False, "error": "User not found in extended system"}
 
-    # Single query with member count
+    # Single query, member count read from the stored team counter
     team_members_query = (
         db.session.query(
             TeamMember.joined_at,
@@ -44,7 +45,7 @@ def get_user_teams(user_id: int) -> dict[str, Any]:
             Event.max_team_size.label("max_team_size"),
             Event.id.label("event_id"),
             Event.name.label("event_name"),
-            func.count(TeamMember.id).over(partition_by=Team.id).label("team_member_count"),
+            Team.member_count.label("team_member_count"),
         )
         .join(Team, TeamMember.team_id == Team.id)
         .join(Event, TeamMember.event_id == Event.id)
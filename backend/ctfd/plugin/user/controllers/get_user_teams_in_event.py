@@ -9,6 +9,7 @@ from ...utils.logger import get_logger
 from ...event.models.Event import Event
 from ...team.models.Team import Team
 from ...team.models.TeamMember import TeamMember
+from ...team.controllers._query_teams_with_member_counts import _query_teams_with_member_counts
 
 logger = get_logger(__name__)
 
@@ -50,7 +51,8 @@ def get_user_teams_in_event(user_id: int, event_id: int) -> dict[str, Any]:
         )
         return {"success": True, "in_team": False, "team": None}
 
-    team = Team.query.get(team_member.team_id)
+    team_query, _ = _query_teams_with_member_counts(Team.id, Team.name, Team.ranked)
+    team = team_query.filter(Team.id == team_member.team_id).first()
     logger.info(
         "User team membership found in event",
         extra={
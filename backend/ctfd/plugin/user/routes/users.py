@@ -14,7 +14,8 @@ from ..controllers import (
     get_user_stats,
 )
 from ...utils.api_responses import controller_response
-from ...utils.decorators import authed_user_required, handle_integrity_error
+from ...utils.cache import ALL_EVENTS_SCOPE, version_etag
+from ...utils.decorators import authed_user_required, conditional_get, handle_integrity_error
 from ...utils.logger import get_logger
 from ...utils import get_current_user_id
 
@@ -27,6 +28,7 @@ class UserTeams(Resource):
     @authed_only
     @authed_user_required
     @handle_integrity_error
+    @conditional_get(lambda: version_etag([ALL_EVENTS_SCOPE], g.user.id))
     @users_namespace.doc(
         description="Get current user's teams across all events",
         responses={
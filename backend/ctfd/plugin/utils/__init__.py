@@ -17,9 +17,19 @@ from .domain_validators import (
     validate_event_update,
     validate_admin_reset,
     validate_admin_event_reset,
+    validate_counter_reconcile,
+    validate_admin_job_params,
+    validate_headless_team_cleanup,
+    validate_orphan_cleanup,
+    validate_data_counts_params,
+    validate_admin_stats_params,
     validate_event_id_param,
+    validate_team_list_params,
+    validate_roster_import_params,
+    validate_roster_row,
 )
-from .data_conversion import rows_to_dicts, row_to_dict
+from .data_conversion import rows_to_dicts, row_to_dict, iter_rows_as_dicts
+from .query_budget import query_budget
 
 
 def get_current_user_id():
@@ -49,7 +59,18 @@ __all__ = [
     "validate_event_update",
     "validate_admin_reset",
     "validate_admin_event_reset",
+    "validate_counter_reconcile",
+    "validate_admin_job_params",
+    "validate_headless_team_cleanup",
+    "validate_orphan_cleanup",
+    "validate_data_counts_params",
+    "validate_admin_stats_params",
     "validate_event_id_param",
+    "validate_team_list_params",
+    "validate_roster_import_params",
+    "validate_roster_row",
     "rows_to_dicts",
     "row_to_dict",
+    "iter_rows_as_dicts",
+    "query_budget",
 ]
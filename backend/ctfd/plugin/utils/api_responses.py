@@ -5,35 +5,12 @@ Utilities for creating and formatting standardized JSON API responses.
 
 from typing import Any
 
+from .serializers import serialize
+
 
 def serialize_model_for_api(obj):
-    """Serialize model objects for JSON API responses."""
-    if obj is None:
-        return None
-
-    # Handle datetime serialization
-    if hasattr(obj, "isoformat"):
-        return obj.isoformat()
-
-    # Handle model objects
-    if hasattr(obj, "__dict__"):
-        result = {}
-        for key, value in obj.__dict__.items():
-            if key.startswith("_"):
-                continue
-            if hasattr(value, "isoformat"):
-                result[key] = value.isoformat()
-            elif hasattr(value, "value"):  # enum
-                result[key] = value.value
-            elif hasattr(value, "__dict__"):  # nested model
-                result[key] = serialize_model_for_api(value)
-            elif isinstance(value, list):  # list of models
-                result[key] = [serialize_model_for_api(item) for item in value]
-            else:
-                result[key] = value
-        return result
-
-    return obj
+    """Serialize model objects for JSON API responses (see utils.serializers.serialize)."""
+    return serialize(obj)
 
 
 def success_response(data: dict[str, Any], status_code: int = 200) -> tuple[dict[str, Any], int]:
@@ -0,0 +1,184 @@
+"""
+/backend/ctfd/plugin/utils/cache.py
+Versioned read-through caching on top of CTFd's shared cache (Redis in production).
+"""
+
+import hashlib
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from CTFd.cache import cache
+
+from .. import config
+
+# Every cached entry also depends on this version, bumped by whole-plugin resets
+PLUGIN_SCOPE = ("plugin", 0)
+# Bumped by any team or event change; backs cross-event reads such as the event list
+ALL_EVENTS_SCOPE = ("events", 0)
+
+
+def _version_key(kind: str, entity_id: Any) -> str:
+    return f"{config.CACHE_KEY_PREFIX}:version:{kind}:{entity_id}"
+
+
+def _dependencies_key(kind: str, entity_id: Any) -> str:
+    return f"{config.CACHE_KEY_PREFIX}:deps:{kind}:{entity_id}"
+
+
+def _stats_key(kind: str, outcome: str) -> str:
+    return f"{config.CACHE_KEY_PREFIX}:stats:{kind}:{outcome}"
+
+
+def get_versions(scopes: Iterable[tuple[str, Any]]) -> list[int]:
+    """Read the current version of each (kind, entity_id) scope in one cache round trip.
+
+    A scope that has never been bumped (or was evicted) is seeded with a nanosecond
+    timestamp rather than 0, so a restarted counter can never match an older entry.
+
+    Args:
+        scopes (Iterable[tuple[str, Any]]): (kind, entity_id) pairs.
+
+    Returns:
+        list[int]: Versions in the same order as scopes.
+    """
+    scopes = list(scopes)
+    keys = [_version_key(kind, entity_id) for kind, entity_id in scopes]
+    versions = list(cache.get_many(*keys))
+    for index, version in enumerate(versions):
+        if version is None:
+            cache.add(keys[index], time.time_ns(), timeout=0)
+            versions[index] = cache.get(keys[index])
+    return versions
+
+
+def get_version(kind: str, entity_id: Any) -> int:
+    """Read the current version of a single scope."""
+    return get_versions([(kind, entity_id)])[0]
+
+
+def bump_version(kind: str, entity_id: Any = 0) -> int:
+    """Invalidate every cached read that depends on (kind, entity_id).
+
+    Call after the mutating transaction has committed, never before, or a reader
+    could cache pre-commit data under the new version.
+
+    Returns:
+        int: The new version, unique to this bump while the counter is not evicted.
+    """
+    key = _version_key(kind, entity_id)
+    if cache.get(key) is None:
+        # Re-seed instead of letting inc() restart the counter at 1
+        version = time.time_ns()
+        cache.set(key, version, timeout=0)
+        return version
+    # The Flask-Caching wrapper does not proxy inc(); the backend's is atomic on Redis
+    return cache.cache.inc(key)
+
+
+def bump_team(team_id: int, event_id: int) -> None:
+    """Invalidate a team's reads and every listing that shows it. Call after commit."""
+    for scope in (("team", team_id), ("event_teams", event_id), ALL_EVENTS_SCOPE):
+        bump_version(*scope)
+
+
+def bump_event(event_id: int) -> None:
+    """Invalidate an event's settings and everything derived from them. Call after commit."""
+    for scope in (("event", event_id), ("event_teams", event_id), ALL_EVENTS_SCOPE):
+        bump_version(*scope)
+
+
+def version_etag(scopes: Iterable[tuple[str, Any]], *extra: Any) -> str:
+    """Build a strong ETag from the current versions of scopes (plus any extra discriminators).
+
+    Args:
+        scopes (Iterable[tuple[str, Any]]): (kind, entity_id) pairs the response depends on.
+        *extra: Additional values that distinguish responses, e.g. the requesting user.
+
+    Returns:
+        str: Quoted ETag value.
+    """
+    versions = get_versions([PLUGIN_SCOPE, *scopes])
+    digest = hashlib.sha1(repr((versions, extra)).encode("utf-8")).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def read_etag(kind: str, entity_id: Any) -> Optional[str]:
+    """ETag for a cached_read entity, or None until its dependencies are known (first load)."""
+    dependencies = cache.get(_dependencies_key(kind, entity_id))
+    if dependencies is None:
+        return None
+    return version_etag([(kind, entity_id), *dependencies])
+
+
+def cached_read(
+    kind: str,
+    entity_id: Any,
+    loader: Callable[[], dict[str, Any]],
+    dependencies: Optional[Callable[[dict[str, Any]], list[tuple[str, Any]]]] = None,
+    timeout: int = config.READ_CACHE_TIMEOUT,
+) -> dict[str, Any]:
+    """Return loader() for an entity, served from cache while its versions are unchanged.
+
+    Entries are keyed by the entity's own version. Versions of any further scopes
+    returned by dependencies(result) are stored alongside the entry and re-checked
+    on every hit. Those versions are read before loading, from the scopes the previous
+    load reported, so a bump that lands during the load invalidates the entry; until
+    a load has reported its scopes, the result is returned without being cached. Only
+    successful results are cached.
+
+    Args:
+        kind (str): Entity kind, e.g. "team".
+        entity_id (Any): Entity ID.
+        loader (Callable): Builds the result from the database on a miss.
+        dependencies (Callable, optional): Maps a result to the extra (kind, id) scopes it depends on.
+        timeout (int, optional): Entry TTL in seconds.
+
+    Returns:
+        dict: The cached or freshly loaded result.
+    """
+    version, plugin_version = get_versions([(kind, entity_id), PLUGIN_SCOPE])
+    key = f"{config.CACHE_KEY_PREFIX}:read:{kind}:{entity_id}:{version}:{plugin_version}"
+
+    entry = cache.get(key)
+    if entry is not None:
+        scopes, stored_versions, result = entry
+        if not scopes or get_versions(scopes) == stored_versions:
+            _record(kind, "hits")
+            return result
+
+    _record(kind, "misses")
+    known_scopes = [tuple(scope) for scope in cache.get(_dependencies_key(kind, entity_id)) or []]
+    known_versions = dict(zip(known_scopes, get_versions(known_scopes))) if known_scopes else {}
+    result = loader()
+    if result.get("success"):
+        scopes = [tuple(scope) for scope in dependencies(result)] if dependencies else []
+        cache.set(_dependencies_key(kind, entity_id), scopes, timeout=timeout)
+        # A scope without a pre-load version could have been bumped mid-load; the next miss caches it
+        if all(scope in known_versions for scope in scopes):
+            cache.set(key, (scopes, [known_versions[scope] for scope in scopes], result), timeout=timeout)
+    return result
+
+
+def _record(kind: str, outcome: str) -> None:
+    cache.cache.inc(_stats_key(kind, outcome))
+
+
+def get_cache_stats(kinds: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Hit/miss counters per cached kind, shared across workers through the cache backend.
+
+    Args:
+        kinds (Iterable[str]): Entity kinds to report.
+
+    Returns:
+        dict: {kind: {"hits", "misses", "hit_rate"}}
+    """
+    stats = {}
+    for kind in kinds:
+        hits, misses = (cache.get(_stats_key(kind, outcome)) or 0 for outcome in ("hits", "misses"))
+        total = hits + misses
+        stats[kind] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else None,
+        }
+    return stats
@@ -3,15 +3,16 @@
 Functions to convert SQLAlchemy query results into Python dicts.
 """
 
-from typing import Any, List, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
 from sqlalchemy.engine import Row
 
 
-def rows_to_dicts(rows: List[Row], field_mapping: Dict[str, str] = None) -> List[Dict[str, Any]]:
+def rows_to_dicts(rows: Iterable[Row], field_mapping: Dict[str, str] = None) -> List[Dict[str, Any]]:
     """Convert SQLAlchemy Row objects to dictionaries with optional field mapping.
 
     Args:
-        rows (List[Row]): SQLAlchemy query result rows
+        rows (Iterable[Row]): SQLAlchemy query result rows
         field_mapping (Dict[str, str], optional): Maps row attribute names to dict keys.
             Format: {"row_attr": "dict_key"}. If None, uses row attribute names as keys.
 
@@ -22,20 +23,41 @@ def rows_to_dicts(rows: List[Row], field_mapping: Dict[str, str] = None) -> List
     if not rows:
         return []
 
-    result = []
+    return list(iter_rows_as_dicts(rows, field_mapping))
 
-    for row in rows:
-        row_dict = {}
 
-        for key in row._fields:
-            value = getattr(row, key)
+def iter_rows_as_dicts(rows: Iterable[Row], field_mapping: Dict[str, str] = None) -> Iterator[Dict[str, Any]]:
+    """Lazily convert rows to dictionaries, e.g. while streaming a large result with yield_per.
 
-            dict_key = field_mapping.get(key, key) if field_mapping else key
-            row_dict[dict_key] = value
+    The output keys are computed once per result shape (the rows of one query share
+    it) and each dict is built by zipping them with the row's values.
 
-        result.append(row_dict)
+    Args:
+        rows (Iterable[Row]): SQLAlchemy query result rows, or a Result being iterated
+        field_mapping (Dict[str, str], optional): Maps row attribute names to dict keys
 
-    return result
+    Yields:
+        Dict[str, Any]: One dictionary per row
+    """
+    shape = None
+    fields: Tuple[str, ...] = ()
+    keys: Tuple[str, ...] = ()
+
+    for row in rows:
+        if isinstance(row, Row):
+            # Rows of one result share their metadata object, so the plan is built once
+            row_shape = getattr(row, "_parent", None)
+            if row_shape is None or row_shape is not shape:
+                shape = row_shape
+                keys = _output_keys(tuple(row._fields), field_mapping)
+            yield dict(zip(keys, row))
+        else:
+            # Other row-like objects: anything exposing _fields and matching attributes
+            row_fields = tuple(row._fields)
+            if row_fields != fields:
+                fields = row_fields
+                keys = _output_keys(fields, field_mapping)
+            yield dict(zip(keys, [getattr(row, field) for field in fields]))
 
 
 def row_to_dict(row: Row, field_mapping: Dict[str, str] = None) -> Dict[str, Any]:
@@ -52,3 +74,9 @@ def row_to_dict(row: Row, field_mapping: Dict[str, str] = None) -> Dict[str, Any
         return {}
 
     return rows_to_dicts([row], field_mapping)[0]
+
+
+def _output_keys(fields: Tuple[str, ...], field_mapping: Optional[Dict[str, str]]) -> Tuple[str, ...]:
+    if not field_mapping:
+        return fields
+    return tuple(field_mapping.get(field, field) for field in fields)
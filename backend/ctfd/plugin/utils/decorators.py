@@ -4,7 +4,7 @@ Ultilities for Flask decorators.
 """
 
 from functools import wraps
-from flask import request, g
+from flask import current_app, request, g
 from CTFd.utils.user import get_current_user
 from sqlalchemy.exc import IntegrityError
 from .api_responses import error_response
@@ -66,3 +66,51 @@ def handle_integrity_error(f):
             )
 
     return decorated_function
+
+
+def conditional_get(etag_for):
+    """Decorator that answers 304 Not Modified when If-None-Match matches a version-based ETag.
+
+    etag_for receives the view's keyword arguments and returns the resource's current
+    ETag without touching the database, or None if it is not known yet. The ETag is read
+    before the view runs and only that one tags the 200 response: a tag read afterwards
+    could include a bump the body predates. Without a known ETag the response is untagged.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            etag = etag_for(**kwargs)
+            if etag and _etag_matches(etag, request.headers.get("If-None-Match")):
+                return current_app.response_class(status=304, headers=_etag_headers(etag))
+
+            result = f(*args, **kwargs)
+            body, status, headers = result if isinstance(result, tuple) and len(result) == 3 else (*_split(result), {})
+            if status == 200 and etag:
+                headers = {**headers, **_etag_headers(etag)}
+            return body, status, headers
+
+        return decorated_function
+
+    return decorator
+
+
+def _split(result):
+    if isinstance(result, tuple):
+        return result[0], result[1]
+    return result, 200
+
+
+def _etag_headers(etag):
+    # no-cache: clients may store the response but must revalidate it every time
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _etag_matches(etag, if_none_match):
+    """Weak comparison, since nginx weakens ETags (W/ prefix) on gzipped responses."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
@@ -27,6 +27,47 @@ def validate_team_creation(data: dict[str, Any]) -> tuple[bool, dict[str, str]]:
     return validator.is_valid()
 
 
+def validate_team_list_params(args: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate team listing filters and pagination query parameters."""
+    validator = BaseValidator()
+    validator.validate_positive_integer(args, "event_id", required=True, friendly_name="Event ID")
+    validator.validate_integer_range(
+        args,
+        "limit",
+        1,
+        config.TEAM_LIST_MAX_PAGE_SIZE,
+        friendly_name="Limit",
+    )
+    validator.validate_string(args, "cursor", friendly_name="Cursor")
+    validator.validate_choice(args, "sort", config.TEAM_LIST_SORT_OPTIONS, friendly_name="Sort")
+    validator.validate_choice(args, "has_space", ("true", "false"), friendly_name="Has space filter")
+    validator.validate_choice(args, "ranked", ("true", "false"), friendly_name="Ranked filter")
+    return validator.is_valid()
+
+
+def validate_roster_import_params(args: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate roster import query parameters."""
+    validator = BaseValidator()
+    validator.validate_choice(args, "format", config.ROSTER_IMPORT_FORMATS, required=True, friendly_name="Format")
+    return validator.is_valid()
+
+
+def validate_roster_row(row: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate a single roster import row."""
+    validator = BaseValidator()
+    validator.validate_string(
+        row,
+        "team_name",
+        config.TEAM_NAME_MAX_LENGTH,
+        required=True,
+        friendly_name="Team name",
+    )
+    validator.validate_positive_integer(row, "user_id", required=True, friendly_name="User ID")
+    validator.validate_choice(row, "role", config.ROSTER_IMPORT_ROLES, friendly_name="Role")
+    validator.validate_boolean(row, "ranked", friendly_name="Ranked status")
+    return validator.is_valid()
+
+
 def validate_team_update(data: dict[str, Any]) -> tuple[bool, dict[str, str]]:
     """Validate team updates."""
     validator = BaseValidator()
@@ -196,6 +237,50 @@ def validate_admin_event_reset(data: dict[str, Any]) -> tuple[bool, dict[str, st
     return validator.is_valid()
 
 
+def validate_headless_team_cleanup(data: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate headless team cleanup requests."""
+    validator = BaseValidator()
+    validator.validate_boolean(data, "dry_run", friendly_name="Dry run")
+    return validator.is_valid()
+
+
+def validate_orphan_cleanup(data: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate orphaned data cleanup requests."""
+    validator = BaseValidator()
+    validator.validate_boolean(data, "dry_run", friendly_name="Dry run")
+    validator.validate_positive_integer(data, "min_account_age_days", friendly_name="Minimum account age (days)")
+    return validator.is_valid()
+
+
+def validate_admin_stats_params(args: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate admin stats pagination query parameters."""
+    validator = BaseValidator()
+    validator.validate_integer_range(args, "limit", 1, config.EMPTY_TEAMS_MAX_PAGE_SIZE, friendly_name="Limit")
+    validator.validate_string(args, "cursor", friendly_name="Cursor")
+    return validator.is_valid()
+
+
+def validate_data_counts_params(args: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate data counts query parameters."""
+    validator = BaseValidator()
+    validator.validate_choice(args, "approximate", ("true", "false"), friendly_name="Approximate")
+    return validator.is_valid()
+
+
+def validate_admin_job_params(args: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate the query parameters shared by schedulable admin operations."""
+    validator = BaseValidator()
+    validator.validate_choice(args, "background", ("true", "false"), friendly_name="Background")
+    return validator.is_valid()
+
+
+def validate_counter_reconcile(data: dict[str, Any]) -> tuple[bool, dict[str, str]]:
+    """Validate counter reconciliation requests."""
+    validator = BaseValidator()
+    validator.validate_boolean(data, "dry_run", friendly_name="Dry run")
+    return validator.is_valid()
+
+
 def validate_event_id_param(event_id: Union[str, int]) -> tuple[bool, dict[str, str]]:
     """Validate event_id from query parameters."""
     validator = BaseValidator()
@@ -3,16 +3,39 @@
 Configures a JSON logger for machine readable app logging.
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from typing import Any, Optional, TextIO
+
+from .. import config
+
+try:
+    import orjson
+except ImportError:  # Optional faster encoder; json is used without it
+    orjson = None
+
+
+def _encode(log_entry: dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the json module handles them
+    return json.dumps(log_entry, default=str)
 
 
 class JSONFormatter(logging.Formatter):
     def format(self, record):
+        # Taken from the record, not the clock, so entries written later by the queue writer keep their time
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": f"{timestamp}.{int(record.created % 1 * 1_000_000):06d}Z",
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.filename,
@@ -22,16 +45,238 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "context") and record.context:
             log_entry["context"] = record.context
 
-        return json.dumps(log_entry)
+        if record.exc_info:
+            log_entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exception"] = record.exc_text
+
+        return _encode(log_entry)
+
+
+class QueueBatchHandler(logging.Handler):
+    """Hands records to a background thread that formats and writes them in batches.
+
+    emit() only appends to a bounded queue, so a request never waits on json encoding
+    or on the stdout pipe. The writer drains up to batch_size records per write. When
+    the queue is full the record is dropped and counted; the writer reports the count
+    in its next batch. The writer thread is started per process on first use, so it
+    survives gunicorn forking.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        queue_size: int = config.LOG_QUEUE_SIZE,
+        batch_size: int = config.LOG_BATCH_SIZE,
+    ):
+        super().__init__()
+        self.stream = stream
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._pid = None
+        self._queue = None
+        self._writer = None
+        self._start_lock = threading.Lock()
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            self._start()
+
+        # Resolve %-args now; they may be mutated after the call returns
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        # Tracebacks hold frames of the calling thread; render them here
+        if record.exc_info:
+            record.exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+            record.exc_info = None
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every queued record has been written (or timeout seconds pass)."""
+        if self._queue is None or self._pid != os.getpid():
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.queue_size)
+            self._writer = threading.Thread(
+                target=self._write_loop, args=(self._queue,), name="ng-log-writer", daemon=True
+            )
+            self._writer.start()
+            self._pid = os.getpid()
+
+    def _write_loop(self, records: queue.Queue) -> None:
+        while True:
+            batch = [records.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            for record in batch:
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    # Broad catch as in logging.Handler: a bad record must not kill the writer
+                    self.handleError(record)
+            lines.extend(self._dropped_notice())
+
+            try:
+                stream = self.stream or sys.stdout
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except Exception:
+                # Broad catch: the stream may be closed at shutdown
+                pass
+            finally:
+                for _ in batch:
+                    records.task_done()
+
+    def _dropped_notice(self) -> list[str]:
+        with self.lock:
+            newly_dropped = self.dropped - self._reported_dropped
+            self._reported_dropped = self.dropped
+        if not newly_dropped:
+            return []
+        notice = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0, "Log queue full - records dropped", None, None
+        )
+        notice.context = {"dropped": newly_dropped, "dropped_total": self._reported_dropped}
+        return [self.format(notice)]
+
+
+class LazyContextFilter(logging.Filter):
+    """Resolves a callable record context, so extra={"context": lambda: {...}} is only built when emitted.
+
+    Runs as a logger filter: after the level check and repeat suppression, and in the
+    calling thread, where model attributes the callable reads are safe to load.
+    """
+
+    def filter(self, record):
+        context = getattr(record, "context", None)
+        if callable(context):
+            try:
+                record.context = context()
+            except Exception as e:
+                # Broad catch: a failing context must not lose the log record itself
+                record.context = {"context_error": repr(e)}
+        return True
+
+
+class RepeatSuppressionFilter(logging.Filter):
+    """Rate limits repeated records per (logger, level, message template).
+
+    At most limit records per template are emitted in each window of window seconds;
+    the rest are dropped and counted. Once a window has ended, a
+    "N similar messages suppressed" summary is emitted for it, checked on every record
+    passing through any plugin logger (so quiet templates are summarized too).
+    """
+
+    def __init__(
+        self,
+        window: float = config.LOG_REPEAT_WINDOW,
+        limit: int = config.LOG_REPEAT_LIMIT,
+        min_level: int = logging.WARNING,
+    ):
+        super().__init__()
+        self.window = window
+        self.limit = limit
+        self.min_level = min_level
+        # key -> [window start, emitted, suppressed]
+        self._windows: dict[tuple[str, int, str], list] = {}
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if getattr(record, "suppression_summary", False):
+            return True
+
+        now = time.monotonic()
+        summaries = self._expire_windows(now)
+
+        allowed = True
+        if record.levelno >= self.min_level:
+            key = (record.name, record.levelno, str(record.msg))
+            with self._lock:
+                window = self._windows.setdefault(key, [now, 0, 0])
+                if window[1] < self.limit:
+                    window[1] += 1
+                else:
+                    window[2] += 1
+                    allowed = False
+
+        for key, suppressed in summaries:
+            self._emit_summary(key, suppressed)
+        return allowed
+
+    def _expire_windows(self, now: float) -> list[tuple[tuple[str, int, str], int]]:
+        summaries = []
+        with self._lock:
+            # Ended windows are looked for at most once per second (or per window, if shorter)
+            if now < self._next_sweep:
+                return summaries
+            self._next_sweep = now + min(1.0, self.window)
+            for key, (started, _, suppressed) in list(self._windows.items()):
+                if now - started >= self.window:
+                    del self._windows[key]
+                    if suppressed:
+                        summaries.append((key, suppressed))
+        return summaries
+
+    def _emit_summary(self, key: tuple[str, int, str], suppressed: int) -> None:
+        name, level, message = key
+        summary = logging.LogRecord(name, level, __file__, 0, f"{suppressed} similar messages suppressed", None, None)
+        summary.suppression_summary = True
+        summary.context = {"message": message, "suppressed": suppressed, "window_seconds": self.window}
+        logging.getLogger(name).handle(summary)
+
+
+_lazy_context_filter = LazyContextFilter()
+_repeat_suppression_filter = RepeatSuppressionFilter()
+
+_queue_handler = None
+_queue_handler_lock = threading.Lock()
+
+
+def _get_queue_handler() -> QueueBatchHandler:
+    # One handler (and writer thread) shared by every plugin logger
+    global _queue_handler
+    with _queue_handler_lock:
+        if _queue_handler is None:
+            _queue_handler = QueueBatchHandler()
+            _queue_handler.setFormatter(JSONFormatter())
+            atexit.register(_queue_handler.flush)
+        return _queue_handler
 
 
-def get_logger(name: str = __name__) -> logging.Logger:
+def get_logger(name: str = __name__, asynchronous: bool = config.LOG_ASYNC) -> logging.Logger:
     logger = logging.getLogger(name)
 
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(JSONFormatter())
+        if asynchronous:
+            handler = _get_queue_handler()
+        else:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(JSONFormatter())
         logger.addHandler(handler)
+        # Suppression first, so dropped repeats never build their context
+        logger.addFilter(_repeat_suppression_filter)
+        logger.addFilter(_lazy_context_filter)
         logger.setLevel(logging.INFO)
         logger.propagate = False
 
@@ -0,0 +1,39 @@
+"""
+/backend/ctfd/plugin/utils/pagination.py
+Helpers for opaque keyset pagination cursors.
+"""
+
+import base64
+import json
+from typing import Any, Optional
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        values (list): JSON serializable values identifying the last row.
+
+    Returns:
+        str: URL safe cursor string.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[list[Any]]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): Cursor string from a previous page.
+
+    Returns:
+        list or None: The decoded values, or None if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError):
+        return None
+
+    return values if isinstance(values, list) else None
@@ -0,0 +1,126 @@
+"""
+/backend/ctfd/plugin/utils/query_budget.py
+Declares how many SQL statements a route or controller may run, and records calls that exceed it.
+"""
+
+import functools
+import re
+import threading
+from collections import Counter
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Budget per decorated route or controller, keyed by "module.qualname"
+_budgets: dict[str, int] = {}
+
+_active = threading.local()
+
+
+def query_budget(max_statements: int, name: Optional[str] = None) -> Callable:
+    """Declare the maximum number of SQL statements one call of the decorated function may run.
+
+    Budgets are only checked while a QueryRecorder is active (the test suite installs one
+    around every test); otherwise the decorator adds one attribute lookup per call. A
+    budget covers everything the call runs, including nested budgeted calls.
+
+    Args:
+        max_statements (int): Statements allowed per call.
+        name (str, optional): Label used in reports. Defaults to "module.qualname".
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+        _budgets[label] = max_statements
+
+        @functools.wraps(func)
+        def decorated_function(*args, **kwargs):
+            recorder = getattr(_active, "recorder", None)
+            if recorder is None:
+                return func(*args, **kwargs)
+            with recorder.scope(label, max_statements):
+                return func(*args, **kwargs)
+
+        decorated_function.query_budget = max_statements
+        return decorated_function
+
+    return decorator
+
+
+def query_budgets() -> dict[str, int]:
+    """Every declared budget, keyed by the label of the route or controller."""
+    return dict(_budgets)
+
+
+class QueryRecorder:
+    """Counts the statements each budgeted call runs on this thread and collects budget violations.
+
+    Use as a context manager; only statements executed on the entering thread are attributed.
+    Recorders nest: the innermost one records, and the outer one resumes when it exits.
+    """
+
+    def __init__(self):
+        self.violations: list[dict[str, Any]] = []
+        self._scopes: list[tuple[str, int, list[str]]] = []
+        self._previous: Optional[QueryRecorder] = None
+
+    def __enter__(self) -> "QueryRecorder":
+        self._previous = getattr(_active, "recorder", None)
+        _active.recorder = self
+        if not event.contains(Engine, "before_cursor_execute", _record_statement):
+            event.listen(Engine, "before_cursor_execute", _record_statement)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active.recorder = self._previous
+
+    def scope(self, label: str, max_statements: int) -> "_BudgetScope":
+        return _BudgetScope(self, label, max_statements)
+
+    def record(self, statement: str) -> None:
+        for _, _, statements in self._scopes:
+            statements.append(statement)
+
+    def report(self) -> str:
+        """Human readable description of every violation, with repeated statements counted."""
+        lines = []
+        for violation in self.violations:
+            lines.append(
+                f"{violation['label']} ran {len(violation['statements'])} SQL statements "
+                f"(budget {violation['budget']}):"
+            )
+            repeats = Counter(_normalize(statement) for statement in violation["statements"])
+            for statement, count in repeats.most_common():
+                lines.append(f"  {count}x {statement}")
+        return "\n".join(lines)
+
+
+class _BudgetScope:
+    def __init__(self, recorder: QueryRecorder, label: str, max_statements: int):
+        self.recorder = recorder
+        self.entry = (label, max_statements, [])
+
+    def __enter__(self) -> None:
+        self.recorder._scopes.append(self.entry)
+
+    def __exit__(self, *exc_info) -> None:
+        self.recorder._scopes.pop()
+        label, max_statements, statements = self.entry
+        if len(statements) > max_statements:
+            self.recorder.violations.append({"label": label, "budget": max_statements, "statements": statements})
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    recorder = getattr(_active, "recorder", None)
+    if recorder is not None:
+        recorder.record(statement)
+
+
+def _normalize(statement: str) -> str:
+    # Collapse whitespace and IN lists so the same query with different arguments groups together
+    statement = " ".join(statement.split())
+    return re.sub(r"\((?:\?|%s|%\(\w+\)s)(?:, (?:\?|%s|%\(\w+\)s))*\)", "(...)", statement)
@@ -0,0 +1,165 @@
+"""
+/backend/ctfd/plugin/utils/serializers.py
+Serializer registry that converts models and plain values to JSON-ready data using per-type plans built once.
+"""
+
+import enum
+from datetime import date, datetime, time
+from typing import Any, Callable, Optional
+
+from flask import current_app, make_response
+from flask_restx.representations import output_json as restx_output_json
+from sqlalchemy import Date, DateTime, Enum, Time
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Mapper
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON backend; flask-restx's encoder is used without it
+    orjson = None
+
+Converter = Callable[[Any], Any]
+
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Exact type -> converter; filled on first sight of each type
+_converters: dict[type, Converter] = {}
+
+
+def register_serializer(cls: type, converter: Converter) -> None:
+    """Use converter for every instance of exactly cls, overriding the derived plan.
+
+    Args:
+        cls (type): The class to serialize.
+        converter (callable): Takes an instance and returns JSON-ready data.
+    """
+    _converters[cls] = converter
+
+
+def serialize(value: Any) -> Any:
+    """Convert a value to JSON-ready data.
+
+    The converter for each type is chosen once and cached: primitives pass through,
+    datetimes become ISO strings, enums their value, dicts and lists are converted
+    item by item, and mapped models use a plan of their column attributes (see
+    _model_converter). Other objects fall back to walking their __dict__.
+
+    Args:
+        value: Any value.
+
+    Returns:
+        The JSON-ready equivalent.
+    """
+    converter = _converters.get(type(value))
+    if converter is None:
+        converter = _build_converter(type(value))
+        if converter is None:
+            return _serialize_reflective(value)
+        _converters[type(value)] = converter
+    return converter(value)
+
+
+def output_json(data: Any, code: int, headers: Optional[dict] = None):
+    """flask-restx representation for application/json, encoded with orjson when installed.
+
+    Falls back to flask-restx's encoder without orjson, in debug mode (indented output)
+    and when RESTX_JSON settings are configured, since orjson does not take them.
+    """
+    if orjson is None or current_app.debug or current_app.config.get("RESTX_JSON"):
+        return restx_output_json(data, code, headers)
+
+    response = make_response(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS), code)
+    response.mimetype = "application/json"
+    response.headers.extend(headers or {})
+    return response
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _serialize_dict(value: dict) -> dict:
+    # Fast path: plain values are copied without a converter lookup
+    return {key: item if type(item) in _PRIMITIVE_TYPES else serialize(item) for key, item in value.items()}
+
+
+def _serialize_list(value: Any) -> list:
+    return [item if type(item) in _PRIMITIVE_TYPES else serialize(item) for item in value]
+
+
+def _build_converter(cls: type) -> Optional[Converter]:
+    """Pick the converter for a type, or None if it has to be serialized reflectively."""
+    # Enums first: str-based enums are also str
+    if issubclass(cls, enum.Enum):
+        return _enum_value
+    if cls in _PRIMITIVE_TYPES:
+        return _identity
+    if issubclass(cls, (datetime, date, time)):
+        return _isoformat
+    if issubclass(cls, dict):
+        return _serialize_dict
+    if issubclass(cls, (list, tuple)):
+        return _serialize_list
+
+    mapper = sa_inspect(cls, raiseerr=False)
+    if isinstance(mapper, Mapper):
+        return _model_converter(mapper)
+    return None
+
+
+def _model_converter(mapper: Mapper) -> Converter:
+    """Build the field plan for a mapped class: its columns, each with a converter for its type.
+
+    Values are read from the instance __dict__, so only loaded columns are emitted and
+    neither expired columns nor relationships are ever lazy loaded.
+    """
+    plan = []
+    for column_attr in mapper.column_attrs:
+        if column_attr.key.startswith("_"):
+            continue
+        column_type = column_attr.columns[0].type
+        if isinstance(column_type, (DateTime, Date, Time)):
+            plan.append((column_attr.key, _isoformat))
+        elif isinstance(column_type, Enum):
+            plan.append((column_attr.key, _enum_value))
+        else:
+            plan.append((column_attr.key, None))
+
+    def convert(obj: Any) -> dict[str, Any]:
+        loaded = obj.__dict__
+        return {key: (converter(loaded[key]) if converter else loaded[key]) for key, converter in plan if key in loaded}
+
+    return convert
+
+
+def _serialize_reflective(obj: Any) -> Any:
+    """Fallback for unregistered, unmapped objects: serialize their public attributes."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+
+    if hasattr(obj, "__dict__"):
+        result = {}
+        for key, value in obj.__dict__.items():
+            if key.startswith("_"):
+                continue
+            if hasattr(value, "isoformat"):
+                result[key] = value.isoformat()
+            elif hasattr(value, "value"):  # enum
+                result[key] = value.value
+            elif hasattr(value, "__dict__"):  # nested object
+                result[key] = serialize(value)
+            elif isinstance(value, list):
+                result[key] = [serialize(item) for item in value]
+            else:
+                result[key] = value
+        return result
+
+    return obj
@@ -23,6 +23,7 @@ class ValidationError:
 
     FIELD_TOO_LONG = "{field} cannot exceed {max_length} characters"
     FIELD_OUT_OF_RANGE = "{field} must be between {min_val} and {max_val}"
+    FIELD_INVALID_CHOICE = "{field} must be one of: {choices}"
 
     CONFIRMATION_INVALID = "You must send 'confirm': '{required_value}' to proceed with this operation"
 
@@ -139,6 +140,30 @@ class BaseValidator:
 
         return value
 
+    def validate_choice(
+        self,
+        data: dict,
+        field: str,
+        choices: tuple,
+        required: bool = False,
+        friendly_name: str = None,
+    ) -> Optional[str]:
+        """Validate that a field is one of a fixed set of values."""
+        name = friendly_name or field.replace("_", " ").title()
+        value = data.get(field)
+
+        if required and not self.require_field(data, field, name):
+            return None
+
+        if value is None:
+            return None  # Optional field
+
+        if value not in choices:
+            self.errors[field] = ValidationError.FIELD_INVALID_CHOICE.format(field=name, choices=", ".join(choices))
+            return None
+
+        return value
+
     def validate_datetime(
         self,
         data: dict,